@@ -0,0 +1,67 @@
+"""
+Micro-benchmark of the per-call overhead of reading last values through libcosimc.
+
+Compares configuring a fresh ctypes prototype on every call, as the wrappers used to do, with dispatching through the
+shared binding registry. Run from the repository root with ``python benchmarks/binding_overhead.py``.
+"""
+
+import timeit
+from ctypes import POINTER, c_double, c_int, c_size_t, c_uint32
+from pathlib import Path
+
+from libcosimpy._bindings import cosimc
+from libcosimpy._internal import libcosimc, wrap_function
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimObserver import CosimObserver
+from libcosimpy.CosimSlave import CosimLocalSlave
+
+CALLS = 100_000
+FMU_PATH = Path(__file__).parent.parent / "tests" / "data" / "fmi1" / "identity.fmu"
+
+
+def main():
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=str(FMU_PATH), instance_name="identity")
+    slave_index = execution.add_local_slave(local_slave=local_slave)
+    observer = CosimObserver.create_last_value()
+    execution.add_observer(observer=observer)
+    execution.step()
+
+    references = [0]
+    reference_array = (c_uint32 * len(references))(*references)
+    value_array = (c_double * len(references))()
+
+    def per_call_prototype():
+        get_real = wrap_function(
+            lib=libcosimc(),
+            funcname="cosim_observer_slave_get_real",
+            argtypes=[
+                POINTER(CosimObserver),
+                c_int,
+                c_uint32 * len(references),
+                c_size_t,
+                c_double * len(references),
+            ],
+            restype=c_int,
+        )
+        get_real(observer.ptr(), slave_index, reference_array, len(references), value_array)
+
+    def registry():
+        cosimc().cosim_observer_slave_get_real(
+            observer.ptr(), slave_index, reference_array, len(references), value_array
+        )
+
+    def public_api():
+        observer.last_real_values(slave_index=slave_index, variable_references=references)
+
+    for name, func in [
+        ("per-call prototype", per_call_prototype),
+        ("binding registry", registry),
+        ("last_real_values", public_api),
+    ]:
+        seconds = min(timeit.repeat(func, number=CALLS, repeat=5))
+        print(f"{name:>20}: {seconds / CALLS * 1e6:8.3f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ._sampling import SampleSource
+from .CosimEnums import CosimVariableType
+from .CosimExecution import CosimExecution
+from .CosimObserver import CosimObserver
+
+# Statistics of every window, followed by one "p<percentile>" statistic per requested percentile
+STATISTICS = ("count", "min", "max", "mean", "variance", "rms")
+
+
+@dataclass
+class WindowAggregates:
+    """
+    Statistics of variables over windows of simulated time. Each statistic has shape (number of windows, number of
+    variables), with NaN for variables without samples in a window. Variance is the population variance
+    """
+
+    variables: list[str]
+    window_starts: npt.NDArray[np.int64]
+    window_size: int
+    statistics: dict[str, npt.NDArray[np.float64]]
+
+    def __len__(self):
+        return len(self.window_starts)
+
+    def column(self, variable: str, statistic: str) -> npt.NDArray[np.float64]:
+        """
+        One statistic of one variable for all windows
+
+        :param str variable: Variable name as given to WindowAggregator
+        :param str statistic: Name of statistic, such as "max", "rms" or "p95"
+        :return: Array with one value per window
+        """
+        return self.statistics[statistic][:, self.variables.index(variable)]
+
+    def save(self, path: str):
+        """
+        Write the aggregates to a NumPy .npz file
+        """
+        np.savez(
+            path,
+            variables=np.array(self.variables),
+            window_starts=self.window_starts,
+            window_size=self.window_size,
+            **self.statistics,
+        )
+
+
+class _WindowAccumulator:
+    """
+    Running statistics of a set of variables in one window. Count, extremes, mean and squared deviations are merged
+    chunk by chunk, so memory does not grow with the number of samples. Percentiles are estimated from a bottom-k
+    sample: every sample gets a random priority and the sketch_size samples with the lowest priorities are kept, which
+    is a uniform sample of the window, and exact while the window holds fewer samples than that
+    """
+
+    def __init__(self, variable_count: int, sketch_size: int, rng: np.random.Generator):
+        self.count = np.zeros(variable_count, dtype=np.int64)
+        self.min = np.full(variable_count, np.inf)
+        self.max = np.full(variable_count, -np.inf)
+        self.mean = np.zeros(variable_count)
+        self.m2 = np.zeros(variable_count)
+        self.sum_squares = np.zeros(variable_count)
+        self.sketch_size = sketch_size
+        self.rng = rng
+        self.sketches: list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]] = [
+            (np.empty(0), np.empty(0)) for _ in range(variable_count)
+        ]
+
+    def add(self, values: npt.NDArray[np.float64]):
+        """
+        Merge samples of shape (number of samples, number of variables). NaN marks a missing sample
+        """
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0)
+        zeroed = np.where(valid, values, 0.0)
+        mean = np.divide(zeroed.sum(axis=0), count, out=np.zeros(len(count)), where=count > 0)
+        m2 = np.where(valid, (values - mean) ** 2, 0.0).sum(axis=0)
+
+        # Chan et al. pairwise update of mean and sum of squared deviations
+        total = self.count + count
+        delta = mean - self.mean
+        weight = np.divide(count, total, out=np.zeros(len(count)), where=total > 0)
+        self.m2 += m2 + delta**2 * self.count * weight
+        self.mean += delta * weight
+        self.count = total
+        self.min = np.minimum(self.min, np.min(values, axis=0, where=valid, initial=np.inf))
+        self.max = np.maximum(self.max, np.max(values, axis=0, where=valid, initial=-np.inf))
+        self.sum_squares += (zeroed**2).sum(axis=0)
+
+        if self.sketch_size:
+            for column, (kept, priorities) in enumerate(self.sketches):
+                samples = values[valid[:, column], column]
+                kept = np.concatenate([kept, samples])
+                priorities = np.concatenate([priorities, self.rng.random(len(samples))])
+                if len(kept) > self.sketch_size:
+                    lowest = np.argpartition(priorities, self.sketch_size)[: self.sketch_size]
+                    kept, priorities = kept[lowest], priorities[lowest]
+                self.sketches[column] = (kept, priorities)
+
+    def statistics(self, percentiles: Sequence[float]) -> dict[str, npt.NDArray[np.float64]]:
+        """
+        Statistics of the window, one value per variable
+        """
+        empty = self.count == 0
+        count = np.where(empty, 1, self.count)
+        statistics = {
+            "count": self.count.astype(np.float64),
+            "min": np.where(empty, np.nan, self.min),
+            "max": np.where(empty, np.nan, self.max),
+            "mean": np.where(empty, np.nan, self.mean),
+            "variance": np.where(empty, np.nan, self.m2 / count),
+            "rms": np.where(empty, np.nan, np.sqrt(self.sum_squares / count)),
+        }
+        for percentile in percentiles:
+            statistics[_percentile_name(percentile)] = np.array(
+                [np.percentile(kept, percentile) if len(kept) else np.nan for kept, _ in self.sketches]
+            )
+        return statistics
+
+
+class WindowAggregator:
+    """
+    Aggregates variables of an execution into statistics over tumbling windows of simulated time instead of keeping
+    the raw samples. Windows start at multiples of window_size nanos and only the statistics of the current window are
+    held while stepping, so memory does not grow with the length of the run. Completed windows are collected with
+    emit(), which returns them as a compact table and forgets them.
+
+    With source "time_series" samples of every step are pulled from a buffered time series observer every chunk_steps
+    steps, which only supports REAL and INTEGER variables. With source "last_value" the variables are read from a last
+    value observer after every step taken through step(), which also supports BOOLEAN variables
+    """
+
+    def __init__(
+        self,
+        execution: CosimExecution,
+        variables: Sequence[str] | Mapping[str, str | tuple[int, int, CosimVariableType]],
+        window_size: int | float,
+        percentiles: Sequence[float] = (),
+        sketch_size: int = 1024,
+        source: str = "time_series",
+        chunk_steps: int = 4096,
+        observer: Optional[CosimObserver] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        :param CosimExecution execution: Execution to aggregate
+        :param variables: "instance.variable" names to aggregate, or a mapping from name to "instance.variable" name or
+            (slave_index, value_reference, variable_type)
+        :param int window_size: Length of each window in nanos
+        :param list of float percentiles: Optional percentiles between 0 and 100 to estimate, such as (50, 95, 99)
+        :param int sketch_size: Number of samples kept per variable and window to estimate percentiles. Default 1024
+        :param str source: "time_series" or "last_value". Default "time_series"
+        :param int chunk_steps: Number of steps per pull from a time series observer. Default 4096
+        :param CosimObserver observer: Optional observer of the kind given by source, already added to the execution.
+            A time series observer must buffer at least chunk_steps steps. Created and added if not given
+        :param int seed: Optional seed of the random priorities of the percentile sketches
+        """
+        assert window_size > 0, "Window size must be a positive and non-zero integer"
+        assert sketch_size > 0 or not percentiles, "Sketch size must be a positive and non-zero integer"
+        if any(not 0 <= percentile <= 100 for percentile in percentiles):
+            raise ValueError("Percentiles must be between 0 and 100")
+        self.execution = execution
+        self.window_size = int(window_size)
+        self.percentiles = list(percentiles)
+        self.sketch_size = sketch_size if percentiles else 0
+        self.__sampler = SampleSource(
+            execution,
+            variables,
+            self.__add_samples,
+            source=source,
+            chunk_steps=chunk_steps,
+            observer=observer,
+        )
+        self.source = source
+        self.chunk_steps = chunk_steps
+        self.observer = self.__sampler.observer
+        self.variables = self.__sampler.names
+        self.targets = self.__sampler.targets
+
+        self.__rng = np.random.default_rng(seed)
+        self.__window: Optional[int] = None
+        self.__accumulator: Optional[_WindowAccumulator] = None
+        self.__completed: list[tuple[int, dict[str, npt.NDArray[np.float64]]]] = []
+        self.closed = False
+
+    def step(self, step_count: int = 1) -> bool:
+        """
+        Advance the execution for 1 or multiple steps, aggregating the variables
+
+        :param int step_count: Number of steps to advance with default of 1
+        :return: bool Successful step execution
+        """
+        return self.__sampler.step(step_count)
+
+    def read(self):
+        """
+        Aggregate the current values from the last value observer as one sample
+        """
+        self.__sampler.read()
+
+    def pull(self) -> int:
+        """
+        Aggregate all samples held by the time series observer that have not been aggregated yet
+
+        :return: int Number of steps aggregated
+        """
+        return self.__sampler.pull()
+
+    def add(self, time_points: npt.NDArray[np.int64], values: npt.NDArray[np.float64]):
+        """
+        Aggregate samples taken at increasing time points
+
+        :param time_points: Array of time points in nanos
+        :param values: Array of shape (number of time points, number of variables). NaN marks a missing sample
+        """
+        windows = np.asarray(time_points, dtype=np.int64) // self.window_size
+        bounds = [0, *(np.flatnonzero(np.diff(windows)) + 1).tolist(), len(windows)]
+        for start, stop in pairwise(bounds):
+            if start == stop:
+                continue
+            window = int(windows[start])
+            if window != self.__window:
+                self.__finish_window()
+                self.__window = window
+                self.__accumulator = _WindowAccumulator(len(self.targets), self.sketch_size, self.__rng)
+            assert self.__accumulator is not None
+            self.__accumulator.add(values[start:stop])
+
+    def emit(self) -> WindowAggregates:
+        """
+        Collect the windows completed since the previous call. The last window is completed by close()
+
+        :return: WindowAggregates with one row per completed window
+        """
+        completed, self.__completed = self.__completed, []
+        names = [*STATISTICS, *(_percentile_name(percentile) for percentile in self.percentiles)]
+        return WindowAggregates(
+            variables=list(self.variables),
+            window_starts=np.array([window * self.window_size for window, _ in completed], dtype=np.int64),
+            window_size=self.window_size,
+            statistics={
+                name: np.array([statistics[name] for _, statistics in completed]).reshape(
+                    len(completed), len(self.targets)
+                )
+                for name in names
+            },
+        )
+
+    def close(self):
+        """
+        Aggregate the remaining samples, complete the current window and stop observing the variables. The windows
+        not yet emitted are still returned by emit()
+        """
+        if self.closed:
+            return
+        try:
+            self.__sampler.stop()
+        finally:
+            self.__finish_window()
+            self.closed = True
+
+    @property
+    def dropped_steps(self) -> int:
+        """
+        Number of steps overwritten in the time series observer buffer before they were aggregated
+        """
+        return self.__sampler.dropped_steps
+
+    def __add_samples(
+        self, time_points: npt.NDArray[np.int64], _: npt.NDArray[np.int64], values: npt.NDArray[np.float64]
+    ):
+        self.add(time_points, values)
+
+    def __finish_window(self):
+        """
+        Helper function moving the statistics of the current window to the completed windows
+        """
+        if self.__accumulator is not None:
+            self.__completed.append((self.__window, self.__accumulator.statistics(self.percentiles)))
+        self.__window = None
+        self.__accumulator = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_: object):
+        self.close()
+
+
+def _percentile_name(percentile: float) -> str:
+    """
+    Statistic name of a percentile, such as p95 or p99.9
+    """
+    return f"p{percentile:g}"
@@ -4,14 +4,12 @@ import typing
 from ctypes import (
     POINTER,
     Structure,
-    c_double,
-    c_int,
-    c_uint32,
 )
 from dataclasses import dataclass
 from typing import Optional
 
-from ._internal import wrap_function, get_last_error_message, libcosimc
+from ._bindings import cosimc
+from ._internal import get_last_error_message
 
 if typing.TYPE_CHECKING:
     from ctypes import _Pointer  # pyright: ignore[reportPrivateUsage]
@@ -67,34 +65,9 @@ class CosimAlgorithm(Structure):
             "Execution can only be initialized using the CosimAlgorithm.create"
         )
 
-        self.__ecco_add_power_bond = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_ecco_add_power_bond",
-            argtypes=[POINTER(CosimAlgorithm), c_int, c_uint32, c_uint32, c_int, c_uint32, c_uint32],
-            restype=c_int,
-        )
-
     @classmethod
     def create_ecco_algorithm(cls, param: EccoParams) -> CosimAlgorithm:
-        ecco_algorithm_create = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_ecco_algorithm_create",
-            argtypes=[
-                c_double,
-                c_double,
-                c_double,
-                c_double,
-                c_double,
-                c_double,
-                c_double,
-                c_double,
-                c_double,
-                c_double,
-            ],
-            restype=POINTER(CosimAlgorithm),
-        )
-
-        ecco_algorithm_ptr = ecco_algorithm_create(
+        ecco_algorithm_ptr = cosimc().cosim_ecco_algorithm_create(
             param.safety_factor,
             param.step_size,
             param.min_step_size,
@@ -131,7 +104,7 @@ class CosimAlgorithm(Structure):
         :param slave2_input_reference: An input reference for the second model
         :return: 0 on Success and -1 on error
         """
-        return self.__ecco_add_power_bond(
+        return cosimc().cosim_ecco_add_power_bond(
             self.__ptr,
             slave1_index,
             slave1_output_reference,
@@ -154,10 +127,4 @@ class CosimAlgorithm(Structure):
         """
         # Release object in C when object is removed (if pointer exists)
         if self.__ptr is not None:
-            algorithm_destroy = wrap_function(
-                lib=libcosimc(),
-                funcname="cosim_algorithm_destroy",
-                argtypes=[POINTER(CosimAlgorithm)],
-                restype=c_int,
-            )
-            algorithm_destroy(self.__ptr)
+            cosimc().cosim_algorithm_destroy(self.__ptr)
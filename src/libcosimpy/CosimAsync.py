@@ -0,0 +1,128 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, TypeVar
+
+from .CosimEnums import CosimExecutionState
+from .CosimExecution import CosimExecution, CosimExecutionStatus
+
+T = TypeVar("T")
+
+
+class AsyncCosimExecution:
+    """
+    Non-blocking asyncio wrapper around a CosimExecution.
+
+    All blocking calls are made on a dedicated worker thread owned by the wrapper. ctypes releases the GIL while
+    libcosimc runs, so the event loop and other executions keep running while a step is in progress.
+
+    Threading contract: calls that touch the simulation (stepping, observer reads, manipulator writes, adding slaves,
+    observers or manipulators) are serialised on the worker thread and must go through the wrapper, using run() for
+    anything that has no dedicated coroutine. Observers and manipulators may be used directly only while no call on the
+    wrapper is in flight. status() and status_updates() may be used at any time, as with CosimExecution.start()
+    """
+
+    def __init__(self, execution: CosimExecution):
+        """
+        :param CosimExecution execution: Execution to drive. Should not be used directly while wrapped
+        """
+        self.execution = execution
+        self.__worker: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="cosim-execution"
+        )
+        self.__pending = 0
+
+    @property
+    def busy(self) -> bool:
+        """
+        True while calls submitted to the worker thread have not completed
+        """
+        return self.__pending > 0
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Call func(*args, **kwargs) on the worker thread of the execution and wait for the result
+
+        :param func: Callable using the execution or its observers and manipulators
+        :return: Return value of func
+        """
+        if self.__worker is None:
+            raise RuntimeError("AsyncCosimExecution has been closed")
+        self.__pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.__worker, lambda: func(*args, **kwargs))
+        finally:
+            self.__pending -= 1
+
+    async def step(self, step_count: int = 1) -> bool:
+        """
+        Advance the simulation for 1 or multiple steps
+
+        :param int step_count: Number of steps to advance with default of 1
+        :return: bool Successful step execution
+        """
+        return await self.run(self.execution.step, step_count)
+
+    async def simulate_until(self, target_time: int | float) -> bool:
+        """
+        Simulate until target time is reached
+
+        :param int target_time: End of simulation time in nanos
+        :return: bool Successful simulation until target time
+        """
+        return await self.run(self.execution.simulate_until, target_time)
+
+    async def start(self) -> bool:
+        """
+        Start the execution running in the background until stop() is called
+
+        :return: bool Successful start of execution
+        """
+        return await self.run(self.execution.start)
+
+    async def stop(self) -> bool:
+        """
+        Stop the simulation started by start()
+
+        :return: bool Successful stop of execution
+        """
+        return await self.run(self.execution.stop)
+
+    def status(self) -> CosimExecutionStatus:
+        """
+        Snapshot of the current execution status. Unlike CosimExecution.status() the returned object is not updated by
+        later calls
+
+        :return: CosimExecutionStatus object
+        """
+        return CosimExecutionStatus.from_buffer_copy(self.execution.status())
+
+    async def status_updates(self, interval: float = 0.1):
+        """
+        Asynchronous iterator of status snapshots, polled every interval seconds until no call is in flight and the
+        execution is not running. The last snapshot is taken after the execution became idle
+
+        :param float interval: Seconds between snapshots. Default 0.1
+        """
+        yield self.status()
+        while True:
+            # Sleep before checking, so that calls scheduled together with the iterator get to start
+            await asyncio.sleep(interval)
+            status = self.status()
+            yield status
+            if not self.busy and CosimExecutionState(status.state) != CosimExecutionState.RUNNING:
+                return
+
+    def close(self):
+        """
+        Wait for calls in flight and shut down the worker thread. The wrapped execution is left intact
+        """
+        if self.__worker is not None:
+            self.__worker.shutdown(wait=True)
+            self.__worker = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_: object):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
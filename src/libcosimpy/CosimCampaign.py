@@ -0,0 +1,259 @@
+import json
+import os
+import sqlite3
+import tempfile
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .CosimSweep import RUN_CRASHED, RUN_FAILED, RUN_TIMEOUT, SweepResult, SweepRunner
+
+# Journal status of runs that have not ended. Ended runs have one of the SweepResult status values
+RUN_PLANNED = "planned"
+RUN_RUNNING = "running"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    parameters TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    chunk INTEGER,
+    row INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_status ON runs (status);
+"""
+
+
+class Campaign:
+    """
+    Sweep campaign journaled in a SQLite file, so that it can be resumed after the driving process dies. The journal
+    holds the settings of the sweep and the parameters, status and result location of every planned run. Samples of
+    finished runs are buffered and written chunk_size runs at a time to .npz chunk files in a folder next to the
+    journal, and the runs are marked finished in the same transaction that records the chunk. Running the campaign
+    again only runs what is not finished, so at most the runs of one unwritten chunk and the runs in progress are
+    repeated after a crash
+    """
+
+    def __init__(self, path: str | os.PathLike[str], runner: SweepRunner, chunk_size: int = 64):
+        """
+        :param str path: Path to the journal file, created if it does not exist
+        :param SweepRunner runner: Runner executing the runs. Its configuration, outputs, step count and sampling
+            interval must match those stored in an existing journal
+        :param int chunk_size: Number of finished runs written per chunk file. Default 64
+        """
+        assert chunk_size > 0, "Chunk size must be a positive and non-zero integer"
+        self.path = Path(path)
+        self.runner = runner
+        self.chunk_size = chunk_size
+        self.results_dir = self.path.parent / f"{self.path.stem}-results"
+        self.__db = sqlite3.connect(self.path)
+        try:
+            self.__db.execute("PRAGMA journal_mode=WAL")
+            self.__db.executescript(_SCHEMA)
+            self.__check_settings()
+        except Exception:
+            self.__db.close()
+            raise
+
+    def plan(self, parameter_sets: Sequence[Mapping[str, int | float | bool | str]]):
+        """
+        Add the runs of the campaign to a new journal. A journal that already holds runs must have been planned with
+        the same parameter sets, so a driver script can plan and run unconditionally when restarted
+
+        :param list of dict parameter_sets: Initial values of each run, from "instance.variable" name to value
+        """
+        encoded = [json.dumps(dict(parameter_set), sort_keys=True, default=_plain) for parameter_set in parameter_sets]
+        planned = [row[0] for row in self.__db.execute("SELECT parameters FROM runs ORDER BY run_id")]
+        if planned:
+            if planned != encoded:
+                raise ValueError(f"Campaign {self.path} is already planned with different parameter sets")
+            return
+        with self.__db:
+            self.__db.executemany(
+                "INSERT INTO runs (run_id, parameters, status) VALUES (?, ?, ?)",
+                [(run_id, parameters, RUN_PLANNED) for run_id, parameters in enumerate(encoded)],
+            )
+
+    def run(self, retry_failed: bool = False) -> dict[str, int]:
+        """
+        Run every run that has not finished, including runs left running by an interrupted driver
+
+        :param bool retry_failed: Also run again runs that failed, crashed or timed out. Default False
+        :return: dict Number of runs with each status
+        """
+        statuses = [RUN_PLANNED, RUN_RUNNING]
+        if retry_failed:
+            statuses.extend([RUN_FAILED, RUN_TIMEOUT, RUN_CRASHED])
+        rows = self.__db.execute(
+            f"SELECT run_id, parameters FROM runs WHERE status IN ({', '.join('?' * len(statuses))}) ORDER BY run_id",
+            statuses,
+        ).fetchall()
+        if not rows:
+            return self.progress()
+        run_ids = [run_id for run_id, _ in rows]
+        with self.__db:
+            self.__db.executemany(
+                "UPDATE runs SET status = ?, error = NULL, attempts = attempts + 1 WHERE run_id = ?",
+                [(RUN_RUNNING, run_id) for run_id in run_ids],
+            )
+
+        # Samples of successful runs and outcomes of all runs not yet written, by index in rows
+        samples: dict[int, npt.NDArray[np.float64]] = {}
+        outcomes: list[tuple[int, str, Optional[str]]] = []
+        time_points: list[npt.NDArray[np.int64]] = []
+
+        def consume(index: int, run_time_points: npt.NDArray[np.int64], values: npt.NDArray[np.float64]):
+            samples[index] = values
+            if not time_points:
+                time_points.append(run_time_points)
+
+        def report(index: int, status: str, error: Optional[str]):
+            outcomes.append((index, status, error))
+            if len(outcomes) >= self.chunk_size:
+                self.__flush(run_ids, samples, outcomes, time_points)
+
+        self.runner.run_streaming([json.loads(parameters) for _, parameters in rows], consume, report)
+        self.__flush(run_ids, samples, outcomes, time_points)
+        return self.progress()
+
+    def progress(self) -> dict[str, int]:
+        """
+        Number of runs with each status in the journal
+
+        :return: dict from status to number of runs
+        """
+        return dict(self.__db.execute("SELECT status, COUNT(*) FROM runs GROUP BY status").fetchall())
+
+    def result(self) -> SweepResult:
+        """
+        Collect the journaled runs and the samples of finished runs
+
+        :return: SweepResult with one row per planned run, NaN for runs without samples. Runs that have not ended have
+            status "planned" or "running"
+        """
+        rows = self.__db.execute("SELECT run_id, parameters, status, error, chunk, row FROM runs ORDER BY run_id")
+        rows = rows.fetchall()
+        sample_count = self.runner.step_count // self.runner.every
+        values = np.full((len(rows), sample_count, len(self.runner.outputs)), np.nan)
+        time_points = np.zeros(sample_count, dtype=np.int64)
+        by_chunk: dict[int, list[tuple[int, int]]] = {}
+        for run_id, _, _, _, chunk, row in rows:
+            if chunk is not None:
+                by_chunk.setdefault(chunk, []).append((run_id, row))
+        for chunk, locations in by_chunk.items():
+            with np.load(self.__chunk_path(chunk)) as content:
+                chunk_values = content["values"]
+                time_points[:] = content["time_points"]
+            for run_id, row in locations:
+                values[run_id] = chunk_values[row]
+        return SweepResult(
+            parameters=[json.loads(parameters) for _, parameters, _, _, _, _ in rows],
+            outputs=list(self.runner.outputs),
+            time_points=time_points,
+            values=values,
+            status=[status for _, _, status, _, _, _ in rows],
+            errors={run_id: error for run_id, _, _, error, _, _ in rows if error is not None},
+        )
+
+    def close(self):
+        """
+        Close the journal
+        """
+        self.__db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_: object):
+        self.close()
+
+    def __check_settings(self):
+        """
+        Helper function storing the sweep settings in a new journal, or checking them against an existing one
+        """
+        runner = self.runner
+        settings = {
+            "config_path": str(Path(runner.config_path).resolve()),
+            "outputs": json.dumps(runner.outputs),
+            "step_count": str(runner.step_count),
+            "step_size": str(runner.step_size),
+            "every": str(runner.every),
+        }
+        stored = dict(self.__db.execute("SELECT name, value FROM settings").fetchall())
+        if not stored:
+            with self.__db:
+                self.__db.executemany("INSERT INTO settings (name, value) VALUES (?, ?)", settings.items())
+            return
+        mismatched = [name for name, value in settings.items() if stored.get(name) != value]
+        if mismatched:
+            raise ValueError(f"Campaign {self.path} was created with different {', '.join(mismatched)}")
+
+    def __flush(
+        self,
+        run_ids: list[int],
+        samples: dict[int, npt.NDArray[np.float64]],
+        outcomes: list[tuple[int, str, Optional[str]]],
+        time_points: list[npt.NDArray[np.int64]],
+    ):
+        """
+        Helper function writing buffered samples to a new chunk file and the buffered outcomes to the journal
+        """
+        if not outcomes:
+            return
+        chunk = None
+        rows: dict[int, int] = {}
+        if samples:
+            (chunk,) = self.__db.execute("SELECT COALESCE(MAX(chunk), -1) + 1 FROM runs").fetchone()
+            indices = sorted(samples)
+            rows = {index: row for row, index in enumerate(indices)}
+            _save_chunk(
+                self.__chunk_path(chunk),
+                run_ids=np.array([run_ids[index] for index in indices], dtype=np.int64),
+                time_points=time_points[0],
+                values=np.stack([samples[index] for index in indices]),
+            )
+        with self.__db:
+            self.__db.executemany(
+                "UPDATE runs SET status = ?, error = ?, chunk = ?, row = ? WHERE run_id = ?",
+                [
+                    (status, error, chunk if index in rows else None, rows.get(index), run_ids[index])
+                    for index, status, error in outcomes
+                ],
+            )
+        samples.clear()
+        outcomes.clear()
+
+    def __chunk_path(self, chunk: int) -> Path:
+        return self.results_dir / f"chunk-{chunk:06d}.npz"
+
+
+def _save_chunk(path: Path, **arrays: npt.NDArray[Any]):
+    """
+    Write a chunk file atomically, so a chunk recorded in the journal is always complete
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            np.savez(file, **arrays)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def _plain(value: Any) -> Any:
+    """
+    JSON encoding of NumPy scalars in parameter sets
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Parameter value {value!r} of type {type(value).__name__} is not supported")
@@ -0,0 +1,437 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .CosimResultCache import ResultCache
+from .CosimScenario import CompiledScenario
+from .CosimSweep import SweepRunner
+
+
+class Distribution(ABC):
+    """
+    Base class of parameter distributions. Samples are drawn by mapping uniform samples in [0, 1) through the inverse
+    cumulative distribution function, so every distribution works with every sampling method
+    """
+
+    @abstractmethod
+    def ppf(self, u: npt.NDArray[np.float64]) -> npt.NDArray[Any]:
+        """
+        Inverse cumulative distribution function
+
+        :param u: Uniform samples in [0, 1)
+        :return: Array of parameter values
+        """
+
+
+@dataclass(frozen=True)
+class Uniform(Distribution):
+    """
+    Continuous uniform distribution on [low, high)
+    """
+
+    low: float
+    high: float
+
+    def ppf(self, u: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        return self.low + u * (self.high - self.low)
+
+
+@dataclass(frozen=True)
+class Normal(Distribution):
+    """
+    Normal distribution with the given mean and standard deviation
+    """
+
+    mean: float
+    std: float
+
+    def ppf(self, u: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        return self.mean + self.std * _standard_normal_ppf(u)
+
+
+@dataclass(frozen=True)
+class LogNormal(Distribution):
+    """
+    Distribution whose logarithm is normal with the given mean and standard deviation
+    """
+
+    mean: float
+    std: float
+
+    def ppf(self, u: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        return np.exp(self.mean + self.std * _standard_normal_ppf(u))
+
+
+@dataclass(frozen=True)
+class IntegerUniform(Distribution):
+    """
+    Discrete uniform distribution on the integers low to high, both included
+    """
+
+    low: int
+    high: int
+
+    def ppf(self, u: npt.NDArray[np.float64]) -> npt.NDArray[np.int64]:
+        return np.minimum(self.low + np.floor(u * (self.high - self.low + 1)), self.high).astype(np.int64)
+
+
+@dataclass(frozen=True)
+class Bernoulli(Distribution):
+    """
+    Boolean distribution that is True with probability p
+    """
+
+    p: float
+
+    def ppf(self, u: npt.NDArray[np.float64]) -> npt.NDArray[np.bool_]:
+        return u < self.p
+
+
+def sample(
+    distributions: Mapping[str, Distribution],
+    sample_count: int,
+    method: str = "lhs",
+    seed: Optional[int] = None,
+) -> dict[str, npt.NDArray[Any]]:
+    """
+    Draw parameter samples in bulk
+
+    :param dict distributions: Distribution of each parameter, keyed by "instance.variable" name
+    :param int sample_count: Number of samples
+    :param str method: "random", "lhs" (Latin hypercube) or "sobol". Sobol samples are best used with a power of 2
+        sample count and support up to 21 parameters
+    :param int seed: Optional seed for reproducible samples. Sobol samples are randomised by a digital shift, which
+        keeps their stratification and keeps points off the boundary of unbounded distributions
+    :return: dict from parameter name to array of sample_count values
+    """
+    rng = np.random.default_rng(seed)
+    dimensions = len(distributions)
+    if method == "random":
+        u = rng.random((sample_count, dimensions))
+    elif method == "lhs":
+        # One sample in each of sample_count equal strata per parameter, with strata paired at random
+        strata = np.argsort(rng.random((sample_count, dimensions)), axis=0)
+        u = (strata + rng.random((sample_count, dimensions))) / sample_count
+    elif method == "sobol":
+        u = _sobol(sample_count, dimensions, rng)
+    else:
+        raise ValueError(f"Unknown sampling method '{method}'")
+    return {name: distribution.ppf(u[:, i]) for i, (name, distribution) in enumerate(distributions.items())}
+
+
+class OutputStatistics:
+    """
+    Statistics of one output across the runs of an ensemble, per sample time. Mean, standard deviation, minimum,
+    maximum and threshold exceedance counts are exact and updated run by run. Percentiles are computed from a uniform
+    random reservoir of at most reservoir_size runs, and are exact while the ensemble has no more runs than that.
+
+    The reservoir holds one value per run and sample time and grows with the runs up to reservoir_size rows, so memory
+    use stays within (reservoir_size + 4 + 2 * len(thresholds)) * sample_count * 8 bytes however many runs are added
+    """
+
+    def __init__(
+        self,
+        sample_count: int,
+        thresholds: Sequence[float] = (),
+        reservoir_size: int = 100,
+        seed: Optional[int] = None,
+    ):
+        """
+        :param int sample_count: Number of sample times of each run
+        :param list of float thresholds: Optional thresholds to count exceedances of
+        :param int reservoir_size: Maximum number of runs kept for percentiles. Default 100
+        :param int seed: Optional seed of the reservoir sampling
+        """
+        assert reservoir_size > 0, "Reservoir size must be a positive and non-zero integer"
+        self.count = 0
+        self.reservoir_size = reservoir_size
+        self.thresholds = list(thresholds)
+        self.__mean = np.zeros(sample_count)
+        self.__m2 = np.zeros(sample_count)
+        self.min = np.full(sample_count, np.inf)
+        self.max = np.full(sample_count, -np.inf)
+        # Number of runs above each threshold at each sample, and number of runs above it at any sample
+        self.exceedance = np.zeros((len(self.thresholds), sample_count), dtype=np.int64)
+        self.exceeding_runs = np.zeros(len(self.thresholds), dtype=np.int64)
+        self.__reservoir = np.empty((0, sample_count))
+        self.__rng = np.random.default_rng(seed)
+
+    def update(self, trajectory: npt.NDArray[np.float64]):
+        """
+        Add the samples of one run
+
+        :param trajectory: Array with one value per sample time
+        """
+        self.count += 1
+        delta = trajectory - self.__mean
+        self.__mean += delta / self.count
+        self.__m2 += delta * (trajectory - self.__mean)
+        np.minimum(self.min, trajectory, out=self.min)
+        np.maximum(self.max, trajectory, out=self.max)
+        if self.thresholds:
+            above = trajectory[np.newaxis, :] > np.array(self.thresholds)[:, np.newaxis]
+            self.exceedance += above
+            self.exceeding_runs += above.any(axis=1)
+
+        # Reservoir sampling keeps each run with equal probability
+        if self.count <= self.reservoir_size:
+            if self.count > len(self.__reservoir):
+                rows = min(self.reservoir_size, 2 * len(self.__reservoir) or 8)
+                self.__reservoir = np.concatenate(
+                    [self.__reservoir, np.empty((rows - len(self.__reservoir), len(trajectory)))]
+                )
+            self.__reservoir[self.count - 1] = trajectory
+        else:
+            slot = self.__rng.integers(self.count)
+            if slot < self.reservoir_size:
+                self.__reservoir[slot] = trajectory
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Bytes held by the arrays of the statistics
+        """
+        arrays = (self.__mean, self.__m2, self.min, self.max, self.exceedance, self.exceeding_runs, self.__reservoir)
+        return sum(array.nbytes for array in arrays)
+
+    @property
+    def mean(self) -> npt.NDArray[np.float64]:
+        return self.__mean.copy() if self.count else np.full_like(self.__mean, np.nan)
+
+    @property
+    def std(self) -> npt.NDArray[np.float64]:
+        """
+        Sample standard deviation
+        """
+        if self.count < 2:
+            return np.full_like(self.__mean, np.nan)
+        return np.sqrt(self.__m2 / (self.count - 1))
+
+    def percentile(self, q: float | Sequence[float]) -> npt.NDArray[np.float64]:
+        """
+        Percentiles at each sample time
+
+        :param q: Percentile or sequence of percentiles between 0 and 100
+        :return: Array of shape (samples,), or (len(q), samples) for a sequence
+        """
+        if self.count == 0:
+            raise ValueError("No runs have completed")
+        return np.percentile(self.__reservoir[: min(self.count, self.reservoir_size)], q, axis=0)
+
+
+@dataclass
+class EnsembleResult:
+    """
+    Parameter samples, run status and output statistics of an ensemble
+    """
+
+    samples: dict[str, npt.NDArray[Any]]
+    time_points: npt.NDArray[np.int64]
+    statistics: dict[str, OutputStatistics]
+    status: list[str]
+    errors: dict[int, str]
+
+
+class EnsembleRunner:
+    """
+    Monte Carlo ensemble over uncertain initial values of a system configuration. Parameter samples are drawn in bulk,
+    the runs are executed by a SweepRunner and each run is reduced into the output statistics as soon as it completes,
+    so only the reservoir_size runs sampled for percentiles are kept
+    """
+
+    def __init__(
+        self,
+        config_path: str,
+        distributions: Mapping[str, Distribution],
+        outputs: Sequence[str],
+        stop_time: int | float,
+        step_size: int | float,
+        every: int = 1,
+        thresholds: Optional[Mapping[str, Sequence[float]]] = None,
+        reservoir_size: int = 100,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        start_method: Optional[str] = None,
+        scenario: Optional[CompiledScenario] = None,
+        cache: Optional[ResultCache] = None,
+    ):
+        """
+        :param str config_path: Path to OspSystemStructure.xml, .ssd file or directory containing either
+        :param dict distributions: Distribution of each uncertain initial value, keyed by "instance.variable" name
+        :param list of str outputs: Variables to reduce, named "instance.variable"
+        :param int stop_time: End of simulation time in nanos
+        :param int step_size: Step size of the configuration in nanos
+        :param int every: Number of steps between recorded samples. Default 1
+        :param dict thresholds: Optional thresholds to count exceedances of, per output name
+        :param int reservoir_size: Maximum number of runs kept for percentiles, which bounds the memory of each output
+            to about reservoir_size * 8 bytes per sample time. Default 100
+        :param int workers: Number of worker processes. Defaults to the number of CPUs
+        :param float timeout: Optional wall clock limit in seconds for each run
+        :param str start_method: Optional multiprocessing start method
+        :param CompiledScenario scenario: Optional scenario loaded into every run
+        :param ResultCache cache: Optional cache to answer repeated runs from
+        """
+        self.distributions = dict(distributions)
+        self.outputs = list(outputs)
+        self.thresholds = dict(thresholds or {})
+        self.reservoir_size = reservoir_size
+        self.sweep = SweepRunner(
+            config_path=config_path,
+            outputs=self.outputs,
+            stop_time=stop_time,
+            step_size=step_size,
+            every=every,
+            workers=workers,
+            timeout=timeout,
+            start_method=start_method,
+            scenario=scenario,
+            cache=cache,
+        )
+
+    def run(self, sample_count: int, method: str = "lhs", seed: Optional[int] = None) -> EnsembleResult:
+        """
+        Sample the parameters and run the ensemble
+
+        :param int sample_count: Number of runs
+        :param str method: Sampling method, "random", "lhs" or "sobol". Default "lhs"
+        :param int seed: Optional seed for reproducible samples
+        :return: EnsembleResult object
+        """
+        samples = sample(self.distributions, sample_count, method=method, seed=seed)
+        names = list(samples)
+        parameter_sets = [{name: samples[name][run].item() for name in names} for run in range(sample_count)]
+
+        output_sample_count = self.sweep.step_count // self.sweep.every
+        statistics = {
+            output: OutputStatistics(output_sample_count, self.thresholds.get(output, ()), self.reservoir_size, seed)
+            for output in self.outputs
+        }
+        time_points = np.zeros(output_sample_count, dtype=np.int64)
+
+        def reduce(_: int, run_time_points: npt.NDArray[np.int64], values: npt.NDArray[np.float64]):
+            time_points[:] = run_time_points
+            for column, output in enumerate(self.outputs):
+                statistics[output].update(values[:, column])
+
+        status, errors = self.sweep.run_streaming(parameter_sets, reduce)
+        return EnsembleResult(
+            samples=samples,
+            time_points=time_points,
+            statistics=statistics,
+            status=status,
+            errors=errors,
+        )
+
+
+def _standard_normal_ppf(u: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """
+    Inverse of the standard normal cumulative distribution function, by Acklam's rational approximation with relative
+    error below 1.2e-9
+    """
+    a = (-3.969683028665376e01, 2.209460984245205e02, -2.759285104469687e02, 1.383577518672690e02,
+         -3.066479806614716e01, 2.506628277459239e00)  # fmt: skip
+    b = (-5.447609879822406e01, 1.615858368580409e02, -1.556989798598866e02, 6.680131188771972e01,
+         -1.328068155288572e01)  # fmt: skip
+    c = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e00, -2.549732539343734e00,
+         4.374664141464968e00, 2.938163982698783e00)  # fmt: skip
+    d = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e00, 3.754408661907416e00)
+
+    u = np.clip(np.asarray(u, dtype=np.float64), np.finfo(np.float64).tiny, 1.0 - np.finfo(np.float64).eps)
+    result = np.empty_like(u)
+    low = u < 0.02425
+    high = u > 1.0 - 0.02425
+    central = ~(low | high)
+
+    q = u[central] - 0.5
+    r = q * q
+    result[central] = (
+        (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5])
+        * q
+        / (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1.0)
+    )
+    for mask, sign, tail in ((low, 1.0, u[low]), (high, -1.0, 1.0 - u[high])):
+        q = np.sqrt(-2.0 * np.log(tail))
+        result[mask] = (
+            sign
+            * (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5])
+            / ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0)
+        )
+    return result
+
+
+# Primitive polynomial degree, coefficients and initial direction numbers of Sobol dimensions 2 and up, from the
+# new-joe-kuo-6.21201 table by Joe and Kuo
+_SOBOL_PARAMETERS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+)
+_SOBOL_BITS = 52
+
+
+def _sobol_direction_numbers(dimensions: int) -> npt.NDArray[np.uint64]:
+    """
+    Direction numbers of the first dimensions of the Sobol sequence, scaled to _SOBOL_BITS bits
+    """
+    if dimensions > len(_SOBOL_PARAMETERS) + 1:
+        raise ValueError(f"Sobol sampling supports up to {len(_SOBOL_PARAMETERS) + 1} parameters")
+    directions = np.zeros((dimensions, _SOBOL_BITS), dtype=np.uint64)
+    # The first dimension is the van der Corput sequence in base 2
+    directions[0] = [1 << (_SOBOL_BITS - 1 - bit) for bit in range(_SOBOL_BITS)]
+    for dimension in range(1, dimensions):
+        degree, coefficients, initial = _SOBOL_PARAMETERS[dimension - 1]
+        m = list(initial)
+        for k in range(degree, _SOBOL_BITS):
+            value = m[k - degree] ^ (m[k - degree] << degree)
+            for j in range(1, degree):
+                if (coefficients >> (degree - 1 - j)) & 1:
+                    value ^= m[k - j] << j
+            m.append(value)
+        directions[dimension] = [m[bit] << (_SOBOL_BITS - 1 - bit) for bit in range(_SOBOL_BITS)]
+    return directions
+
+
+def _sobol(sample_count: int, dimensions: int, rng: np.random.Generator) -> npt.NDArray[np.float64]:
+    """
+    First points of the Sobol sequence in Gray code order, randomised by a digital shift
+    """
+    directions = _sobol_direction_numbers(dimensions)
+    # Point i is point i - 1 with the direction number of the lowest zero bit of i - 1 flipped in, which is the
+    # number of trailing zeros of i
+    changed_bit = np.zeros(max(sample_count - 1, 0), dtype=np.intp)
+    remaining = np.arange(1, sample_count, dtype=np.uint64)
+    while True:
+        even = (remaining & np.uint64(1)) == 0
+        if not even.any():
+            break
+        changed_bit[even] += 1
+        remaining[even] >>= np.uint64(1)
+    if changed_bit.max(initial=0) >= _SOBOL_BITS:
+        raise ValueError("Too many Sobol samples requested")
+
+    points = np.zeros((sample_count, dimensions), dtype=np.uint64)
+    if sample_count > 1:
+        points[1:] = np.bitwise_xor.accumulate(directions[:, changed_bit].T, axis=0)
+    points ^= rng.integers(0, 1 << _SOBOL_BITS, size=dimensions, dtype=np.uint64)
+    return points.astype(np.float64) / float(1 << _SOBOL_BITS)
@@ -1,21 +1,25 @@
+import time
 import typing
+from collections.abc import Sequence
 from ctypes import (
     POINTER,
     Structure,
-    c_bool,
-    c_char_p,
     c_double,
     c_int,
     c_int64,
-    c_size_t,
-    c_uint32,
     pointer,
 )
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
 
 from . import CosimConstants, CosimEnums, CosimManipulator, CosimObserver, CosimSlave
-from ._internal import wrap_function, libcosimc, get_last_error_message
+from ._bindings import cosimc
+from ._internal import VARIABLE_DTYPES, get_last_error_message
 from .CosimAlgorithm import CosimAlgorithm
+from .CosimModelIndex import ModelIndex
 
 if typing.TYPE_CHECKING:
     from ctypes import _Pointer  # pyright: ignore[reportPrivateUsage]
@@ -56,151 +60,10 @@ class CosimExecution(Structure):
         self.execution_status = CosimExecutionStatus()
         self.__execution_status_ptr = pointer(self.execution_status)
 
-        self.__multiple_steps = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_step",
-            argtypes=[POINTER(CosimExecution), c_int64],
-            restype=c_int,
-        )
-        self.__add_local_slave = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_add_slave",
-            argtypes=[POINTER(CosimExecution), POINTER(CosimSlave.CosimLocalSlave)],
-            restype=c_int,
-        )
-        self.__simulate_until = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_simulate_until",
-            argtypes=[POINTER(CosimExecution), c_int64],
-            restype=c_int,
-        )
-        self.__stop = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_stop",
-            argtypes=[POINTER(CosimExecution)],
-            restype=c_int,
-        )
-        self.__enable_real_time_simulation = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_enable_real_time_simulation",
-            argtypes=[POINTER(CosimExecution)],
-            restype=c_int,
-        )
-        self.__disable_real_time_simulation = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_disable_real_time_simulation",
-            argtypes=[POINTER(CosimExecution)],
-            restype=c_int,
-        )
-        self.__real_time_factor_target = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_set_real_time_factor_target",
-            argtypes=[POINTER(CosimExecution), c_double],
-            restype=c_int,
-        )
-        self.__steps_to_monitor = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_set_steps_to_monitor",
-            argtypes=[POINTER(CosimExecution), c_int],
-            restype=c_int,
-        )
-        self.__add_manipulator = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_add_manipulator",
-            argtypes=[
-                POINTER(CosimExecution),
-                POINTER(CosimManipulator.CosimManipulator),
-            ],
-            restype=c_int,
-        )
-        self.__add_observer = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_add_observer",
-            argtypes=[POINTER(CosimExecution), POINTER(CosimObserver.CosimObserver)],
-            restype=c_int,
-        )
-        self.__status = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_get_status",
-            argtypes=[POINTER(CosimExecution), POINTER(CosimExecutionStatus)],
-            restype=c_int,
-        )
-        self.__slave_num_variables = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_slave_get_num_variables",
-            argtypes=[POINTER(CosimExecution), c_int],
-            restype=c_int,
-        )
-        self.__num_modified_variables = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_get_num_modified_variables",
-            argtypes=[POINTER(CosimExecution)],
-            restype=c_int,
-        )
-        self.__load_scenario = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_load_scenario",
-            argtypes=[
-                POINTER(CosimExecution),
-                POINTER(CosimManipulator.CosimManipulator),
-                c_char_p,
-            ],
-            restype=c_int,
-        )
-        self.__real_initial = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_set_real_initial_value",
-            argtypes=[POINTER(CosimExecution), c_int, c_uint32, c_double],
-            restype=c_int,
-        )
-        self.__integer_initial = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_set_integer_initial_value",
-            argtypes=[POINTER(CosimExecution), c_int, c_uint32, c_int],
-            restype=c_int,
-        )
-
-        self.__boolean_initial = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_set_boolean_initial_value",
-            argtypes=[POINTER(CosimExecution), c_int, c_uint32, c_bool],
-            restype=c_int,
-        )
-
-        self.__string_initial = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_set_string_initial_value",
-            argtypes=[POINTER(CosimExecution), c_int, c_uint32, c_char_p],
-            restype=c_int,
-        )
-
-        self.__connect_real_variables = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_connect_real_variables",
-            argtypes=[POINTER(CosimExecution), c_int, c_uint32, c_int, c_uint32],
-            restype=c_int,
-        )
-
-        self.__connect_int_variables = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_connect_integer_variables",
-            argtypes=[POINTER(CosimExecution), c_int, c_uint32, c_int, c_uint32],
-            restype=c_int,
-        )
-
-        self.__connect_string_variables = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_connect_string_variables",
-            argtypes=[POINTER(CosimExecution), c_int, c_uint32, c_int, c_uint32],
-            restype=c_int,
-        )
-
-        self.__connect_boolean_variables = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_connect_boolean_variables",
-            argtypes=[POINTER(CosimExecution), c_int, c_uint32, c_int, c_uint32],
-            restype=c_int,
-        )
+        # Last value observer shared by calls to record()
+        self.__record_observer: Optional[CosimObserver.CosimObserver] = None
+        # Name lookup tables, built on first use and discarded when slaves are added
+        self.__model_index: Optional[ModelIndex] = None
 
     @classmethod
     def from_algorithm(cls, algorithm: CosimAlgorithm):
@@ -209,13 +72,7 @@ class CosimExecution(Structure):
         :param algorithm: An algorithm instance to be used to create an execution
         :return: CosimExecution object
         """
-        execution_create = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_create_with_algorithm",
-            argtypes=[c_int64, POINTER(CosimAlgorithm)],
-            restype=POINTER(CosimExecution),
-        )
-        execution_ptr = execution_create(0, algorithm.ptr)
+        execution_ptr = cosimc().cosim_execution_create_with_algorithm(0, algorithm.ptr)
 
         if not execution_ptr:
             raise RuntimeError("Unable to create execution from algorithm")
@@ -242,13 +99,7 @@ class CosimExecution(Structure):
 
         assert step_size > 0, "Step size must be a positive and non-zero integer"
 
-        execution_create = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_create",
-            argtypes=[c_int64, c_int64],
-            restype=POINTER(CosimExecution),
-        )
-        execution_ptr = execution_create(0, step_size_int)
+        execution_ptr = cosimc().cosim_execution_create(0, step_size_int)
         return cls(cls.__create_key, execution_ptr)
 
     @classmethod
@@ -259,18 +110,12 @@ class CosimExecution(Structure):
         :param str osp_path: Path to .ssd file or OspSystemStructure.xml file
         :return: CosimExecution object
         """
-        osp_execution_create = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_osp_config_execution_create",
-            argtypes=[c_char_p, c_bool, c_int64],
-            restype=POINTER(CosimExecution),
-        )
         try:
             encoded_osp_path = osp_path.encode()
         except AttributeError:
             raise AttributeError("Unable to encode OSP path")
 
-        execution_ptr = osp_execution_create(encoded_osp_path, False, 0)
+        execution_ptr = cosimc().cosim_osp_config_execution_create(encoded_osp_path, False, 0)
 
         assert execution_ptr, f"Unable to create execution from path: {get_last_error_message()}"
 
@@ -287,13 +132,7 @@ class CosimExecution(Structure):
         """
         if step_size is None:
             # Create simulation without defined step size
-            ssp_execution_create = wrap_function(
-                lib=libcosimc(),
-                funcname="cosim_ssp_execution_create",
-                argtypes=[c_char_p, c_bool, c_int64],
-                restype=POINTER(CosimExecution),
-            )
-            execution_ptr = ssp_execution_create(ssp_path.encode(), False, 0)
+            execution_ptr = cosimc().cosim_ssp_execution_create(ssp_path.encode(), False, 0)
         else:
             try:
                 step_size_int = int(step_size)
@@ -308,13 +147,7 @@ class CosimExecution(Structure):
             assert step_size > 0, "Step size must be a positive and non-zero integer"
 
             # Create simulation with defined step size
-            ssp_fixed_step_execution_create = wrap_function(
-                lib=libcosimc(),
-                funcname="cosim_ssp_fixed_step_execution_create",
-                argtypes=[c_char_p, c_bool, c_int64, c_int64],
-                restype=POINTER(CosimExecution),
-            )
-            execution_ptr = ssp_fixed_step_execution_create(ssp_path.encode(), False, 0, step_size_int)
+            execution_ptr = cosimc().cosim_ssp_fixed_step_execution_create(ssp_path.encode(), False, 0, step_size_int)
 
         assert execution_ptr, "Unable to create execution from path. Please check if path is correct."
 
@@ -326,13 +159,7 @@ class CosimExecution(Structure):
 
         :return: int Number of currently connected slaves
         """
-        execution_get_num_slaves = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_get_num_slaves",
-            argtypes=[POINTER(CosimExecution)],
-            restype=c_int,
-        )
-        return execution_get_num_slaves(self.__ptr)
+        return cosimc().cosim_execution_get_num_slaves(self.__ptr)
 
     def start(self):
         """
@@ -340,13 +167,7 @@ class CosimExecution(Structure):
 
         :return: bool Successful start of execution
         """
-        execution_start = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_start",
-            argtypes=[POINTER(CosimExecution)],
-            restype=c_int,
-        )
-        return execution_start(self.__ptr) == CosimConstants.success
+        return cosimc().cosim_execution_start(self.__ptr) == CosimConstants.success
 
     def stop(self):
         """
@@ -354,7 +175,7 @@ class CosimExecution(Structure):
 
         :return: bool Successful stop of execution
         """
-        return self.__stop(self.__ptr) == CosimConstants.success
+        return cosimc().cosim_execution_stop(self.__ptr) == CosimConstants.success
 
     def simulate_until(self, target_time: int | float):
         """
@@ -374,7 +195,7 @@ class CosimExecution(Structure):
                 raise ValueError("Target time must be an int convertible")
 
         assert target_time_int > 0, "Target time must be a positive and non-zero integer"
-        return self.__simulate_until(self.__ptr, target_time_int) != CosimConstants.failure
+        return cosimc().cosim_execution_simulate_until(self.__ptr, target_time_int) != CosimConstants.failure
 
     def step(self, step_count: int = 1):
         """
@@ -383,7 +204,76 @@ class CosimExecution(Structure):
         :param int step_count: Number of steps to advance with default of 1
         :return: bool Successful step execution
         """
-        return self.__multiple_steps(self.__ptr, step_count) == CosimConstants.success
+        return cosimc().cosim_execution_step(self.__ptr, step_count) == CosimConstants.success
+
+    def record(
+        self,
+        n_steps: int,
+        variables: Sequence[tuple[int, int, CosimEnums.CosimVariableType]],
+        every: int = 1,
+    ):
+        """
+        Advance the simulation n_steps steps and capture the last values of a set of variables every few steps into
+        preallocated arrays
+
+        :param int n_steps: Number of steps to advance
+        :param list of tuple variables: (slave_index, value_reference, variable_type) of each variable to capture
+        :param int every: Number of steps between captured samples. Default 1
+        :return: CosimRecording with n_steps // every samples
+        """
+        assert n_steps > 0, "Step count must be a positive and non-zero integer"
+        assert every > 0, "Sampling interval must be a positive and non-zero integer"
+
+        if self.__record_observer is None:
+            observer = CosimObserver.CosimObserver.create_last_value()
+            if not self.add_observer(observer):
+                raise RuntimeError(f"Unable to add last value observer: {get_last_error_message()}")
+            self.__record_observer = observer
+
+        # Group variables by type and slave so that each read set fills a contiguous slice of a sample row
+        references: dict[CosimEnums.CosimVariableType, dict[int, list[int]]] = {}
+        for slave_index, value_reference, variable_type in variables:
+            references.setdefault(variable_type, {}).setdefault(slave_index, []).append(value_reference)
+
+        sample_count = n_steps // every
+        columns: dict[CosimEnums.CosimVariableType, list[tuple[int, int]]] = {}
+        values: dict[CosimEnums.CosimVariableType, npt.NDArray[Any]] = {}
+        readers: list[tuple[CosimObserver.VariableReadSet, npt.NDArray[Any], int, int]] = []
+        for variable_type, slave_references in references.items():
+            columns[variable_type] = [
+                (slave_index, value_reference)
+                for slave_index, value_references in slave_references.items()
+                for value_reference in value_references
+            ]
+            values[variable_type] = np.zeros(
+                (sample_count, len(columns[variable_type])), dtype=VARIABLE_DTYPES[variable_type]
+            )
+            start = 0
+            for slave_index, value_references in slave_references.items():
+                read_set = self.__record_observer.read_set(slave_index, value_references, variable_type)
+                readers.append((read_set, values[variable_type], start, start + len(value_references)))
+                start += len(value_references)
+        time_points = np.zeros(sample_count, dtype=np.int64)
+
+        execution_step = cosimc().cosim_execution_step
+        start_time = time.perf_counter()
+        for sample in range(sample_count):
+            if execution_step(self.__ptr, every) != CosimConstants.success:
+                raise RuntimeError(f"Step failed while recording: {get_last_error_message()}")
+            for read_set, sample_values, start, stop in readers:
+                read_set.read(out=sample_values[sample, start:stop])
+            time_points[sample] = self.status().current_time
+        remaining_steps = n_steps - sample_count * every
+        if remaining_steps and execution_step(self.__ptr, remaining_steps) != CosimConstants.success:
+            raise RuntimeError(f"Step failed while recording: {get_last_error_message()}")
+        elapsed = time.perf_counter() - start_time
+
+        return CosimRecording(
+            time_points=time_points,
+            values=values,
+            columns=columns,
+            steps_per_second=n_steps / elapsed if elapsed > 0 else float("inf"),
+        )
 
     def real_time_simulation_enabled(self, enabled: bool = True):
         """
@@ -393,9 +283,9 @@ class CosimExecution(Structure):
         :return: bool Successfully set real time state to desired value
         """
         if enabled:
-            return self.__enable_real_time_simulation(self.__ptr) == CosimConstants.success
+            return cosimc().cosim_execution_enable_real_time_simulation(self.__ptr) == CosimConstants.success
         else:
-            return self.__disable_real_time_simulation(self.__ptr) == CosimConstants.success
+            return cosimc().cosim_execution_disable_real_time_simulation(self.__ptr) == CosimConstants.success
 
     def real_time_factor_target(self, real_time_factor: float):
         """
@@ -404,7 +294,10 @@ class CosimExecution(Structure):
         :param float real_time_factor: Real time factor
         :return: bool Successfully set real time factor
         """
-        return self.__real_time_factor_target(self.__ptr, float(real_time_factor)) == CosimConstants.success
+        return (
+            cosimc().cosim_execution_set_real_time_factor_target(self.__ptr, float(real_time_factor))
+            == CosimConstants.success
+        )
 
     def steps_to_monitor(self, step_count: int):
         """
@@ -415,7 +308,7 @@ class CosimExecution(Structure):
         """
         assert step_count > 0, "Step count must be a positive and non-zero integer"
 
-        return self.__steps_to_monitor(self.__ptr, step_count) == CosimConstants.success
+        return cosimc().cosim_execution_set_steps_to_monitor(self.__ptr, step_count) == CosimConstants.success
 
     def add_manipulator(self, manipulator: CosimManipulator.CosimManipulator):
         """
@@ -424,7 +317,7 @@ class CosimExecution(Structure):
         :param CosimManipulator manipulator: Manipulator to be added
         :return: bool Successfully added manipulator to execution
         """
-        return self.__add_manipulator(self.__ptr, manipulator.ptr()) == CosimConstants.success
+        return cosimc().cosim_execution_add_manipulator(self.__ptr, manipulator.ptr()) == CosimConstants.success
 
     def add_observer(self, observer: CosimObserver.CosimObserver):
         """
@@ -433,7 +326,7 @@ class CosimExecution(Structure):
         :param CosimObserver observer: Observer to be added to the simulation
         :return: bool Successfully added observer to execution
         """
-        return self.__add_observer(self.__ptr, observer.ptr()) == CosimConstants.success
+        return cosimc().cosim_execution_add_observer(self.__ptr, observer.ptr()) == CosimConstants.success
 
     def load_scenario(self, manipulator: CosimManipulator.CosimManipulator, scenario_file: str):
         """
@@ -448,7 +341,10 @@ class CosimExecution(Structure):
         except AttributeError:
             raise AttributeError("Unable to encode scenario path file")
 
-        return self.__load_scenario(self.__ptr, manipulator.ptr(), encoded_path) == CosimConstants.success
+        return (
+            cosimc().cosim_execution_load_scenario(self.__ptr, manipulator.ptr(), encoded_path)
+            == CosimConstants.success
+        )
 
     def status(self):
         """
@@ -456,7 +352,7 @@ class CosimExecution(Structure):
 
         :return: CosimExecutionStatus object
         """
-        self.__status(self.__ptr, self.__execution_status_ptr)
+        cosimc().cosim_execution_get_status(self.__ptr, self.__execution_status_ptr)
         return self.execution_status
 
     def slave_infos(self):
@@ -467,17 +363,7 @@ class CosimExecution(Structure):
         """
         slave_count = self.num_slaves()
         slave_infos_list = (CosimSlave.CosimSlaveInfo * slave_count)()
-        slave_infos = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_execution_get_slave_infos",
-            argtypes=[
-                POINTER(CosimExecution),
-                CosimSlave.CosimSlaveInfo * slave_count,
-                c_size_t,
-            ],
-            restype=c_int,
-        )
-        slave_infos(self.__ptr, slave_infos_list, slave_count)
+        cosimc().cosim_execution_get_slave_infos(self.__ptr, slave_infos_list, slave_count)
         return slave_infos_list
 
     def add_local_slave(self, local_slave: CosimSlave.CosimLocalSlave):
@@ -487,7 +373,19 @@ class CosimExecution(Structure):
         :param CosimLocalSlave local_slave: Local slave to be added to the execution
         :return: int Index of the slave that has been added
         """
-        return self.__add_local_slave(self.__ptr, local_slave.ptr())
+        self.__model_index = None
+        return cosimc().cosim_execution_add_slave(self.__ptr, local_slave.ptr())
+
+    def model_index(self):
+        """
+        Returns the name lookup tables for the slaves and variables of the execution. The index is built on first call
+        and reused until a slave is added
+
+        :return: ModelIndex object
+        """
+        if self.__model_index is None:
+            self.__model_index = ModelIndex.from_execution(self)
+        return self.__model_index
 
     def slave_index_from_instance_name(self, instance_name: str):
         """
@@ -496,11 +394,7 @@ class CosimExecution(Structure):
         :param str instance_name: Name of instance
         :return: int Slave index of instance with specific name
         """
-        slave_infos_list = self.slave_infos()
-        for slave_info in slave_infos_list:
-            if slave_info.name == instance_name.encode():
-                return slave_info.index
-        return None
+        return self.model_index().find_slave_index(instance_name)
 
     def num_slave_variables(self, slave_index: int):
         """
@@ -509,7 +403,7 @@ class CosimExecution(Structure):
         :param int slave_index: Index of the slave
         :return: int Number of variables for a slave
         """
-        return self.__slave_num_variables(self.__ptr, slave_index)
+        return cosimc().cosim_slave_get_num_variables(self.__ptr, slave_index)
 
     def slave_variables(self, slave_index: int):
         """
@@ -520,20 +414,18 @@ class CosimExecution(Structure):
         """
         slave_variables_count = self.num_slave_variables(slave_index)
         slave_variables_list = (CosimSlave.CosimSlaveVariableDescription * slave_variables_count)()
-        slave_variables = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_slave_get_variables",
-            argtypes=[
-                POINTER(CosimExecution),
-                c_int,
-                CosimSlave.CosimSlaveVariableDescription * slave_variables_count,
-                c_size_t,
-            ],
-            restype=c_int,
-        )
-        slave_variables(self.__ptr, slave_index, slave_variables_list, slave_variables_count)
+        cosimc().cosim_slave_get_variables(self.__ptr, slave_index, slave_variables_list, slave_variables_count)
         return slave_variables_list
 
+    def slave_variable_table(self, slave_index: int):
+        """
+        Return variable metadata from slave as compact columns instead of one CosimSlaveVariableDescription per variable
+
+        :param int slave_index: Index of the slave
+        :return: CosimSlaveVariables table of size num_slave_variables(slave_index)
+        """
+        return CosimSlave.CosimSlaveVariables.from_descriptions(slave_index, self.slave_variables(slave_index))
+
     def real_initial_value(self, slave_index: int, variable_reference: int, value: float):
         """
         Set initial value for variable of type real
@@ -543,7 +435,10 @@ class CosimExecution(Structure):
         :param float value: Value to be set as initial value
         :return: bool Successfully set initial value
         """
-        return self.__real_initial(self.__ptr, slave_index, variable_reference, value) == CosimConstants.success
+        return (
+            cosimc().cosim_execution_set_real_initial_value(self.__ptr, slave_index, variable_reference, value)
+            == CosimConstants.success
+        )
 
     def integer_initial_value(self, slave_index: int, variable_reference: int, value: int):
         """
@@ -554,7 +449,10 @@ class CosimExecution(Structure):
         :param int value: Value to be set as initial value
         :return: bool Successfully set initial value
         """
-        return self.__integer_initial(self.__ptr, slave_index, variable_reference, value) == CosimConstants.success
+        return (
+            cosimc().cosim_execution_set_integer_initial_value(self.__ptr, slave_index, variable_reference, value)
+            == CosimConstants.success
+        )
 
     def boolean_initial_value(self, slave_index: int, variable_reference: int, value: bool):
         """
@@ -565,7 +463,10 @@ class CosimExecution(Structure):
         :param bool value: Value to be set as initial value
         :return: bool Successfully set initial value
         """
-        return self.__boolean_initial(self.__ptr, slave_index, variable_reference, value) == CosimConstants.success
+        return (
+            cosimc().cosim_execution_set_boolean_initial_value(self.__ptr, slave_index, variable_reference, value)
+            == CosimConstants.success
+        )
 
     def string_initial_value(self, slave_index: int, variable_reference: int, value: str):
         """
@@ -577,7 +478,10 @@ class CosimExecution(Structure):
         :return: bool Successfully set initial value
         """
         return (
-            self.__string_initial(self.__ptr, slave_index, variable_reference, value.encode()) == CosimConstants.success
+            cosimc().cosim_execution_set_string_initial_value(
+                self.__ptr, slave_index, variable_reference, value.encode()
+            )
+            == CosimConstants.success
         )
 
     def connect_real_variables(
@@ -594,7 +498,7 @@ class CosimExecution(Structure):
         :param int input_slave_index: Index of the slave that reads an input
         :param int input_variable_reference: Index of the input variable
         """
-        return self.__connect_real_variables(
+        return cosimc().cosim_execution_connect_real_variables(
             self.__ptr,
             output_slave_index,
             output_variable_reference,
@@ -616,7 +520,7 @@ class CosimExecution(Structure):
         :param int input_slave_index: Index of the slave that reads an input
         :param int input_variable_reference: Index of the input variable
         """
-        return self.__connect_integer_variables(
+        return cosimc().cosim_execution_connect_integer_variables(
             self.__ptr,
             output_slave_index,
             output_variable_reference,
@@ -638,7 +542,7 @@ class CosimExecution(Structure):
         :param int input_slave_index: Index of the slave that reads an input
         :param int input_variable_reference: Index of the input variable
         """
-        return self.__connect_string_variables(
+        return cosimc().cosim_execution_connect_string_variables(
             self.__ptr,
             output_slave_index,
             output_variable_reference,
@@ -660,7 +564,7 @@ class CosimExecution(Structure):
         :param int input_slave_index: Index of the slave that reads an input
         :param int input_variable_reference: Index of the input variable
         """
-        return self.__connect_boolean_variables(
+        return cosimc().cosim_execution_connect_boolean_variables(
             self.__ptr,
             output_slave_index,
             output_variable_reference,
@@ -674,13 +578,31 @@ class CosimExecution(Structure):
         """
         # Release object in C when object is removed (if pointer exists)
         if self.__ptr is not None:
-            execution_destroy = wrap_function(
-                lib=libcosimc(),
-                funcname="cosim_execution_destroy",
-                argtypes=[POINTER(CosimExecution)],
-                restype=c_int,
-            )
-            execution_destroy(self.__ptr)
+            cosimc().cosim_execution_destroy(self.__ptr)
+
+
+@dataclass
+class CosimRecording:
+    """
+    Values captured by CosimExecution.record(). For each variable type, values holds an array of shape
+    (number of samples, number of variables) whose columns are the (slave_index, value_reference) pairs in columns
+    """
+
+    time_points: npt.NDArray[np.int64]
+    values: dict[CosimEnums.CosimVariableType, npt.NDArray[Any]]
+    columns: dict[CosimEnums.CosimVariableType, list[tuple[int, int]]]
+    steps_per_second: float
+
+    def column(self, slave_index: int, value_reference: int, variable_type: CosimEnums.CosimVariableType):
+        """
+        Samples of one recorded variable
+
+        :param int slave_index: Index of slave with variable
+        :param int value_reference: Reference of variable within slave
+        :param CosimVariableType variable_type: Data type of the variable
+        :return: Array of samples, one per time point
+        """
+        return self.values[variable_type][:, self.columns[variable_type].index((slave_index, value_reference))]
 
 
 class CosimExecutionStatus(Structure):
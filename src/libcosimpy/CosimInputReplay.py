@@ -0,0 +1,329 @@
+import csv
+import queue
+import threading
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ._internal import get_last_error_message
+from .CosimEnums import CosimVariableType
+from .CosimExecution import CosimExecution
+from .CosimManipulator import CosimManipulator
+
+# File formats recognised from the file suffix
+_FORMATS = {
+    ".csv": "csv",
+    ".txt": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".npy": "npy",
+}
+
+
+class InputReplay:
+    """
+    Replays recorded input data from a CSV, Parquet or NumPy file into variables of an execution through an override
+    manipulator. The file is read in chunks on a background thread into a bounded queue, so only a few chunks are held
+    in memory and stepping does not wait for I/O as long as reading keeps ahead of the simulation.
+
+    With a time column each variable holds the value of the last row at or before the start of each step. Without one
+    row n is applied before step n. Values are only written when a step moves to a new row
+    """
+
+    def __init__(
+        self,
+        execution: CosimExecution,
+        path: str,
+        step_size: int | float,
+        columns: Optional[Mapping[str, str | tuple[int, int, CosimVariableType]]] = None,
+        time_column: Optional[str] = "time",
+        time_scale: float = 1e9,
+        manipulator: Optional[CosimManipulator] = None,
+        chunk_size: int = 65536,
+        prefetch: int = 4,
+        file_format: Optional[str] = None,
+    ):
+        """
+        :param CosimExecution execution: Execution to drive
+        :param str path: Path to .csv, .parquet or .npy file. NumPy files must hold a structured array with named fields
+        :param int step_size: Step size of the execution in nanos
+        :param dict columns: Optional mapping from column name to "instance.variable" name or (slave_index,
+            value_reference, variable_type). Defaults to every column except the time column, named "instance.variable"
+        :param str time_column: Name of the column holding sample times, or None to apply one row per step
+        :param float time_scale: Nanos per unit of the time column. Default 1e9 for times in seconds
+        :param CosimManipulator manipulator: Optional override manipulator already added to the execution. A new one is
+            created and added if not given
+        :param int chunk_size: Number of rows read at a time. Default 65536
+        :param int prefetch: Maximum number of chunks read ahead of the simulation. Default 4
+        :param str file_format: "csv", "parquet" or "npy". Detected from the file suffix if not given
+        """
+        assert step_size > 0, "Step size must be a positive and non-zero integer"
+        assert chunk_size > 0, "Chunk size must be a positive and non-zero integer"
+        assert prefetch > 0, "Prefetch must be a positive and non-zero integer"
+        self.__queue: queue.Queue[Any] = queue.Queue(maxsize=prefetch)
+        self.__stop = threading.Event()
+        self.execution = execution
+        self.path = Path(path)
+        self.step_size = int(step_size)
+        self.time_scale = time_scale
+        self.file_format = file_format or _FORMATS.get(self.path.suffix.lower())
+        if self.file_format not in _FORMATS.values():
+            raise ValueError(f"Unable to determine file format of {self.path}. Pass file_format explicitly")
+
+        names = _column_names(self.path, self.file_format)
+        if time_column is not None and time_column not in names:
+            raise ValueError(f"Time column '{time_column}' not found in {self.path}")
+        if columns is None:
+            columns = {name: name for name in names if name != time_column}
+        missing = [name for name in columns if name not in names]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in {self.path}")
+
+        self.targets: list[tuple[int, int, CosimVariableType]] = []
+        for name, target in columns.items():
+            if isinstance(target, str):
+                variable = execution.model_index().resolve(target)
+                target = (variable.slave_index, variable.value_reference, variable.type)
+            if CosimVariableType(target[2]) == CosimVariableType.STRING:
+                raise ValueError(f"Column '{name}' maps to a string variable, which can not be replayed")
+            self.targets.append((int(target[0]), int(target[1]), CosimVariableType(target[2])))
+        self.columns = list(columns)
+        self.time_column = time_column
+
+        if manipulator is None:
+            manipulator = CosimManipulator.create_override()
+            if not execution.add_manipulator(manipulator):
+                raise RuntimeError(f"Unable to add override manipulator: {get_last_error_message()}")
+        self.manipulator = manipulator
+        self.__plan = manipulator.write_plan(self.targets)
+
+        # Chunk being replayed, the first of its rows not yet in effect and the row in effect
+        self.__times: npt.NDArray[np.float64] = np.empty(0)
+        self.__values: npt.NDArray[np.float64] = np.empty((0, len(self.targets)))
+        self.__next_row = 0
+        self.__current: Optional[npt.NDArray[np.float64]] = None
+        self.__exhausted = False
+        self.__start_time: Optional[int] = None
+        self.stall_count = 0
+
+        names = [*([] if time_column is None else [time_column]), *self.columns]
+        self.__thread = threading.Thread(
+            target=_read_into,
+            args=(
+                _read_chunks(self.path, self.file_format, names, chunk_size),
+                time_column is not None,
+                self.__queue,
+                self.__stop,
+            ),
+            name="cosim-input-replay",
+            daemon=True,
+        )
+        self.__thread.start()
+
+    def step(self, step_count: int = 1) -> bool:
+        """
+        Advance the execution for 1 or multiple steps, setting the replayed variables before each step
+
+        :param int step_count: Number of steps to advance with default of 1
+        :return: bool Successful step execution
+        """
+        execution, plan = self.execution, self.__plan
+        step_time = execution.status().current_time
+        if self.__start_time is None:
+            self.__start_time = step_time
+        for _ in range(step_count):
+            # Time in the units of the time column, or the row number when replaying one row per step
+            if self.time_column is None:
+                position = (step_time - self.__start_time) // self.step_size
+            else:
+                position = step_time / self.time_scale
+            if self.__advance(position) and not plan.apply(self.__current):
+                return False
+            if not execution.step():
+                return False
+            step_time += self.step_size
+        return True
+
+    def simulate_until(self, target_time: int | float) -> bool:
+        """
+        Step the execution until target time is reached
+
+        :param int target_time: End of simulation time in nanos
+        :return: bool Successful simulation until target time
+        """
+        remaining = int(target_time) - self.execution.status().current_time
+        return self.step(-(-remaining // self.step_size)) if remaining > 0 else True
+
+    def close(self):
+        """
+        Stop the background reader. Overrides already written stay in effect
+        """
+        self.__stop.set()
+        # Unblock the reader if it is waiting for space in the queue
+        while self.__thread.is_alive():
+            try:
+                self.__queue.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        self.__thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_: object):
+        self.close()
+
+    def __del__(self):
+        self.__stop.set()
+
+    def __advance(self, position: float) -> bool:
+        """
+        Helper function moving to the last row at or before position. Returns True if the row in effect changed
+        """
+        changed = False
+        while True:
+            if self.__next_row < len(self.__times):
+                if self.__times[self.__next_row] > position:
+                    return changed
+                end = int(np.searchsorted(self.__times, position, side="right"))
+                self.__current = self.__values[end - 1]
+                self.__next_row = end
+                changed = True
+                if end < len(self.__times):
+                    return changed
+            # All rows of the chunk are at or before position, so later rows may be in the next chunk
+            if self.__exhausted:
+                return changed
+            chunk = self.__next_chunk()
+            if chunk is None:
+                self.__exhausted = True
+                return changed
+            self.__times, self.__values = chunk
+            self.__next_row = 0
+
+    def __next_chunk(self) -> Optional[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]]:
+        """
+        Helper function taking the next chunk from the reader, counting waits on an empty queue as stalls
+        """
+        try:
+            item = self.__queue.get_nowait()
+        except queue.Empty:
+            self.stall_count += 1
+            item = self.__wait_for_chunk()
+        # The reader thread puts chunks, None at the end of the file, or the error that stopped it
+        if item is None or isinstance(item, tuple):
+            return item
+        raise RuntimeError(f"Reading {self.path} failed") from item
+
+    def __wait_for_chunk(self) -> Any:
+        """
+        Helper function waiting for the next item from the reader, raising RuntimeError if the replay is closed or the
+        reader thread has exited without leaving one
+        """
+        while True:
+            try:
+                return self.__queue.get(timeout=0.05)
+            except queue.Empty:
+                pass
+            if self.__stop.is_set():
+                raise RuntimeError(f"Replay of {self.path} is closed")
+            if not self.__thread.is_alive():
+                # The reader may have put its last item just before exiting
+                try:
+                    return self.__queue.get_nowait()
+                except queue.Empty:
+                    raise RuntimeError(f"Reader of {self.path} exited without a result") from None
+
+
+def _read_into(
+    chunks: Iterator[npt.NDArray[np.float64]],
+    timed: bool,
+    chunk_queue: "queue.Queue[Any]",
+    stop: threading.Event,
+):
+    """
+    Background thread putting (times, values) chunks in the queue until the file ends or stop is set. Kept apart from
+    InputReplay so the thread does not keep the replay alive
+    """
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                chunk_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    first_row = 0
+    try:
+        for chunk in chunks:
+            if timed:
+                times, values = np.ascontiguousarray(chunk[:, 0]), np.ascontiguousarray(chunk[:, 1:])
+            else:
+                times, values = np.arange(first_row, first_row + len(chunk), dtype=np.float64), chunk
+            first_row += len(chunk)
+            if not put((times, values)):
+                return
+        put(None)
+    except Exception as error:  # noqa: BLE001 - Any error is passed on to the thread reading the queue
+        put(error)
+
+
+def _column_names(path: Path, file_format: str) -> list[str]:
+    """
+    Column names of a replay file, read without loading its rows
+    """
+    if file_format == "csv":
+        with open(path, newline="") as file:
+            return [name.strip() for name in next(csv.reader(file))]
+    if file_format == "parquet":
+        return list(_parquet().ParquetFile(path).schema_arrow.names)
+    fields = np.load(path, mmap_mode="r").dtype.names
+    if fields is None:
+        raise ValueError(f"{path} must hold a structured array with named fields")
+    return list(fields)
+
+
+def _read_chunks(path: Path, file_format: str, names: list[str], chunk_size: int) -> Iterator[npt.NDArray[np.float64]]:
+    """
+    Rows of the named columns, as float arrays of at most chunk_size rows
+    """
+    if file_format == "csv":
+        with open(path, newline="") as file:
+            reader = csv.reader(file)
+            header = [name.strip() for name in next(reader)]
+            indices = [header.index(name) for name in names]
+            rows: list[list[str]] = []
+            for row in reader:
+                if row:
+                    rows.append([row[i] for i in indices])
+                if len(rows) == chunk_size:
+                    yield np.array(rows, dtype=np.float64)
+                    rows = []
+            if rows:
+                yield np.array(rows, dtype=np.float64)
+    elif file_format == "parquet":
+        for batch in _parquet().ParquetFile(path).iter_batches(batch_size=chunk_size, columns=names):
+            yield np.column_stack([batch.column(name).to_numpy(zero_copy_only=False) for name in names]).astype(
+                np.float64
+            )
+    else:
+        data = np.load(path, mmap_mode="r")
+        for start in range(0, len(data), chunk_size):
+            chunk = data[start : start + chunk_size]
+            yield np.column_stack([chunk[name] for name in names]).astype(np.float64)
+
+
+def _parquet() -> Any:
+    """
+    Import pyarrow.parquet on first use, since pyarrow is an optional dependency
+    """
+    try:
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError("Reading Parquet files requires pyarrow. Install libcosimpy[parquet]") from error
+    return pyarrow.parquet
@@ -0,0 +1,222 @@
+import fnmatch
+import os
+import shutil
+import tempfile
+import warnings
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple, Optional
+from xml.sax.saxutils import quoteattr
+
+from .CosimEnums import CosimVariableType
+from .CosimModelIndex import ModelIndex
+from .CosimObserver import CosimObserver
+
+if TYPE_CHECKING:
+    from .CosimExecution import CosimExecution
+
+LOG_CONFIG_NAMESPACE = "http://opensimulationplatform.com/LogConfig"
+
+# Widest field the file observer writes for each variable type, including the separating comma. Reals are written
+# with 6 significant digits, such as -1.23457e+06. String lengths are unknown, so a typical length is assumed
+FIELD_BYTES = {
+    CosimVariableType.REAL: 13,
+    CosimVariableType.INTEGER: 12,
+    CosimVariableType.BOOLEAN: 2,
+    CosimVariableType.STRING: 17,
+}
+# Widest Time and StepCount fields and the line break of every row
+ROW_OVERHEAD_BYTES = 13 + 11 + 1
+
+
+class SimulatorVolume(NamedTuple):
+    """
+    Estimated output of the CSV log of one simulator
+    """
+
+    instance_name: str
+    variable_count: int
+    decimation_factor: int
+    row_bytes: int
+    rows_per_second: float
+    bytes_per_second: float
+
+
+@dataclass
+class LogVolume:
+    """
+    Estimated output of a log configuration. Estimates are upper bounds on the CSV size, since every field is counted
+    at its widest
+    """
+
+    simulators: list[SimulatorVolume]
+    duration: Optional[int]
+
+    @property
+    def bytes_per_second(self) -> float:
+        """
+        Bytes written per second of simulated time by all simulators
+        """
+        return sum(simulator.bytes_per_second for simulator in self.simulators)
+
+    @property
+    def bytes_per_run(self) -> Optional[float]:
+        """
+        Bytes written by a run of the estimated duration, or None if no duration was given
+        """
+        if self.duration is None:
+            return None
+        return sum(
+            simulator.row_bytes * (self.duration * simulator.rows_per_second / 1e9 + 1) for simulator in self.simulators
+        )
+
+
+class LogConfig:
+    """
+    Builds a LogConfig.xml file for CosimObserver.from_cfg() from variable selections resolved against the variable
+    metadata of an execution. Only the selected variables of the added simulators are logged, and each simulator
+    writes a row every decimation_factor steps. The size of the logs is estimated from the selection before the
+    simulation starts, and create_observer() warns when a run would exceed a byte budget or the free disk space
+    """
+
+    def __init__(self, model_index: ModelIndex, step_size: int | float):
+        """
+        :param ModelIndex model_index: Metadata of the execution to log
+        :param int step_size: Step size of the execution in nanos. Slaves with a longer step size than this write fewer
+            rows than estimated
+        """
+        assert step_size > 0, "Step size must be a positive and non-zero integer"
+        self.model_index = model_index
+        self.step_size = int(step_size)
+        self.__simulators: dict[str, tuple[list[str], int]] = {}
+
+    @classmethod
+    def from_execution(cls, execution: "CosimExecution", step_size: int | float):
+        """
+        Build a log configuration for the slaves of an execution
+
+        :param CosimExecution execution: Execution to log
+        :param int step_size: Step size of the execution in nanos
+        :return: LogConfig object
+        """
+        return cls(execution.model_index(), step_size)
+
+    def add(
+        self, instance_name: str, variables: Optional[Sequence[str]] = None, decimation_factor: int = 1
+    ) -> "LogConfig":
+        """
+        Log variables of a simulator. Adding a simulator again replaces its selection
+
+        :param str instance_name: Name of instance
+        :param list of str variables: Optional variable names, which may be shell-style patterns such as "Motor.*".
+            All variables are logged if not given
+        :param int decimation_factor: Write a row every decimation_factor steps. Default 1
+        :return: The configuration, so calls can be chained
+        """
+        assert decimation_factor > 0, "Decimation factor must be a positive and non-zero integer"
+        if instance_name not in self.model_index:
+            raise ValueError(f"Slave instance '{instance_name}' not found in the execution")
+        names = self.model_index.variables(instance_name).names
+        if variables is None:
+            selected = list(names)
+        else:
+            selected = []
+            for pattern in variables:
+                matches = [name for name in names if fnmatch.fnmatchcase(name, pattern)]
+                if not matches:
+                    raise ValueError(f"No variable of '{instance_name}' matches '{pattern}'")
+                selected.extend(name for name in matches if name not in selected)
+        self.__simulators[instance_name] = (selected, decimation_factor)
+        return self
+
+    def to_xml(self) -> str:
+        """
+        LogConfig.xml content of the configuration
+
+        :return: str XML document
+        """
+        lines = ['<?xml version="1.0" encoding="UTF-8"?>', f"<simulators xmlns={quoteattr(LOG_CONFIG_NAMESPACE)}>"]
+        for instance_name, (variables, decimation_factor) in self.__simulators.items():
+            lines.append(
+                f"    <simulator name={quoteattr(instance_name)} decimationFactor={quoteattr(str(decimation_factor))}>"
+            )
+            lines.extend(f"        <variable name={quoteattr(name)}/>" for name in variables)
+            lines.append("    </simulator>")
+        lines.append("</simulators>")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Optional[str | os.PathLike[str]] = None) -> str:
+        """
+        Write the configuration to a file
+
+        :param str path: Optional path to write to. A temporary file is created if not given
+        :return: str Path of the written file
+        """
+        if path is None:
+            file_descriptor, path = tempfile.mkstemp(prefix="LogConfig-", suffix=".xml")
+            os.close(file_descriptor)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.to_xml())
+        return os.fspath(path)
+
+    def estimate(self, duration: Optional[int | float] = None) -> LogVolume:
+        """
+        Estimate the size of the logs written by the configuration
+
+        :param int duration: Optional simulated duration of a run in nanos, to estimate bytes_per_run
+        :return: LogVolume with the estimated output of each simulator
+        """
+        simulators = []
+        for instance_name, (variables, decimation_factor) in self.__simulators.items():
+            table = self.model_index.variables(instance_name)
+            row_bytes = ROW_OVERHEAD_BYTES + sum(FIELD_BYTES[table.info(name).type] for name in variables)
+            rows_per_second = 1e9 / (self.step_size * decimation_factor)
+            simulators.append(
+                SimulatorVolume(
+                    instance_name=instance_name,
+                    variable_count=len(variables),
+                    decimation_factor=decimation_factor,
+                    row_bytes=row_bytes,
+                    rows_per_second=rows_per_second,
+                    bytes_per_second=row_bytes * rows_per_second,
+                )
+            )
+        return LogVolume(simulators=simulators, duration=None if duration is None else int(duration))
+
+    def create_observer(
+        self, log_dir: str, duration: Optional[int | float] = None, budget_bytes: Optional[int] = None
+    ) -> CosimObserver:
+        """
+        Create a file observer logging the configured variables. When a duration is given, warns if a run is
+        estimated to write more than budget_bytes or more than the free space in log_dir
+
+        :param str log_dir: Directory of output log files
+        :param int duration: Optional simulated duration of a run in nanos
+        :param int budget_bytes: Optional number of bytes a run may write
+        :return: CosimObserver object
+        """
+        assert budget_bytes is None or duration is not None, "A duration is required to check the byte budget"
+        if not self.__simulators:
+            raise ValueError("No simulators to log. Add simulators with add()")
+        bytes_per_run = self.estimate(duration).bytes_per_run
+        if bytes_per_run is not None:
+            os.makedirs(log_dir, exist_ok=True)
+            free_bytes = shutil.disk_usage(log_dir).free
+            if budget_bytes is not None and bytes_per_run > budget_bytes:
+                warnings.warn(
+                    f"Logging is estimated to write {bytes_per_run / 1e6:.1f} MB per run, "
+                    f"over the budget of {budget_bytes / 1e6:.1f} MB",
+                    stacklevel=2,
+                )
+            if bytes_per_run > free_bytes:
+                warnings.warn(
+                    f"Logging is estimated to write {bytes_per_run / 1e6:.1f} MB per run, "
+                    f"more than the {free_bytes / 1e6:.1f} MB free in {log_dir}",
+                    stacklevel=2,
+                )
+        # The file observer reads the configuration when it is created
+        cfg_path = self.write()
+        try:
+            return CosimObserver.from_cfg(cfg_path, log_dir)
+        finally:
+            os.remove(cfg_path)
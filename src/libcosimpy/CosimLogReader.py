@@ -0,0 +1,319 @@
+import io
+import os
+import re
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .CosimEnums import CosimVariableType
+from .CosimModelIndex import ModelIndex
+
+# Columns written by the file observer before the variables
+TIME_COLUMN = "Time"
+STEP_COLUMN = "StepCount"
+
+# File observer log names are <instance name>_<date>_<time>_<microseconds>.csv
+_LOG_NAME = re.compile(r"^(?P<instance>.+)_(?P<stamp>\d{8}_\d{6}_\d+)\.csv$")
+
+_COLUMN_DTYPES = {
+    CosimVariableType.REAL: np.dtype(np.float64),
+    CosimVariableType.INTEGER: np.dtype(np.int32),
+    CosimVariableType.BOOLEAN: np.dtype(np.bool_),
+    CosimVariableType.STRING: np.dtype(object),
+}
+
+# Sidecar index layout version. Indexes of another version are rebuilt
+INDEX_VERSION = 1
+
+
+def log_files(log_dir: str | os.PathLike[str]) -> dict[str, Path]:
+    """
+    Newest CSV log of each slave in a file observer log directory
+
+    :param str log_dir: Directory given to CosimObserver.create_to_dir() or from_cfg()
+    :return: dict from instance name to log file path
+    """
+    newest: dict[str, tuple[str, Path]] = {}
+    for path in Path(log_dir).glob("*.csv"):
+        match = _LOG_NAME.match(path.name)
+        if match is None:
+            continue
+        instance_name, stamp = match.group("instance"), match.group("stamp")
+        if instance_name not in newest or stamp > newest[instance_name][0]:
+            newest[instance_name] = (stamp, path)
+    return {instance_name: path for instance_name, (_, path) in sorted(newest.items())}
+
+
+class LogReader:
+    """
+    Reads a CSV log written by a file observer into typed NumPy columns. Column types are taken from the variable
+    metadata of the slave, given as a ModelIndex or read from the _metadata.yaml file written next to the log.
+
+    The file is parsed in chunks of about chunk_size bytes, converting only the requested columns, so memory use is
+    bounded by the chunk size and the selected data. Time ranges stop parsing at the first row after the range. With
+    index=True, a sidecar index of the byte offset and time of every chunk is kept next to the log, so reads of a
+    later time range seek directly to it
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        model_index: Optional[ModelIndex] = None,
+        instance_name: Optional[str] = None,
+        index: bool = False,
+        chunk_size: int = 1 << 24,
+    ):
+        """
+        :param str path: Path to CSV log file
+        :param ModelIndex model_index: Optional metadata of the execution the log was written from
+        :param str instance_name: Optional instance name of the slave. Taken from the file name if not given
+        :param bool index: Use and maintain a sidecar index file. Default False
+        :param int chunk_size: Approximate number of bytes parsed at a time. Default 16 MiB
+        """
+        assert chunk_size > 0, "Chunk size must be a positive and non-zero integer"
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        if instance_name is None:
+            match = _LOG_NAME.match(self.path.name)
+            instance_name = match.group("instance") if match else self.path.stem
+        self.instance_name = instance_name
+
+        with open(self.path, "rb") as file:
+            header = file.readline()
+        self.columns = header.decode().rstrip("\r\n").split(",")
+        self.__data_offset = len(header)
+
+        if model_index is not None:
+            table = model_index.variables(instance_name)
+            types = dict(zip(table.names, (CosimVariableType(t) for t in table.types), strict=True))
+        else:
+            types = _metadata_types(self.path)
+        self.column_types: dict[str, np.dtype[Any]] = {
+            TIME_COLUMN: np.dtype(np.float64),
+            STEP_COLUMN: np.dtype(np.int64),
+        }
+        for name in self.columns[2:]:
+            self.column_types[name] = _COLUMN_DTYPES[types[name]] if name in types else np.dtype(np.float64)
+
+        self.__index: Optional[tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]] = None
+        if index:
+            self.__index = self.__load_index() or self.build_index()
+
+    def read(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start_time: Optional[float] = None,
+        stop_time: Optional[float] = None,
+    ) -> dict[str, npt.NDArray[Any]]:
+        """
+        Read columns of the rows in a time range
+
+        :param list of str columns: Optional columns to read besides Time and StepCount. Defaults to all
+        :param float start_time: Optional start of the time range in seconds, inclusive
+        :param float stop_time: Optional end of the time range in seconds, exclusive
+        :return: dict from column name to array
+        """
+        names = self.__projection(columns)
+        chunks = list(self.chunks(columns, start_time, stop_time))
+        if not chunks:
+            return {name: np.empty(0, dtype=self.column_types[name]) for name in names}
+        return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in names}
+
+    def read_frame(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start_time: Optional[float] = None,
+        stop_time: Optional[float] = None,
+    ) -> Any:
+        """
+        Read columns of the rows in a time range into a pandas DataFrame. Requires pandas
+
+        :param list of str columns: Optional columns to read besides Time and StepCount. Defaults to all
+        :param float start_time: Optional start of the time range in seconds, inclusive
+        :param float stop_time: Optional end of the time range in seconds, exclusive
+        :return: pandas.DataFrame with one column per read column
+        """
+        return _pandas().DataFrame(self.read(columns, start_time, stop_time), copy=False)
+
+    def chunks(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        start_time: Optional[float] = None,
+        stop_time: Optional[float] = None,
+    ) -> Iterator[dict[str, npt.NDArray[Any]]]:
+        """
+        Generator reading columns of the rows in a time range one chunk at a time
+
+        :param list of str columns: Optional columns to read besides Time and StepCount. Defaults to all
+        :param float start_time: Optional start of the time range in seconds, inclusive
+        :param float stop_time: Optional end of the time range in seconds, exclusive
+        :return: Generator of dicts from column name to array, with the rows of one chunk each
+        """
+        names = self.__projection(columns)
+        numeric = [name for name in names if self.column_types[name] != np.dtype(object)]
+        strings = [name for name in names if self.column_types[name] == np.dtype(object)]
+        positions = {name: position for position, name in enumerate(self.columns)}
+        # Booleans are written as 0 and 1, and parsed as integers
+        parse_dtype = np.dtype(
+            [
+                (name, np.int8 if self.column_types[name] == np.dtype(np.bool_) else self.column_types[name])
+                for name in numeric
+            ]
+        )
+        usecols = [positions[name] for name in numeric]
+
+        with open(self.path, "rb") as file:
+            file.seek(self.__start_offset(start_time))
+            remainder = b""
+            while True:
+                block = file.read(self.chunk_size)
+                at_end = len(block) < self.chunk_size
+                # Keep a partial last line for the next block. At the end of the file it is a row still being written
+                block = remainder + block
+                end = block.rfind(b"\n") + 1
+                lines, remainder = block[:end], block[end:]
+                if not lines.strip():
+                    if at_end:
+                        return
+                    continue
+
+                text = lines.decode()
+                parsed = np.loadtxt(io.StringIO(text), delimiter=",", usecols=usecols, dtype=parse_dtype, ndmin=1)
+                chunk: dict[str, npt.NDArray[Any]] = {}
+                for name in numeric:
+                    chunk[name] = parsed[name].astype(self.column_types[name], copy=False)
+                if strings:
+                    rows = [line.split(",") for line in text.splitlines() if line]
+                    for name in strings:
+                        chunk[name] = np.array([row[positions[name]] for row in rows], dtype=object)
+
+                times = chunk[TIME_COLUMN]
+                selected = np.ones(len(times), dtype=np.bool_)
+                if start_time is not None:
+                    selected &= times >= start_time
+                done = False
+                if stop_time is not None:
+                    selected &= times < stop_time
+                    done = len(times) > 0 and times[-1] >= stop_time
+                if not selected.all():
+                    chunk = {name: values[selected] for name, values in chunk.items()}
+                if len(chunk[TIME_COLUMN]):
+                    yield {name: chunk[name] for name in names}
+                if done:
+                    return
+
+    def build_index(self) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+        """
+        Scan the log for the byte offset and time of the first row of every chunk and write them to the sidecar index
+        file. Only the first field of one row per chunk is parsed
+
+        :return: tuple of arrays Byte offsets and times of the indexed rows
+        """
+        offsets: list[int] = []
+        times: list[float] = []
+        with open(self.path, "rb") as file:
+            offset = self.__data_offset
+            file.seek(offset)
+            while True:
+                line = file.readline()
+                if not line.endswith(b"\n"):
+                    break
+                offsets.append(offset)
+                times.append(float(line.split(b",", 1)[0]))
+                # Skip ahead by a chunk and realign to the start of the next line
+                file.seek(offset + len(line) + self.chunk_size)
+                skipped = file.readline()
+                if not skipped.endswith(b"\n"):
+                    break
+                offset = file.tell()
+            size = os.fstat(file.fileno()).st_size
+
+        index = (np.array(offsets, dtype=np.int64), np.array(times, dtype=np.float64))
+        np.savez(
+            self.__index_path(),
+            version=INDEX_VERSION,
+            chunk_size=self.chunk_size,
+            size=size,
+            offsets=index[0],
+            times=index[1],
+        )
+        self.__index = index
+        return index
+
+    def __projection(self, columns: Optional[Sequence[str]]) -> list[str]:
+        """
+        Helper function listing the columns to read, always starting with Time and StepCount
+        """
+        if columns is None:
+            return list(self.columns)
+        missing = [name for name in columns if name not in self.column_types]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in {self.path}")
+        return [TIME_COLUMN, STEP_COLUMN, *[name for name in columns if name not in (TIME_COLUMN, STEP_COLUMN)]]
+
+    def __start_offset(self, start_time: Optional[float]) -> int:
+        """
+        Helper function returning the byte offset of the last indexed row at or before start_time
+        """
+        if start_time is None or self.__index is None or not len(self.__index[0]):
+            return self.__data_offset
+        offsets, times = self.__index
+        position = int(np.searchsorted(times, start_time, side="right")) - 1
+        return int(offsets[position]) if position >= 0 else self.__data_offset
+
+    def __index_path(self) -> Path:
+        """
+        Helper function returning the path of the sidecar index file
+        """
+        return self.path.with_name(f"{self.path.name}.index.npz")
+
+    def __load_index(self) -> Optional[tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]]:
+        """
+        Helper function loading the sidecar index if it was built for this log at its current size with the same
+        chunk size
+        """
+        try:
+            with np.load(self.__index_path()) as index:
+                if int(index["version"]) != INDEX_VERSION or int(index["chunk_size"]) != self.chunk_size:
+                    return None
+                if int(index["size"]) != self.path.stat().st_size:
+                    return None
+                return index["offsets"], index["times"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+def _metadata_types(path: Path) -> dict[str, CosimVariableType]:
+    """
+    Variable types listed in the _metadata.yaml file written by the file observer next to a log, parsed line by line
+    so that no YAML library is needed
+    """
+    metadata_path = path.with_name(f"{path.stem}_metadata.yaml")
+    types: dict[str, CosimVariableType] = {}
+    try:
+        with open(metadata_path, encoding="utf-8") as file:
+            name: Optional[str] = None
+            for line in file:
+                key, _, value = line.strip().removeprefix("- ").partition(":")
+                if key == "name":
+                    name = value.strip()
+                elif key == "type" and name is not None:
+                    types[name] = CosimVariableType[value.strip().upper()]
+                    name = None
+    except (OSError, KeyError):
+        return {}
+    return types
+
+
+def _pandas() -> Any:
+    """
+    Import pandas on first use, since pandas is an optional dependency
+    """
+    try:
+        import pandas
+    except ImportError as error:
+        raise ImportError("Reading logs into DataFrames requires pandas. Install libcosimpy[pandas]") from error
+    return pandas
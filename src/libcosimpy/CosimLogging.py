@@ -1,5 +1,4 @@
-from ctypes import c_int
-from ._internal import wrap_function, libcosimc
+from ._bindings import cosimc
 
 from enum import Enum
 
@@ -23,10 +22,4 @@ def log_output_level(log_level: CosimLogLevel):
 
     :param CosimLogLevel log_level:
     """
-    log_output_level_set = wrap_function(
-        lib=libcosimc(),
-        funcname="cosim_log_set_output_level",
-        argtypes=[c_int],
-        restype=None,
-    )
-    log_output_level_set(log_level.value)
+    cosimc().cosim_log_set_output_level(log_level.value)
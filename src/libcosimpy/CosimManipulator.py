@@ -1,3 +1,4 @@
+from collections.abc import Mapping, Sequence
 from ctypes import (
     POINTER,
     Structure,
@@ -5,15 +6,17 @@ from ctypes import (
     c_char_p,
     c_double,
     c_int,
-    c_int64,
-    c_size_t,
     c_uint32,
 )
-from typing import TYPE_CHECKING, Optional, Any, Sequence
+from typing import TYPE_CHECKING, Optional, Any
+
+import numpy as np
+import numpy.typing as npt
 
 from . import CosimConstants
 from .CosimEnums import CosimVariableType
-from ._internal import wrap_function, libcosimc
+from ._bindings import cosimc
+from ._internal import VARIABLE_CTYPES, VARIABLE_DTYPES, as_pointer
 
 if TYPE_CHECKING:
     from ctypes import _Pointer  # pyright: ignore[reportPrivateUsage]
@@ -48,12 +51,6 @@ class CosimManipulator(Structure):
         )
         # Store the pointer used by the C library
         self.__ptr = manipulator_ptr
-        self.__abort = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_scenario_abort",
-            argtypes=[POINTER(CosimManipulator)],
-            restype=c_int,
-        )
 
     @classmethod
     def create_override(cls):
@@ -62,13 +59,7 @@ class CosimManipulator(Structure):
 
         :return: CosimManipulator object from constructor
         """
-        override_manipulator_create = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_override_manipulator_create",
-            argtypes=[],
-            restype=POINTER(CosimManipulator),
-        )
-        manipulator_ptr = override_manipulator_create()
+        manipulator_ptr = cosimc().cosim_override_manipulator_create()
         return cls(cls.__create_key, manipulator_ptr)
 
     @classmethod
@@ -78,13 +69,7 @@ class CosimManipulator(Structure):
 
         :return CosimManipulator object from constructor
         """
-        scenario_manager_create = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_scenario_manager_create",
-            argtypes=[],
-            restype=POINTER(CosimManipulator),
-        )
-        manipulator_ptr = scenario_manager_create()
+        manipulator_ptr = cosimc().cosim_scenario_manager_create()
         return cls(cls.__create_key, manipulator_ptr)
 
     """def is_scenario_running(self):
@@ -101,7 +86,7 @@ class CosimManipulator(Structure):
 
         :return: bool Successfully aborted the scenario
         """
-        return self.__abort(self.__ptr) == CosimConstants.success
+        return cosimc().cosim_scenario_abort(self.__ptr) == CosimConstants.success
 
     def __slave_values(
         self, slave_index: int, variable_references: list[int], values: Sequence[int | float | bytes], c_type: Any
@@ -125,18 +110,7 @@ class CosimManipulator(Structure):
         variable_array = (c_uint32 * variable_count)(*variable_references)
         value_array = (c_type * variable_count)(*values)
 
-        slave_values = wrap_function(
-            lib=libcosimc(),
-            funcname=funcname,
-            argtypes=[
-                POINTER(CosimManipulator),
-                c_int,
-                c_uint32 * variable_count,
-                c_size_t,
-                c_type * variable_count,
-            ],
-            restype=c_int,
-        )
+        slave_values = getattr(cosimc(), funcname)
 
         return (
             slave_values(self.__ptr, slave_index, variable_array, variable_count, value_array) == CosimConstants.success
@@ -219,21 +193,8 @@ class CosimManipulator(Structure):
 
         variable_array = (c_uint32 * variable_count)(*variable_references)
 
-        slave_reset = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_manipulator_slave_reset",
-            argtypes=[
-                POINTER(CosimManipulator),
-                c_int,
-                c_int,
-                c_uint32 * variable_count,
-                c_size_t,
-            ],
-            restype=c_int,
-        )
-
         return (
-            slave_reset(
+            cosimc().cosim_manipulator_slave_reset(
                 self.__ptr,
                 slave_index,
                 variable_type.value,
@@ -243,6 +204,15 @@ class CosimManipulator(Structure):
             == CosimConstants.success
         )
 
+    def write_plan(self, targets: Sequence[tuple[int, int, CosimVariableType]]):
+        """
+        Create a reusable plan for overriding the same set of variables repeatedly, across slaves and variable types
+
+        :param list of tuple targets: (slave_index, value_reference, variable_type) of each variable to override
+        :return: WritePlan object
+        """
+        return WritePlan(manipulator=self, targets=targets)
+
     def ptr(self):
         """
         Helper function intended to be used by other libcosim c classes
@@ -255,10 +225,175 @@ class CosimManipulator(Structure):
         Releases C objects when CosimManipulator is deleted in python
         """
         if self.__ptr is not None:
-            manipulator_destroy = wrap_function(
-                lib=libcosimc(),
-                funcname="cosim_manipulator_destroy",
-                argtypes=[POINTER(CosimManipulator)],
-                restype=c_int64,
+            cosimc().cosim_manipulator_destroy(self.__ptr)
+
+
+_SET_FUNCNAMES = {
+    CosimVariableType.REAL: "cosim_manipulator_slave_set_real",
+    CosimVariableType.INTEGER: "cosim_manipulator_slave_set_integer",
+    CosimVariableType.BOOLEAN: "cosim_manipulator_slave_set_boolean",
+    CosimVariableType.STRING: "cosim_manipulator_slave_set_string",
+}
+
+
+class _WriteGroup:
+    """
+    Targets of a write plan sharing slave and variable type, written with a single C call
+    """
+
+    def __init__(self, slave_index: int, variable_type: CosimVariableType, positions: list[int], references: list[int]):
+        self.slave_index = slave_index
+        self.variable_type = variable_type
+        self.set_values = getattr(cosimc(), _SET_FUNCNAMES[variable_type])
+        self.c_type = VARIABLE_CTYPES[variable_type]
+        # Position of each variable of the group in the values passed to WritePlan.apply()
+        self.positions = np.array(positions, dtype=np.intp)
+        self.references = np.array(references, dtype=np.uint32)
+        self.references_ptr = as_pointer(self.references, c_uint32)
+        self.count = len(references)
+        if variable_type == CosimVariableType.STRING:
+            self.values = None
+            self.strings = (c_char_p * self.count)()
+            self.values_ptr = self.strings
+        else:
+            self.values = np.zeros(self.count, dtype=VARIABLE_DTYPES[variable_type])
+            self.values_ptr = as_pointer(self.values, self.c_type)
+
+
+class WritePlan:
+    """
+    Precompiled set of variables to override through a manipulator. Created with CosimManipulator.write_plan().
+    Targets are grouped by slave and variable type when the plan is created, and each group owns reference and value
+    buffers that are reused by every apply(), so applying the plan costs one C call per group
+    """
+
+    def __init__(self, manipulator: CosimManipulator, targets: Sequence[tuple[int, int, CosimVariableType]]):
+        # Keep the manipulator alive for as long as its pointer is used
+        self.__manipulator = manipulator
+        self.__manipulator_ptr = manipulator.ptr()
+        self.targets = [
+            (int(slave_index), int(value_reference), CosimVariableType(variable_type))
+            for slave_index, value_reference, variable_type in targets
+        ]
+        self.__positions = {target: position for position, target in enumerate(self.targets)}
+        if len(self.__positions) != len(self.targets):
+            raise ValueError("Write plan targets must be unique")
+
+        grouped: dict[tuple[int, CosimVariableType], tuple[list[int], list[int]]] = {}
+        for position, (slave_index, value_reference, variable_type) in enumerate(self.targets):
+            positions, references = grouped.setdefault((slave_index, variable_type), ([], []))
+            positions.append(position)
+            references.append(value_reference)
+        self.__groups = [
+            _WriteGroup(slave_index, variable_type, positions, references)
+            for (slave_index, variable_type), (positions, references) in grouped.items()
+        ]
+        self.__has_strings = any(group.values is None for group in self.__groups)
+
+    def __len__(self):
+        return len(self.targets)
+
+    @property
+    def call_count(self) -> int:
+        """
+        Number of C calls made by apply() with values for every target
+        """
+        return len(self.__groups)
+
+    def apply(
+        self, values: npt.ArrayLike | Mapping[tuple[int, int, CosimVariableType], int | float | bool | str]
+    ) -> bool:
+        """
+        Override the variables of the plan
+
+        :param values: Either a sequence or array with one value per target, in the order of the targets, or a dict
+            from (slave_index, value_reference, variable_type) target to value. With a dict only the given targets are
+            written
+        :return: bool Successfully set override values to all variables
+        """
+        if isinstance(values, Mapping):
+            return self.__apply_mapping(values)
+
+        if not isinstance(values, np.ndarray):
+            # Keep strings apart from numbers instead of converting every value to str
+            values = np.array(values, dtype=object if self.__has_strings else None)
+        if values.shape != (len(self.targets),):
+            raise ValueError(f"Expected {len(self.targets)} values, got array of shape {values.shape}")
+        success = True
+        for group in self.__groups:
+            if group.values is None:
+                for i, position in enumerate(group.positions):
+                    group.strings[i] = _encode(values[position])
+            else:
+                group.values[:] = values[group.positions]
+            success &= self.__set(group, group.references_ptr, group.count, group.values_ptr)
+        return success
+
+    def __apply_mapping(self, values: Mapping[tuple[int, int, CosimVariableType], Any]) -> bool:
+        """
+        Helper function writing the targets given in a dict. Groups that are only partly given are written through
+        temporary buffers holding the given targets
+        """
+        given = np.zeros(len(self.targets), dtype=np.bool_)
+        ordered = np.empty(len(self.targets), dtype=object)
+        for (slave_index, value_reference, variable_type), value in values.items():
+            target = (int(slave_index), int(value_reference), CosimVariableType(variable_type))
+            position = self.__positions.get(target)
+            if position is None:
+                raise KeyError(f"{target} is not a target of the write plan")
+            given[position] = True
+            ordered[position] = value
+
+        success = True
+        for group in self.__groups:
+            selected = given[group.positions]
+            if not selected.any():
+                continue
+            if selected.all():
+                positions, references_ptr, count = group.positions, group.references_ptr, group.count
+            else:
+                positions = group.positions[selected]
+                references = group.references[selected]
+                references_ptr, count = as_pointer(references, c_uint32), len(positions)
+
+            if group.values is None:
+                strings = group.strings if count == group.count else (c_char_p * count)()
+                for i, position in enumerate(positions):
+                    strings[i] = _encode(ordered[position])
+                values_ptr = strings
+            else:
+                buffer = group.values if count == group.count else np.empty(count, dtype=group.values.dtype)
+                buffer[:] = ordered[positions]
+                values_ptr = as_pointer(buffer, group.c_type)
+            success &= self.__set(group, references_ptr, count, values_ptr)
+        return success
+
+    def __set(self, group: _WriteGroup, references_ptr: Any, count: int, values_ptr: Any) -> bool:
+        return (
+            group.set_values(self.__manipulator_ptr, group.slave_index, references_ptr, count, values_ptr)
+            == CosimConstants.success
+        )
+
+    def reset(self) -> bool:
+        """
+        Reset all variables of the plan, removing their overrides
+
+        :return: bool Successful reset of variables
+        """
+        success = True
+        for group in self.__groups:
+            success &= (
+                cosimc().cosim_manipulator_slave_reset(
+                    self.__manipulator_ptr,
+                    group.slave_index,
+                    group.variable_type.value,
+                    group.references_ptr,
+                    group.count,
+                )
+                == CosimConstants.success
             )
-            manipulator_destroy(self.__ptr)
+        return success
+
+
+def _encode(value: str | bytes) -> bytes:
+    return value if isinstance(value, bytes) else str(value).encode()
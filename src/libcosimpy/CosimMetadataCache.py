@@ -0,0 +1,215 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+from xml.etree import ElementTree
+
+import numpy as np
+
+from .CosimExecution import CosimExecution
+from .CosimModelIndex import ModelIndex
+from .CosimSlave import CosimSlaveVariables
+
+# Version of the cache entry layout. Entries written with another version are treated as misses
+CACHE_FORMAT_VERSION = 1
+
+# Configuration file names looked up by libcosim when given a directory
+OSP_CONFIG_FILE = "OspSystemStructure.xml"
+SSP_CONFIG_FILE = "SystemStructure.ssd"
+
+
+def default_cache_dir() -> Path:
+    """
+    Directory used by MetadataCache when none is given. Taken from the LIBCOSIMPY_CACHE_DIR environment variable if
+    set, otherwise a libcosimpy folder in the user cache directory
+    """
+    if "LIBCOSIMPY_CACHE_DIR" in os.environ:
+        return Path(os.environ["LIBCOSIMPY_CACHE_DIR"])
+    if os.name == "nt":
+        return Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")) / "libcosimpy" / "cache"
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "libcosimpy"
+
+
+class MetadataCache:
+    """
+    On-disk cache of the slave and variable metadata of system configurations. Entries are keyed by the content and
+    modification time of the configuration file, the OSP model descriptions next to it and every FMU it references, so
+    the variables of a system can be listed without instantiating its FMUs. On a miss the execution is created, queried
+    and the result stored
+    """
+
+    def __init__(self, cache_dir: Optional[str | os.PathLike[str]] = None):
+        """
+        :param str cache_dir: Optional cache directory. Defaults to default_cache_dir()
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.__digests_path = self.cache_dir / "file_digests.json"
+        self.__digests: Optional[dict[str, Any]] = None
+
+    def osp_config_index(self, osp_path: str) -> ModelIndex:
+        """
+        Metadata of the system described by an OspSystemStructure.xml file
+
+        :param str osp_path: Path to OspSystemStructure.xml file or the directory containing it
+        :return: ModelIndex with all variable tables loaded
+        """
+        config_path = self.__config_file(osp_path, OSP_CONFIG_FILE)
+        return self.__model_index(config_path, lambda: CosimExecution.from_osp_config_file(osp_path))
+
+    def ssp_index(self, ssp_path: str) -> ModelIndex:
+        """
+        Metadata of the system described by a SystemStructure.ssd file
+
+        :param str ssp_path: Path to .ssd file or the directory containing SystemStructure.ssd
+        :return: ModelIndex with all variable tables loaded
+        """
+        config_path = self.__config_file(ssp_path, SSP_CONFIG_FILE)
+        return self.__model_index(config_path, lambda: CosimExecution.from_ssp_file(ssp_path))
+
+    def cache_key(self, config_path: str | os.PathLike[str]) -> str:
+        """
+        Key of the cache entry for a configuration file
+
+        :param str config_path: Path to the configuration file
+        :return: str Hex digest of the configuration and every file it depends on
+        """
+        config_path = Path(config_path).resolve()
+        key = hashlib.sha256(f"libcosimpy-metadata-{CACHE_FORMAT_VERSION}".encode())
+        for path in [config_path, *dependencies(config_path)]:
+            key.update(str(path).encode())
+            if path.is_file():
+                stat = path.stat()
+                key.update(f"{stat.st_size}:{stat.st_mtime_ns}:{self.file_digest(path)}".encode())
+            else:
+                key.update(b"missing")
+        return key.hexdigest()
+
+    def file_digest(self, path: str | os.PathLike[str]) -> str:
+        """
+        SHA-256 digest of the content of a file. Digests are remembered by path, size and modification time so that
+        unchanged FMUs are not hashed again
+
+        :param str path: Path to the file
+        :return: str Hex digest of the file content
+        """
+        path = Path(path).resolve()
+        if self.__digests is None:
+            self.__digests = _read_json(self.__digests_path) or {}
+        stat = path.stat()
+        signature = f"{stat.st_size}:{stat.st_mtime_ns}"
+        known = self.__digests.get(str(path))
+        if known is not None and known[0] == signature:
+            return known[1]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        self.__digests[str(path)] = [signature, digest.hexdigest()]
+        _write_json(self.__digests_path, self.__digests)
+        return digest.hexdigest()
+
+    def clear(self):
+        """
+        Remove all entries from the cache
+        """
+        if self.cache_dir.is_dir():
+            for entry in self.cache_dir.glob("*.json"):
+                entry.unlink()
+        self.__digests = None
+
+    def __config_file(self, path: str, default_name: str) -> Path:
+        """
+        Helper function resolving a configuration path that may be a directory
+        """
+        config_path = Path(path)
+        return config_path / default_name if config_path.is_dir() else config_path
+
+    def __model_index(self, config_path: Path, create_execution: Any) -> ModelIndex:
+        """
+        Helper function returning the cached metadata of a configuration, querying and storing it on a miss
+        """
+        entry_path = self.cache_dir / f"{self.cache_key(config_path)}.json"
+        entry = _read_json(entry_path)
+        if entry is None or entry.get("version") != CACHE_FORMAT_VERSION:
+            execution: CosimExecution = create_execution()
+            model_index = execution.model_index()
+            entry = {
+                "version": CACHE_FORMAT_VERSION,
+                "config": str(config_path.resolve()),
+                "slaves": model_index.slave_indices,
+                "variables": {
+                    str(slave_index): _table_to_json(model_index.variables(instance_name))
+                    for instance_name, slave_index in model_index.slave_indices.items()
+                },
+            }
+            _write_json(entry_path, entry)
+
+        tables = {
+            int(slave_index): _table_from_json(int(slave_index), table)
+            for slave_index, table in entry["variables"].items()
+        }
+        return ModelIndex(slave_indices=dict(entry["slaves"]), load_variables=tables.__getitem__)
+
+
+def dependencies(config_path: Path) -> list[Path]:
+    """
+    Files a configuration depends on: FMUs referenced by source attributes and OSP model descriptions next to it
+    """
+    dependencies: set[Path] = set(config_path.parent.glob("*_OspModelDescription.xml"))
+    try:
+        tree = ElementTree.parse(config_path)
+    except (OSError, ElementTree.ParseError):
+        return sorted(dependencies)
+    for element in tree.iter():
+        source = element.get("source")
+        # Remote sources such as fmu-proxy:// are part of the configuration content only
+        if source and "://" not in source:
+            dependencies.add((config_path.parent / source).resolve())
+    return sorted(dependencies)
+
+
+def _table_to_json(table: CosimSlaveVariables) -> dict[str, Any]:
+    return {
+        "names": list(table.names),
+        "references": table.references.tolist(),
+        "types": table.types.tolist(),
+        "causalities": table.causalities.tolist(),
+        "variabilities": table.variabilities.tolist(),
+    }
+
+
+def _table_from_json(slave_index: int, table: dict[str, Any]) -> CosimSlaveVariables:
+    return CosimSlaveVariables(
+        slave_index=slave_index,
+        names=tuple(table["names"]),
+        references=np.array(table["references"], dtype=np.uint32),
+        types=np.array(table["types"], dtype=np.int8),
+        causalities=np.array(table["causalities"], dtype=np.int8),
+        variabilities=np.array(table["variabilities"], dtype=np.int8),
+    )
+
+
+def _read_json(path: Path) -> Optional[Any]:
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: Path, content: Any):
+    """
+    Write a JSON file atomically, so concurrent readers never see a partial entry
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            json.dump(content, file)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
@@ -0,0 +1,122 @@
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Optional
+
+from .CosimSlave import CosimSlaveVariables, VariableInfo
+
+if TYPE_CHECKING:
+    from .CosimExecution import CosimExecution
+
+
+class ModelIndex:
+    """
+    Name lookup tables for the slaves and variables of an execution. Created with CosimExecution.model_index(), which
+    rebuilds the index when slaves are added. Slave names are read once on creation and the variables of a slave are
+    loaded into a compact table on the first lookup in that slave, after which lookups are dictionary lookups
+    """
+
+    def __init__(self, slave_indices: dict[str, int], load_variables: Callable[[int], CosimSlaveVariables]):
+        """
+        :param dict slave_indices: Slave index of each instance name
+        :param load_variables: Callable returning the variable table of a slave index, called once per slave
+        """
+        self.__slave_indices = slave_indices
+        self.__load_variables = load_variables
+        self.__variables: dict[int, CosimSlaveVariables] = {}
+
+    @classmethod
+    def from_execution(cls, execution: "CosimExecution"):
+        """
+        Index the slaves of an execution. Variables are read from the execution on the first lookup in each slave
+
+        :param CosimExecution execution: Execution to index
+        :return: ModelIndex object
+        """
+        # The execution caches its index, so the index refers back to it weakly. Otherwise the execution and its
+        # observers are only destroyed by the garbage collector, which delays flushing of file observer logs
+        slave_variable_table = weakref.WeakMethod(execution.slave_variable_table)
+
+        def load_variables(slave_index: int) -> CosimSlaveVariables:
+            method = slave_variable_table()
+            if method is None:
+                raise ReferenceError("The execution of the model index has been destroyed")
+            return method(slave_index)
+
+        return cls(
+            slave_indices={slave_info.name.decode(): slave_info.index for slave_info in execution.slave_infos()},
+            load_variables=load_variables,
+        )
+
+    @property
+    def slave_indices(self) -> dict[str, int]:
+        """
+        Slave index of each instance name. Must not be modified
+        """
+        return self.__slave_indices
+
+    @property
+    def instance_names(self) -> list[str]:
+        """
+        Instance names of all slaves in the execution
+        """
+        return list(self.__slave_indices)
+
+    def __len__(self):
+        return len(self.__slave_indices)
+
+    def __contains__(self, instance_name: object):
+        return instance_name in self.__slave_indices
+
+    def slave_index(self, instance_name: str) -> int:
+        """
+        Slave index of an instance
+
+        :param str instance_name: Name of instance
+        :return: int Slave index. Raises KeyError if no slave has the instance name
+        """
+        return self.__slave_indices[instance_name]
+
+    def find_slave_index(self, instance_name: str) -> Optional[int]:
+        """
+        Slave index of an instance, or None if no slave has the instance name
+
+        :param str instance_name: Name of instance
+        :return: int Slave index
+        """
+        return self.__slave_indices.get(instance_name)
+
+    def variables(self, instance_name: str) -> CosimSlaveVariables:
+        """
+        All variables of an instance
+
+        :param str instance_name: Name of instance
+        :return: CosimSlaveVariables table of the instance
+        """
+        slave_index = self.__slave_indices[instance_name]
+        variables = self.__variables.get(slave_index)
+        if variables is None:
+            variables = self.__load_variables(slave_index)
+            self.__variables[slave_index] = variables
+        return variables
+
+    def variable(self, instance_name: str, variable_name: str) -> VariableInfo:
+        """
+        Resolve a variable by instance and variable name
+
+        :param str instance_name: Name of instance
+        :param str variable_name: Name of variable within the instance
+        :return: VariableInfo. Raises KeyError if the instance or variable does not exist
+        """
+        return self.variables(instance_name).info(variable_name)
+
+    def resolve(self, name: str) -> VariableInfo:
+        """
+        Resolve a variable from a name of the form "instance.variable". Variable names may themselves contain dots
+
+        :param str name: Instance name and variable name separated by the first dot
+        :return: VariableInfo. Raises KeyError if the instance or variable does not exist
+        """
+        instance_name, separator, variable_name = name.partition(".")
+        if not separator:
+            raise KeyError(f"Expected a name of the form 'instance.variable', got '{name}'")
+        return self.variable(instance_name, variable_name)
@@ -5,16 +5,18 @@ from ctypes import (
     c_char_p,
     c_int,
     c_uint32,
-    c_longlong,
     c_double,
-    c_size_t,
     c_bool,
-    c_uint64,
 )
+from collections.abc import Callable, Sequence
 from typing import Optional, TYPE_CHECKING, Any
 
+import numpy as np
+import numpy.typing as npt
+
 from .CosimEnums import CosimVariableType
-from ._internal import wrap_function, libcosimc
+from ._bindings import cosimc
+from ._internal import VARIABLE_CTYPES, VARIABLE_DTYPES, as_pointer
 from . import CosimConstants
 
 
@@ -51,24 +53,6 @@ class CosimObserver(Structure):
         )
         # Store the pointer used by the C library
         self.__ptr = observer_ptr
-        self.__step_numbers = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_observer_get_step_numbers",
-            argtypes=[POINTER(CosimObserver), c_longlong, c_longlong, c_uint32],
-            restype=c_int,
-        )
-        self.__start_observing = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_observer_start_observing",
-            argtypes=[POINTER(CosimObserver), c_int, c_int, c_uint32],
-            restype=c_int,
-        )
-        self.__stop_observing = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_observer_stop_observing",
-            argtypes=[POINTER(CosimObserver), c_int, c_int, c_uint32],
-            restype=c_int,
-        )
 
     @classmethod
     def create_last_value(cls):
@@ -77,13 +61,7 @@ class CosimObserver(Structure):
 
         :return: CosimObserver object from constructor
         """
-        last_value_observer_create = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_last_value_observer_create",
-            argtypes=[],
-            restype=POINTER(CosimObserver),
-        )
-        observer_ptr = last_value_observer_create()
+        observer_ptr = cosimc().cosim_last_value_observer_create()
         return cls(cls.__create_key, observer_ptr)
 
     @classmethod
@@ -94,30 +72,20 @@ class CosimObserver(Structure):
         :param str log_dir: Directory of output log files
         :return: CosimObserver object from constructor
         """
-        file_observer_create = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_file_observer_create",
-            argtypes=[c_char_p],
-            restype=POINTER(CosimObserver),
-        )
-        observer_ptr = file_observer_create(log_dir.encode())
+        observer_ptr = cosimc().cosim_file_observer_create(log_dir.encode())
         return cls(cls.__create_key, observer_ptr)
 
-    """@classmethod
-    def from_cfg(cls, cfg_path, log_dir):
-        
+    @classmethod
+    def from_cfg(cls, cfg_path: str, log_dir: str):
+        """
         Creates observer from LogConfig.xml file with specified logging directory
 
+        :param str cfg_path: Path to the LogConfig.xml file
         :param str log_dir: Directory of output log files
-        :param str cfg_path: Directory of the LogConfig.xml file
         :return: CosimObserver object from constructor
-        
-        file_observer_create = wrap_function(lib=libcosimc(), funcname='cosim_file_observer_create_from_cfg',
-                                                     argtypes=[c_char_p, c_char_p],
-                                                     restype=POINTER(CosimObserver))
-
-        observer_ptr = file_observer_create(log_dir.encode(), cfg_path.encode())
-        return cls(cls.__create_key, observer_ptr)"""
+        """
+        observer_ptr = cosimc().cosim_file_observer_create_from_cfg(log_dir.encode(), cfg_path.encode())
+        return cls(cls.__create_key, observer_ptr)
 
     @classmethod
     def create_time_series(cls, buffer_size: Optional[int] = None):
@@ -128,22 +96,10 @@ class CosimObserver(Structure):
         :return: CosimObserver Object from constructor
         """
         if buffer_size is None:
-            time_series_create = wrap_function(
-                lib=libcosimc(),
-                funcname="cosim_time_series_observer_create",
-                argtypes=[],
-                restype=POINTER(CosimObserver),
-            )
-            observer_ptr = time_series_create()
+            observer_ptr = cosimc().cosim_time_series_observer_create()
             return cls(cls.__create_key, observer_ptr)
         else:
-            buffered_time_series_create = wrap_function(
-                lib=libcosimc(),
-                funcname="cosim_buffered_time_series_observer_create",
-                argtypes=[c_uint64],
-                restype=POINTER(CosimObserver),
-            )
-            observer_ptr = buffered_time_series_create(buffer_size)
+            observer_ptr = cosimc().cosim_buffered_time_series_observer_create(buffer_size)
             return cls(cls.__create_key, observer_ptr)
 
     def start_time_series(self, slave_index: int, value_reference: int, variable_type: CosimVariableType):
@@ -156,7 +112,7 @@ class CosimObserver(Structure):
         :return: bool Successfully started observer
         """
         return (
-            self.__start_observing(self.__ptr, slave_index, variable_type.value, value_reference)
+            cosimc().cosim_observer_start_observing(self.__ptr, slave_index, variable_type.value, value_reference)
             == CosimConstants.success
         )
 
@@ -170,7 +126,7 @@ class CosimObserver(Structure):
         :return: bool Successfully stopped observer
         """
         return (
-            self.__stop_observing(self.__ptr, slave_index, variable_type.value, value_reference)
+            cosimc().cosim_observer_stop_observing(self.__ptr, slave_index, variable_type.value, value_reference)
             == CosimConstants.success
         )
 
@@ -190,21 +146,7 @@ class CosimObserver(Structure):
         step_number_array = (c_int64 * sample_count)()
         samples_array = (c_type * sample_count)()
 
-        real_samples = wrap_function(
-            lib=libcosimc(),
-            funcname=funcname,
-            argtypes=[
-                POINTER(CosimObserver),
-                c_int,
-                c_uint32,
-                c_int64,
-                c_size_t,
-                c_type * sample_count,
-                c_int64 * sample_count,
-                c_int64 * sample_count,
-            ],
-            restype=c_int64,
-        )
+        real_samples = getattr(cosimc(), funcname)
 
         retrieved_samples_count = real_samples(
             self.__ptr,
@@ -223,12 +165,62 @@ class CosimObserver(Structure):
                 "executed."
             )
 
-        # Trim lists to length of number of values
-        step_count = sample_count - (step_number_array[:]).count(0)
+        # Trim lists to the number of samples actually retrieved
+        return (
+            time_point_array[:retrieved_samples_count],
+            step_number_array[:retrieved_samples_count],
+            samples_array[:retrieved_samples_count],
+        )
+
+    def __time_series_sample_arrays(
+        self,
+        slave_index: int,
+        value_reference: int,
+        from_step: int,
+        sample_count: int,
+        variable_type: CosimVariableType,
+        out: Optional[tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[Any]]],
+    ):
+        """
+        Helper function to avoid code duplication for time series sample retrieval into NumPy arrays
+        """
+        dtype = VARIABLE_DTYPES[variable_type]
+        if out is None:
+            time_points = np.empty(sample_count, dtype=np.int64)
+            step_numbers = np.empty(sample_count, dtype=np.int64)
+            samples = np.empty(sample_count, dtype=dtype)
+        else:
+            time_points, step_numbers, samples = out
+            for array, expected_dtype in ((time_points, np.int64), (step_numbers, np.int64), (samples, dtype)):
+                if array.dtype != expected_dtype or array.ndim != 1 or len(array) < sample_count:
+                    raise ValueError(
+                        f"out arrays must be one-dimensional with at least {sample_count} elements and dtypes "
+                        f"(int64, int64, {np.dtype(dtype)})"
+                    )
+                if not (array.flags.c_contiguous and array.flags.writeable):
+                    raise ValueError("out arrays must be writeable and C-contiguous")
+
+        retrieved_samples_count = getattr(cosimc(), _SAMPLES_FUNCNAMES[variable_type])(
+            self.__ptr,
+            slave_index,
+            value_reference,
+            from_step,
+            sample_count,
+            as_pointer(samples, VARIABLE_CTYPES[variable_type]),
+            as_pointer(step_numbers, c_int64),
+            as_pointer(time_points, c_int64),
+        )
+        if retrieved_samples_count < 0:
+            raise AssertionError(
+                "Unable to retrieve samples. Check if indexes are valid, observer is of type time "
+                "series and that the time series have been started and at least one step has been "
+                "executed."
+            )
+
         return (
-            time_point_array[:step_count],
-            step_number_array[:step_count],
-            samples_array[:step_count],
+            time_points[:retrieved_samples_count],
+            step_numbers[:retrieved_samples_count],
+            samples[:retrieved_samples_count],
         )
 
     def time_series_real_samples(self, slave_index: int, value_reference: int, from_step: int, sample_count: int = 10):
@@ -269,6 +261,62 @@ class CosimObserver(Structure):
             c_type=c_int,
         )
 
+    def time_series_real_sample_arrays(
+        self,
+        slave_index: int,
+        value_reference: int,
+        from_step: int,
+        sample_count: int = 10,
+        out: Optional[tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.float64]]] = None,
+    ):
+        """
+        Read real samples from time series observer directly into NumPy arrays
+
+        :param int slave_index: Index of slave with variable
+        :param int value_reference: Index of the variable of the slave
+        :param int from_step: Step when the time series samples is recorded from
+        :param int sample_count: Number of samples to take after from_step. Default 10
+        :param out: Optional (time_points, step_numbers, samples) arrays of at least sample_count elements to reuse
+        :returns tuple of arrays: Time points, step numbers and real value samples. Views of the filled buffers, trimmed
+            to the number of retrieved samples which may be lower than sample_count
+        """
+        return self.__time_series_sample_arrays(
+            slave_index=slave_index,
+            value_reference=value_reference,
+            from_step=from_step,
+            sample_count=sample_count,
+            variable_type=CosimVariableType.REAL,
+            out=out,
+        )
+
+    def time_series_integer_sample_arrays(
+        self,
+        slave_index: int,
+        value_reference: int,
+        from_step: int,
+        sample_count: int = 10,
+        out: Optional[tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.intc]]] = None,
+    ):
+        """
+        Read integer samples from time series observer directly into NumPy arrays
+
+        :param int slave_index: Index of slave with variable
+        :param int value_reference: Index of the variable of the slave
+        :param int from_step: Step when the time series samples is recorded from
+        :param int sample_count: Number of samples to take after from_step. Default 10
+        :param out: Optional (time_points, step_numbers, samples) arrays of at least sample_count elements to reuse
+        :returns tuple of arrays: Time points, step numbers and integer value samples. Views of the filled buffers,
+            trimmed to the number of retrieved samples which may be lower than sample_count
+        """
+        return self.__time_series_sample_arrays(
+            slave_index=slave_index,
+            value_reference=value_reference,
+            from_step=from_step,
+            sample_count=sample_count,
+            variable_type=CosimVariableType.INTEGER,
+            out=out,
+        )
+
     def __last_values(self, slave_index: int, variable_references: list[int], c_type: Any):
         """ """
         if c_type == c_double:
@@ -287,18 +335,7 @@ class CosimObserver(Structure):
         variables_index_array = (c_uint32 * variable_count)(*variable_references)
         value_array = (c_type * variable_count)()
 
-        real_values = wrap_function(
-            lib=libcosimc(),
-            funcname=funcname,
-            argtypes=[
-                POINTER(CosimObserver),
-                c_int,
-                c_uint32 * variable_count,
-                c_size_t,
-                c_type * variable_count,
-            ],
-            restype=c_int,
-        )
+        real_values = getattr(cosimc(), funcname)
 
         if (
             real_values(
@@ -369,6 +406,80 @@ class CosimObserver(Structure):
             c_type=c_char_p,
         )
 
+    def read_set(self, slave_index: int, variable_references: Sequence[int], variable_type: CosimVariableType):
+        """
+        Create a reusable handle for reading the same variables from a last value observer repeatedly
+
+        :param int slave_index: Index of slave with variables
+        :param list of int variable_references: List of variable reference indexes
+        :param CosimVariableType variable_type: Data type of all the variables
+        :return: VariableReadSet object
+        """
+        return VariableReadSet(
+            observer=self,
+            slave_index=slave_index,
+            variable_references=variable_references,
+            variable_type=variable_type,
+        )
+
+    def time_series_step_range(self, slave_index: int) -> Optional[tuple[int, int]]:
+        """
+        Oldest and newest step held by a time series observer for a slave. Samples can only be retrieved from step
+        windows that contain held steps, so this is used to skip steps dropped from a buffered observer
+
+        :param int slave_index: Index of slave
+        :return: tuple of int First and last step number held, or None if no steps are held
+        """
+        steps = (c_int64 * 2)()
+        # The longest representable duration covers every held step
+        if (
+            cosimc().cosim_observer_get_step_numbers_for_duration(self.__ptr, slave_index, 2**63 - 1, steps)
+            != CosimConstants.success
+        ):
+            return None
+        # An empty buffer is reported as the range (0, 0). Step 0 is only recorded together with the first step, so
+        # no held range is (0, 0)
+        if steps[1] == 0:
+            return None
+        return steps[0], steps[1]
+
+    def time_series_batch(self, variables: Sequence[tuple[int, int, CosimVariableType]]):
+        """
+        Create a handle for retrieving samples of many variables from a time series observer into one array
+
+        :param list of tuple variables: (slave_index, value_reference, variable_type) of each variable. Only REAL and
+            INTEGER variables can be sampled
+        :return: TimeSeriesBatch object
+        """
+        return TimeSeriesBatch(observer=self, variables=variables)
+
+    def time_series_cursor(
+        self,
+        slave_index: int,
+        value_reference: int,
+        variable_type: CosimVariableType,
+        from_step: Optional[int] = None,
+        chunk_size: int = 1024,
+    ):
+        """
+        Create a cursor streaming new samples of one variable from a time series observer
+
+        :param int slave_index: Index of slave with variable
+        :param int value_reference: Index of the variable of the slave
+        :param CosimVariableType variable_type: Value reference data type, REAL or INTEGER
+        :param int from_step: Optional first step to deliver. Defaults to the oldest sample held by the observer
+        :param int chunk_size: Maximum number of samples returned by each pull. Default 1024
+        :return: TimeSeriesCursor object
+        """
+        return TimeSeriesCursor(
+            observer=self,
+            slave_index=slave_index,
+            value_reference=value_reference,
+            variable_type=variable_type,
+            from_step=from_step,
+            chunk_size=chunk_size,
+        )
+
     def ptr(self):
         """
         Helper function intended to be used by other libcosimc classes
@@ -381,10 +492,436 @@ class CosimObserver(Structure):
         Releases C objects when CosimObserver is deleted in python
         """
         if self.__ptr is not None:
-            observer_destroy = wrap_function(
-                lib=libcosimc(),
-                funcname="cosim_observer_destroy",
-                argtypes=[POINTER(CosimObserver)],
-                restype=c_int,
+            cosimc().cosim_observer_destroy(self.__ptr)
+
+
+_SAMPLES_FUNCNAMES = {
+    CosimVariableType.REAL: "cosim_observer_slave_get_real_samples",
+    CosimVariableType.INTEGER: "cosim_observer_slave_get_integer_samples",
+}
+
+_LAST_VALUE_FUNCNAMES = {
+    CosimVariableType.REAL: "cosim_observer_slave_get_real",
+    CosimVariableType.INTEGER: "cosim_observer_slave_get_integer",
+    CosimVariableType.BOOLEAN: "cosim_observer_slave_get_boolean",
+    CosimVariableType.STRING: "cosim_observer_slave_get_string",
+}
+
+
+class VariableReadSet:
+    """
+    Preallocated handle reading a fixed set of variables of one type from a last value observer. Created with
+    CosimObserver.read_set(). Reference and value buffers are allocated once and every read() fills them in place
+    """
+
+    def __init__(
+        self,
+        observer: CosimObserver,
+        slave_index: int,
+        variable_references: Sequence[int],
+        variable_type: CosimVariableType,
+    ):
+        # Keep the observer alive for as long as its pointer is used
+        self.__observer = observer
+        self.__observer_ptr = observer.ptr()
+        self.slave_index = slave_index
+        self.variable_type = variable_type
+
+        self.__get_values = getattr(cosimc(), _LAST_VALUE_FUNCNAMES[variable_type])
+        self.__c_type = VARIABLE_CTYPES[variable_type]
+        self.__references = np.array(variable_references, dtype=np.uint32)
+        self.__references_ptr = as_pointer(self.__references, c_uint32)
+        self.__count = len(self.__references)
+
+        self.__values = np.zeros(self.__count, dtype=VARIABLE_DTYPES[variable_type])
+        if variable_type == CosimVariableType.STRING:
+            # Strings are returned as pointers owned by the C library and copied into the object array after reading
+            self.__strings = (c_char_p * self.__count)()
+            self.__values_ptr = self.__strings
+        else:
+            self.__values_ptr = as_pointer(self.__values, self.__c_type)
+
+        self.__view = self.__values.view()
+        self.__view.flags.writeable = False
+
+    @property
+    def variable_references(self) -> npt.NDArray[np.uint32]:
+        """
+        Variable references read by this set, in the order of the returned values
+        """
+        references = self.__references.view()
+        references.flags.writeable = False
+        return references
+
+    def __len__(self):
+        return self.__count
+
+    def read(self, out: Optional[npt.NDArray[Any]] = None) -> npt.NDArray[Any]:
+        """
+        Read the current values of the variables
+
+        :param out: Optional array of length len(self) with the dtype of the variable type to read into
+        :return: Read-only view of the internal buffer, overwritten by the next read, or out if given
+        """
+        if out is not None:
+            if out.dtype != self.__values.dtype or out.shape != (self.__count,):
+                raise ValueError(f"out must have shape ({self.__count},) and dtype {self.__values.dtype}")
+            if not (out.flags.c_contiguous and out.flags.writeable):
+                raise ValueError("out must be a writeable C-contiguous array")
+
+        if out is None or self.variable_type == CosimVariableType.STRING:
+            values_ptr = self.__values_ptr
+        else:
+            values_ptr = as_pointer(out, self.__c_type)
+
+        if (
+            self.__get_values(self.__observer_ptr, self.slave_index, self.__references_ptr, self.__count, values_ptr)
+            != CosimConstants.success
+        ):
+            raise AssertionError("Unable to return values. Check if indexes are valid.")
+
+        if self.variable_type == CosimVariableType.STRING:
+            (self.__values if out is None else out)[:] = self.__strings[:]
+        return self.__view if out is None else out
+
+
+class TimeSeriesBatch:
+    """
+    Retrieves samples of several variables from a time series observer in one call. Created with
+    CosimObserver.time_series_batch(). Samples are written into a single buffer owned by the batch, with one column
+    per variable and rows aligned on step number
+    """
+
+    def __init__(self, observer: CosimObserver, variables: Sequence[tuple[int, int, CosimVariableType]]):
+        # Keep the observer alive for as long as its pointer is used
+        self.__observer = observer
+        self.__observer_ptr = observer.ptr()
+        self.variables = [
+            (int(slave_index), int(value_reference), variable_type)
+            for slave_index, value_reference, variable_type in variables
+        ]
+        for _, _, variable_type in self.variables:
+            if variable_type not in _SAMPLES_FUNCNAMES:
+                raise ValueError(f"Time series samples are not supported for variables of type {variable_type}")
+        self.__get_samples = [getattr(cosimc(), _SAMPLES_FUNCNAMES[t]) for _, _, t in self.variables]
+        self.__capacity = 0
+        self.__allocate(0)
+
+    def __allocate(self, sample_count: int):
+        """
+        Helper function (re)allocating the buffers to hold sample_count samples per variable
+        """
+        self.__capacity = sample_count
+        # Variables along the first axis so that libcosimc writes each variable's samples contiguously
+        self.__values = np.empty((len(self.variables), sample_count), dtype=np.float64)
+        self.__time_points = np.empty(sample_count, dtype=np.int64)
+        self.__step_numbers = np.empty(sample_count, dtype=np.int64)
+        self.__scratch_steps = np.empty(sample_count, dtype=np.int64)
+        self.__scratch_times = np.empty(sample_count, dtype=np.int64)
+        self.__scratch_integers = np.empty(sample_count, dtype=np.intc)
+
+    def __len__(self):
+        return len(self.variables)
+
+    def start(self):
+        """
+        Start observing all variables of the batch
+
+        :return: bool Successfully started observing every variable
+        """
+        return all(
+            self.__observer.start_time_series(slave_index, value_reference, variable_type)
+            for slave_index, value_reference, variable_type in self.variables
+        )
+
+    def stop(self):
+        """
+        Stop observing all variables of the batch
+
+        :return: bool Successfully stopped observing every variable
+        """
+        return all(
+            self.__observer.stop_time_series(slave_index, value_reference, variable_type)
+            for slave_index, value_reference, variable_type in self.variables
+        )
+
+    def read(self, from_step: int, sample_count: int):
+        """
+        Read samples of all variables for the steps from_step to from_step + sample_count - 1
+
+        :param int from_step: First step to retrieve
+        :param int sample_count: Maximum number of steps to retrieve
+        :returns tuple of arrays: Time points and step numbers of shape (n,), and values of shape (n, len(self)) as
+            float64 where n is the number of steps up to the last retrieved sample. Steps missing for a variable are
+            NaN, and time points of steps without any sample are -1. The arrays are views of buffers owned by the batch
+            and are overwritten by the next read
+        """
+        if sample_count > self.__capacity:
+            self.__allocate(sample_count)
+
+        time_points = self.__time_points[:sample_count]
+        step_numbers = self.__step_numbers[:sample_count]
+        values = self.__values[:, :sample_count]
+        scratch_steps = self.__scratch_steps[:sample_count]
+        scratch_times = self.__scratch_times[:sample_count]
+        steps_ptr = as_pointer(scratch_steps, c_int64)
+        times_ptr = as_pointer(scratch_times, c_int64)
+        integers_ptr = as_pointer(self.__scratch_integers, c_int)
+
+        step_numbers[:] = np.arange(from_step, from_step + sample_count)
+        time_points.fill(-1)
+        row_count = 0
+
+        for column, ((slave_index, value_reference, variable_type), get_samples) in enumerate(
+            zip(self.variables, self.__get_samples, strict=True)
+        ):
+            row = self.__values[column]
+            is_real = variable_type == CosimVariableType.REAL
+            retrieved_samples_count = get_samples(
+                self.__observer_ptr,
+                slave_index,
+                value_reference,
+                from_step,
+                sample_count,
+                as_pointer(row, c_double) if is_real else integers_ptr,
+                steps_ptr,
+                times_ptr,
+            )
+            if retrieved_samples_count < 0:
+                raise AssertionError(
+                    f"Unable to retrieve samples for slave {slave_index}, variable {value_reference}. Check if "
+                    f"indexes are valid and that the time series has been started."
+                )
+            if not is_real:
+                row[:retrieved_samples_count] = self.__scratch_integers[:retrieved_samples_count]
+
+            steps = scratch_steps[:retrieved_samples_count]
+            if retrieved_samples_count and (
+                steps[0] != from_step or steps[-1] - steps[0] != retrieved_samples_count - 1
+            ):
+                # Samples start later than requested or have gaps, move them to the rows of their step numbers
+                in_range = steps < from_step + sample_count
+                samples = row[:retrieved_samples_count][in_range]
+                rows = steps[in_range] - from_step
+                values[column].fill(np.nan)
+                values[column, rows] = samples
+                time_points[rows] = scratch_times[:retrieved_samples_count][in_range]
+                if len(rows):
+                    row_count = max(row_count, int(rows[-1]) + 1)
+            else:
+                values[column, retrieved_samples_count:] = np.nan
+                time_points[:retrieved_samples_count] = scratch_times[:retrieved_samples_count]
+                row_count = max(row_count, retrieved_samples_count)
+
+        return time_points[:row_count], step_numbers[:row_count], values[:, :row_count].T
+
+    def cursor(self, from_step: Optional[int] = None, chunk_size: int = 1024):
+        """
+        Create a cursor streaming new samples of all variables of the batch
+
+        :param int from_step: Optional first step to deliver. Defaults to the oldest step held by the observer
+        :param int chunk_size: Maximum number of steps returned by each pull. Default 1024
+        :return: TimeSeriesBatchCursor object
+        """
+        return TimeSeriesBatchCursor(batch=self, observer=self.__observer, from_step=from_step, chunk_size=chunk_size)
+
+
+class TimeSeriesBatchCursor:
+    """
+    Streams samples of the variables of a TimeSeriesBatch. Created with TimeSeriesBatch.cursor(). Like
+    TimeSeriesCursor it remembers the last step it delivered, and steps overwritten in a buffered observer before they
+    were pulled are counted in dropped_samples
+    """
+
+    def __init__(
+        self,
+        batch: TimeSeriesBatch,
+        observer: CosimObserver,
+        from_step: Optional[int] = None,
+        chunk_size: int = 1024,
+    ):
+        assert chunk_size > 0, "Chunk size must be a positive and non-zero integer"
+        assert len(batch) > 0, "Batch must hold at least one variable"
+        self.batch = batch
+        self.chunk_size = chunk_size
+        self.dropped_samples = 0
+        self.__next_step = from_step
+        self.__observer = observer
+        self.__slaves = sorted({slave_index for slave_index, _, _ in batch.variables})
+
+    @property
+    def next_step(self) -> Optional[int]:
+        """
+        Step number of the next step to deliver, or None if nothing has been delivered and no from_step was given
+        """
+        return self.__next_step
+
+    def pull(self):
+        """
+        Retrieve samples of up to chunk_size steps recorded after the last delivered step
+
+        :returns tuple of arrays: Time points and step numbers of shape (n,), and values of shape (n, len(batch)) as
+            float64. Views of buffers owned by the batch that are overwritten by the next pull. Empty when no new
+            samples are available
+        """
+        from_step = 0 if self.__next_step is None else self.__next_step
+        step_ranges = [self.__observer.time_series_step_range(slave_index) for slave_index in self.__slaves]
+        last_step = max((step_range[1] for step_range in step_ranges if step_range is not None), default=None)
+        if last_step is None or last_step < from_step:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty((0, len(self.batch)))
+        time_points, step_numbers, values = self.__read(from_step)
+        if not len(step_numbers):
+            # Samples are only returned from the window of chunk_size steps starting at from_step. When the window
+            # holds none while later steps are held, the variables were started later or their oldest samples were
+            # dropped, so continue from the first window holding samples
+            if last_step < from_step + self.chunk_size:
+                return time_points, step_numbers, values
+            first_step = _first_window_with_samples(
+                lambda step: len(self.__read(step)[1]) > 0, from_step, last_step, self.chunk_size
+            )
+            if first_step is None:
+                return time_points[:0], step_numbers[:0], values[:0]
+            time_points, step_numbers, values = self.__read(first_step)
+        if self.__next_step is not None and step_numbers[0] > self.__next_step:
+            # The observer buffer wrapped around before these steps were pulled
+            self.dropped_samples += int(step_numbers[0]) - self.__next_step
+        self.__next_step = int(step_numbers[-1]) + 1
+        return time_points, step_numbers, values
+
+    def drain(self):
+        """
+        Generator pulling chunks until all steps currently held by the observer have been delivered. Each chunk must be
+        consumed or copied before requesting the next one
+        """
+        while True:
+            chunk = self.pull()
+            if not len(chunk[1]):
+                return
+            yield chunk
+
+    def __read(self, from_step: int):
+        """
+        Helper function reading a window of chunk_size steps, without the rows of steps before the first sample
+        """
+        time_points, step_numbers, values = self.batch.read(from_step=from_step, sample_count=self.chunk_size)
+        sampled = time_points >= 0
+        if np.all(sampled):
+            return time_points, step_numbers, values
+        return time_points[sampled], step_numbers[sampled], values[sampled]
+
+
+class TimeSeriesCursor:
+    """
+    Streams samples of one variable from a time series observer. Created with CosimObserver.time_series_cursor().
+    The cursor remembers the last step it delivered, so each pull only returns samples recorded since the previous one.
+    Samples overwritten in a buffered observer before they were pulled are counted in dropped_samples
+    """
+
+    def __init__(
+        self,
+        observer: CosimObserver,
+        slave_index: int,
+        value_reference: int,
+        variable_type: CosimVariableType,
+        from_step: Optional[int] = None,
+        chunk_size: int = 1024,
+    ):
+        assert chunk_size > 0, "Chunk size must be a positive and non-zero integer"
+        self.__observer = observer
+        if variable_type == CosimVariableType.REAL:
+            self.__read_samples = observer.time_series_real_sample_arrays
+        elif variable_type == CosimVariableType.INTEGER:
+            self.__read_samples = observer.time_series_integer_sample_arrays
+        else:
+            raise ValueError(f"Time series samples are not supported for variables of type {variable_type}")
+        self.slave_index = slave_index
+        self.value_reference = value_reference
+        self.variable_type = variable_type
+        self.chunk_size = chunk_size
+        self.dropped_samples = 0
+        self.__next_step = from_step
+        self.__buffers = (
+            np.empty(chunk_size, dtype=np.int64),
+            np.empty(chunk_size, dtype=np.int64),
+            np.empty(chunk_size, dtype=VARIABLE_DTYPES[variable_type]),
+        )
+
+    @property
+    def next_step(self) -> Optional[int]:
+        """
+        Step number of the next sample to deliver, or None if nothing has been delivered and no from_step was given
+        """
+        return self.__next_step
+
+    def pull(self):
+        """
+        Retrieve up to chunk_size samples recorded after the last delivered step
+
+        :returns tuple of arrays: Time points, step numbers and samples. Views of buffers owned by the cursor that are
+            overwritten by the next pull. Empty when no new samples are available
+        """
+        from_step = 0 if self.__next_step is None else self.__next_step
+        step_range = self.__observer.time_series_step_range(self.slave_index)
+        if step_range is None or step_range[1] < from_step:
+            return tuple(buffer[:0] for buffer in self.__buffers)
+        time_points, step_numbers, samples = self.__read(from_step)
+        if not len(step_numbers):
+            # Samples are only returned from the window of chunk_size steps starting at from_step. When the window
+            # holds none while later steps are held, the variable was started later or its oldest samples were
+            # dropped, so continue from the first window holding samples of the variable
+            if step_range[1] < from_step + self.chunk_size:
+                return time_points, step_numbers, samples
+            first_step = _first_window_with_samples(
+                lambda step: len(self.__read(step)[1]) > 0, from_step, step_range[1], self.chunk_size
             )
-            observer_destroy(self.__ptr)
+            if first_step is None:
+                return time_points[:0], step_numbers[:0], samples[:0]
+            time_points, step_numbers, samples = self.__read(first_step)
+        if self.__next_step is not None and step_numbers[0] > self.__next_step:
+            # The observer buffer wrapped around before these steps were pulled
+            self.dropped_samples += int(step_numbers[0]) - self.__next_step
+        self.__next_step = int(step_numbers[-1]) + 1
+        return time_points, step_numbers, samples
+
+    def drain(self):
+        """
+        Generator pulling chunks until all samples currently held by the observer have been delivered. Each chunk must
+        be consumed or copied before requesting the next one
+        """
+        while True:
+            chunk = self.pull()
+            if not len(chunk[1]):
+                return
+            yield chunk
+
+    def __read(self, from_step: int):
+        """
+        Helper function reading the samples in the window of chunk_size steps starting at from_step
+        """
+        return self.__read_samples(
+            slave_index=self.slave_index,
+            value_reference=self.value_reference,
+            from_step=from_step,
+            sample_count=self.chunk_size,
+            out=self.__buffers,
+        )
+
+
+def _first_window_with_samples(has_samples: Callable[[int], bool], from_step: int, last_step: int, window: int):
+    """
+    Helper function returning the first step at or after from_step whose window of steps holds samples, or None if
+    no window up to last_step does. Samples are held from the oldest step not yet dropped up to last_step, with gaps
+    shorter than a window, so windows starting before that are empty and later windows are not. The boundary is found
+    by bisection, in a number of probe reads logarithmic in the number of steps searched
+    """
+    high = max(from_step, last_step - window + 1)
+    if not has_samples(high):
+        return None
+    low = from_step
+    while low < high:
+        middle = (low + high) // 2
+        if has_samples(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
@@ -0,0 +1,168 @@
+import os
+from collections.abc import Mapping, Sequence
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ._sampling import SampleSource
+from .CosimEnums import CosimVariableType
+from .CosimExecution import CosimExecution
+from .CosimObserver import CosimObserver
+
+# Arrow type of the column holding each variable type
+_ARROW_TYPES = {
+    CosimVariableType.REAL: "float64",
+    CosimVariableType.INTEGER: "int32",
+}
+
+
+class ParquetSink:
+    """
+    Writes samples of variables of an execution to a columnar Parquet or Feather file. Samples are pulled from a
+    buffered time series observer in chunks of chunk_steps steps and written as Arrow record batches with a time
+    column in nanos, a step column and one column per variable. Each chunk becomes one compressed row group, so the
+    file can be read while later chunks are produced and memory use is bounded by the chunk size.
+
+    Step the execution through step() to pull samples before the observer buffer wraps around, or call pull() at least
+    once per chunk_steps steps when stepping or simulating the execution directly. Only REAL and INTEGER
+    variables can be written. Steps dropped from the observer buffer before they were pulled are counted in
+    dropped_steps. pyarrow is required
+    """
+
+    def __init__(
+        self,
+        execution: CosimExecution,
+        path: str | os.PathLike[str],
+        variables: Sequence[str] | Mapping[str, str | tuple[int, int, CosimVariableType]],
+        chunk_steps: int = 65536,
+        file_format: Optional[str] = None,
+        compression: str = "zstd",
+        observer: Optional[CosimObserver] = None,
+    ):
+        """
+        :param CosimExecution execution: Execution to record
+        :param str path: Path to .parquet or .feather/.arrow file
+        :param variables: "instance.variable" names to record, or a mapping from column name to "instance.variable"
+            name or (slave_index, value_reference, variable_type)
+        :param int chunk_steps: Number of steps per pull and row group. Default 65536
+        :param str file_format: "parquet" or "feather". Detected from the file suffix if not given
+        :param str compression: Compression codec, such as "zstd", "lz4" or "snappy". Feather supports zstd and lz4.
+            Default "zstd"
+        :param CosimObserver observer: Optional time series observer already added to the execution. Must buffer at
+            least chunk_steps steps. A buffered observer of twice chunk_steps is created and added if not given
+        """
+        assert chunk_steps > 0, "Chunk steps must be a positive and non-zero integer"
+        pyarrow = _pyarrow()
+        self.execution = execution
+        self.path = os.fspath(path)
+        self.chunk_steps = chunk_steps
+        self.file_format = file_format or ("parquet" if self.path.lower().endswith((".parquet", ".pq")) else "feather")
+        if self.file_format not in ("parquet", "feather"):
+            raise ValueError(f"Unsupported file format '{self.file_format}'. Use 'parquet' or 'feather'")
+
+        self.__sampler = SampleSource(execution, variables, self.__write, chunk_steps=chunk_steps, observer=observer)
+        self.columns = self.__sampler.names
+        self.targets = self.__sampler.targets
+        self.observer = self.__sampler.observer
+
+        self.schema = pyarrow.schema(
+            [
+                ("time", pyarrow.int64()),
+                ("step", pyarrow.int64()),
+                *[
+                    (name, getattr(pyarrow, _ARROW_TYPES[variable_type])())
+                    for name, (_, _, variable_type) in zip(self.columns, self.targets, strict=True)
+                ],
+            ]
+        )
+        if self.file_format == "parquet":
+            self.__writer = pyarrow.parquet.ParquetWriter(self.path, self.schema, compression=compression)
+        else:
+            options = pyarrow.ipc.IpcWriteOptions(compression=compression)
+            self.__writer = pyarrow.ipc.new_file(self.path, self.schema, options=options)
+        self.rows_written = 0
+        self.closed = False
+
+    def step(self, step_count: int = 1) -> bool:
+        """
+        Advance the execution for 1 or multiple steps, pulling samples every chunk_steps steps
+
+        :param int step_count: Number of steps to advance with default of 1
+        :return: bool Successful step execution
+        """
+        return self.__sampler.step(step_count)
+
+    def pull(self) -> int:
+        """
+        Write all samples held by the observer that have not been written yet
+
+        :return: int Number of rows written
+        """
+        return self.__sampler.pull()
+
+    @property
+    def dropped_steps(self) -> int:
+        """
+        Number of steps overwritten in the observer buffer before they were written
+        """
+        return self.__sampler.dropped_steps
+
+    def close(self):
+        """
+        Write the remaining samples, stop observing the variables and close the file
+        """
+        if self.closed:
+            return
+        try:
+            self.__sampler.stop()
+        finally:
+            self.__writer.close()
+            self.closed = True
+
+    def __write(
+        self, time_points: npt.NDArray[np.int64], step_numbers: npt.NDArray[np.int64], values: npt.NDArray[np.float64]
+    ):
+        """
+        Helper function writing the samples of a chunk as one record batch
+        """
+        pyarrow = _pyarrow()
+        arrays = [pyarrow.array(time_points), pyarrow.array(step_numbers)]
+        for column, (_, _, variable_type) in enumerate(self.targets):
+            arrays.append(_to_arrow(pyarrow, values[:, column], variable_type))
+        batch = pyarrow.record_batch(arrays, schema=self.schema)
+        if self.file_format == "parquet":
+            self.__writer.write_batch(batch, row_group_size=self.chunk_steps)
+        else:
+            self.__writer.write_batch(batch)
+        self.rows_written += len(step_numbers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_: object):
+        self.close()
+
+
+def _to_arrow(pyarrow: Any, values: npt.NDArray[np.float64], variable_type: CosimVariableType) -> Any:
+    """
+    Arrow array of one column of samples. Steps missing for the variable are null
+    """
+    missing = np.isnan(values)
+    if variable_type == CosimVariableType.REAL:
+        return pyarrow.array(values, mask=missing if missing.any() else None)
+    integers = np.where(missing, 0, values).astype(np.int32)
+    return pyarrow.array(integers, mask=missing if missing.any() else None)
+
+
+def _pyarrow() -> Any:
+    """
+    Import pyarrow with its Parquet and IPC modules on first use, since pyarrow is an optional dependency
+    """
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError("Writing Parquet or Feather files requires pyarrow. Install libcosimpy[parquet]") from error
+    return pyarrow
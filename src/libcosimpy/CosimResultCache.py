@@ -0,0 +1,238 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+import zipfile
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .CosimMetadataCache import OSP_CONFIG_FILE, SSP_CONFIG_FILE, MetadataCache, default_cache_dir, dependencies
+from .CosimScenario import CompiledScenario
+
+# Version of the run key and entry layout. Entries written with another version are never looked up
+RESULT_CACHE_VERSION = 2
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of recorded simulation outputs. A run is keyed by the content of its system
+    configuration and every file it depends on, the initial values, the scenario, the step size, the number of steps
+    and the recorded outputs, so a repeated run is answered from disk without instantiating any FMU. Files are
+    identified by content rather than location, so a copied configuration folder shares entries with the original.
+
+    Entries are NumPy .npz files written atomically, so several processes may share a cache directory. The least
+    recently used entries are removed when the cache exceeds max_bytes or max_entries
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str | os.PathLike[str]] = None,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        :param str cache_dir: Optional cache directory. Defaults to a results folder in default_cache_dir()
+        :param int max_bytes: Optional limit on the total size of the entries in bytes
+        :param int max_entries: Optional limit on the number of entries
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir() / "results"
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.__files = MetadataCache(self.cache_dir)
+
+    def run_key(
+        self,
+        config_path: str,
+        outputs: Sequence[str],
+        step_count: int,
+        step_size: int | float,
+        every: int = 1,
+        initial_values: Optional[Mapping[str, int | float | bool | str]] = None,
+        scenario: Optional[CompiledScenario] = None,
+    ) -> str:
+        """
+        Key of the entry holding the outputs of a run. Equal to parameter_key() of the sweep_key() of the other inputs
+
+        :param str config_path: Path to OspSystemStructure.xml, .ssd file or directory containing either
+        :param list of str outputs: Recorded variables, named "instance.variable"
+        :param int step_count: Number of steps simulated
+        :param int step_size: Step size in nanos
+        :param int every: Number of steps between recorded samples. Default 1
+        :param dict initial_values: Optional initial values set before the run, by "instance.variable" name
+        :param CompiledScenario scenario: Optional scenario loaded into the run
+        :return: str Hex digest of all inputs of the run
+        """
+        return self.parameter_key(
+            self.sweep_key(config_path, outputs, step_count, step_size, every, scenario), initial_values
+        )
+
+    def sweep_key(
+        self,
+        config_path: str,
+        outputs: Sequence[str],
+        step_count: int,
+        step_size: int | float,
+        every: int = 1,
+        scenario: Optional[CompiledScenario] = None,
+    ) -> str:
+        """
+        Digest of the inputs shared by the runs of a sweep. The configuration is parsed and its files are hashed here,
+        so a sweep computes this once and keys each run with parameter_key()
+
+        :param str config_path: Path to OspSystemStructure.xml, .ssd file or directory containing either
+        :param list of str outputs: Recorded variables, named "instance.variable"
+        :param int step_count: Number of steps simulated
+        :param int step_size: Step size in nanos
+        :param int every: Number of steps between recorded samples. Default 1
+        :param CompiledScenario scenario: Optional scenario loaded into the runs
+        :return: str Hex digest of the shared inputs
+        """
+        config_file = _config_file(Path(config_path)).resolve()
+        files = {}
+        for path in [config_file, *dependencies(config_file)]:
+            name = os.path.relpath(path, config_file.parent)
+            files[name] = self.__files.file_digest(path) if path.is_file() else None
+        description = {
+            "version": RESULT_CACHE_VERSION,
+            "config": config_file.name,
+            "files": files,
+            "outputs": list(outputs),
+            "step_count": int(step_count),
+            "step_size": int(step_size),
+            "every": int(every),
+            "scenario": scenario.to_dict() if scenario is not None else None,
+        }
+        return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+    @staticmethod
+    def parameter_key(sweep_key: str, initial_values: Optional[Mapping[str, int | float | bool | str]] = None) -> str:
+        """
+        Key of the entry holding the outputs of one run of a sweep
+
+        :param str sweep_key: Digest from sweep_key()
+        :param dict initial_values: Optional initial values set before the run, by "instance.variable" name
+        :return: str Hex digest of the sweep and the initial values of the run
+        """
+        description = {
+            "sweep": sweep_key,
+            # Type names keep 1, 1.0 and True apart
+            "initial_values": sorted(
+                [name, type(value).__name__, value] for name, value in _plain(initial_values or {}).items()
+            ),
+        }
+        return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]]:
+        """
+        Stored outputs of a run
+
+        :param str key: Key from run_key()
+        :return: (time_points, values) with values of shape (samples, outputs), or None on a miss
+        """
+        path = self.__entry_path(key)
+        try:
+            with np.load(path) as entry:
+                result = (entry["time_points"], entry["values"])
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            self.misses += 1
+            return None
+        try:
+            _touch(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return result
+
+    def put(self, key: str, time_points: npt.ArrayLike, values: npt.ArrayLike):
+        """
+        Store the outputs of a run, then evict entries if the cache is over its limits
+
+        :param str key: Key from run_key()
+        :param time_points: Time of each sample in nanos
+        :param values: Samples of shape (samples, outputs)
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                np.savez(file, time_points=np.asarray(time_points, dtype=np.int64), values=np.asarray(values))
+            _touch(temporary_path)
+            os.replace(temporary_path, self.__entry_path(key))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache is within max_bytes and max_entries
+        """
+        if self.max_bytes is None and self.max_entries is None:
+            return
+        entries = []
+        for path in self.cache_dir.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort(reverse=True)
+
+        total_bytes = 0
+        for count, (_, size, path) in enumerate(entries, start=1):
+            total_bytes += size
+            over_entries = self.max_entries is not None and count > self.max_entries
+            over_bytes = self.max_bytes is not None and total_bytes > self.max_bytes
+            if over_entries or over_bytes:
+                path.unlink(missing_ok=True)
+
+    def clear(self):
+        """
+        Remove all entries from the cache
+        """
+        if self.cache_dir.is_dir():
+            for path in self.cache_dir.glob("*.npz"):
+                path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.cache_dir.glob("*.npz")) if self.cache_dir.is_dir() else 0
+
+    def __contains__(self, key: str) -> bool:
+        return self.__entry_path(key).is_file()
+
+    def __entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npz"
+
+
+def _config_file(config_path: Path) -> Path:
+    """
+    Configuration file of a path that may be a directory, chosen as in CosimSweep.create_execution
+    """
+    if not config_path.is_dir():
+        return config_path
+    if (config_path / SSP_CONFIG_FILE).is_file():
+        return config_path / SSP_CONFIG_FILE
+    return config_path / OSP_CONFIG_FILE
+
+
+def _touch(path: str | os.PathLike[str]):
+    """
+    Mark an entry as used now. The modification time orders entries for eviction, and is set from the clock rather
+    than by the file system, whose timestamps may be too coarse to order entries used in quick succession
+    """
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+def _plain(values: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Initial values with NumPy scalars converted to the equivalent Python values
+    """
+    return {name: value.item() if isinstance(value, np.generic) else value for name, value in values.items()}
@@ -0,0 +1,407 @@
+import json
+import os
+from collections.abc import Mapping, Sequence
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ._sampling import SampleSource
+from .CosimEnums import CosimVariableType
+from .CosimExecution import CosimExecution
+from .CosimObserver import CosimObserver
+
+RESULT_STORE_MAGIC = b"COSIMRS1"
+RESULT_STORE_VERSION = 1
+
+# Fixed part of the header. row_count is the only field changed after creation and is written after the rows it counts
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("column_count", "<u4"),
+        ("row_count", "<u8"),
+        ("data_offset", "<u8"),
+    ]
+)
+# Column metadata is stored as JSON after the fixed header, and rows start at a page boundary after it
+_DATA_ALIGNMENT = 4096
+
+# Storage type of each variable type
+_COLUMN_DTYPES = {
+    CosimVariableType.REAL: "<f8",
+    CosimVariableType.INTEGER: "<i4",
+    CosimVariableType.BOOLEAN: "?",
+}
+
+
+class ResultStore:
+    """
+    Append-only store of samples in a memory-mapped binary file. Each row holds the step number, the time in nanos and
+    one fixed-width value per column, so a row is found by its step without parsing. The file is grown in blocks of
+    growth_rows rows, and the row count in the header is updated after the rows it counts have been written, so
+    ResultStoreReader instances in other processes can map the file and read complete rows while it is being written.
+
+    Rows are appended with append(), usually by a StoreRecorder feeding the store from an observer
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        columns: Mapping[str, CosimVariableType],
+        growth_rows: int = 65536,
+    ):
+        """
+        :param str path: Path to the store file. An existing file is overwritten
+        :param dict columns: Type of each column by name. REAL, INTEGER and BOOLEAN columns are supported
+        :param int growth_rows: Number of rows the file is grown by when full. Default 65536
+        """
+        assert growth_rows > 0, "Growth rows must be a positive and non-zero integer"
+        self.path = os.fspath(path)
+        self.growth_rows = growth_rows
+        self.columns = list(columns)
+        for name, variable_type in columns.items():
+            if name in ("step", "time"):
+                raise ValueError(f"Column name '{name}' is reserved")
+            if CosimVariableType(variable_type) not in _COLUMN_DTYPES:
+                raise ValueError(f"Column '{name}' has type {variable_type}, which can not be stored")
+        metadata = json.dumps(
+            {"columns": [[name, CosimVariableType(variable_type).name] for name, variable_type in columns.items()]}
+        ).encode()
+        self.row_dtype = _row_dtype(
+            [(name, CosimVariableType(variable_type)) for name, variable_type in columns.items()]
+        )
+        data_offset = -(-(_HEADER_DTYPE.itemsize + len(metadata)) // _DATA_ALIGNMENT) * _DATA_ALIGNMENT
+
+        with open(self.path, "wb") as file:
+            header = np.zeros(1, dtype=_HEADER_DTYPE)
+            header[0] = (RESULT_STORE_MAGIC, RESULT_STORE_VERSION, len(self.columns), 0, data_offset)
+            file.write(header.tobytes())
+            file.write(metadata)
+            file.truncate(data_offset + growth_rows * self.row_dtype.itemsize)
+        self.__header = np.memmap(self.path, dtype=_HEADER_DTYPE, mode="r+", shape=(1,))
+        self.__data_offset = data_offset
+        self.__rows: Optional[np.memmap[Any, Any]] = None
+        self.__capacity = 0
+        self.__map_rows(growth_rows)
+        self.row_count = 0
+        self.closed = False
+
+    def append(
+        self,
+        step_numbers: npt.ArrayLike,
+        time_points: npt.ArrayLike,
+        values: npt.ArrayLike | Mapping[str, npt.ArrayLike],
+    ):
+        """
+        Append rows to the store
+
+        :param step_numbers: Step number of each row, increasing across appends
+        :param time_points: Time of each row in nanos
+        :param values: Array of shape (rows, columns) in column order, or a mapping from column name to the values of
+            the column. Columns missing from a mapping are zero. INTEGER and BOOLEAN columns can not hold NaN
+        """
+        step_numbers = np.atleast_1d(np.asarray(step_numbers, dtype=np.int64))
+        count = len(step_numbers)
+        if count == 0:
+            return
+        if isinstance(values, Mapping):
+            columns = [np.asarray(values.get(name, 0)) for name in self.columns]
+        else:
+            values = np.asarray(values).reshape(count, len(self.columns))
+            columns = [values[:, column] for column in range(len(self.columns))]
+        for name, column in zip(self.columns, columns, strict=True):
+            # Casting NaN to an integer gives an arbitrary value, so rows are rejected rather than stored wrong
+            if self.row_dtype[name].kind != "f" and column.dtype.kind == "f" and np.isnan(column).any():
+                raise ValueError(f"Column '{name}' can not store NaN")
+
+        end = self.row_count + count
+        if end > self.__capacity:
+            self.__map_rows(-(-end // self.growth_rows) * self.growth_rows)
+        rows = self.__rows[self.row_count : end]  # pyright: ignore[reportOptionalSubscript]
+        rows["step"] = step_numbers
+        rows["time"] = time_points
+        for name, column in zip(self.columns, columns, strict=True):
+            rows[name] = column
+        self.row_count = end
+        self.__header["row_count"] = end
+
+    def flush(self):
+        """
+        Write the mapped pages to disk. Readers in other processes see appended rows without flushing
+        """
+        self.__rows.flush()  # pyright: ignore[reportOptionalMemberAccess]
+        self.__header.flush()
+
+    def close(self):
+        """
+        Flush the store and truncate the file to the rows written
+        """
+        if self.closed:
+            return
+        self.flush()
+        self.__rows = None
+        self.__header = None
+        with open(self.path, "r+b") as file:
+            file.truncate(self.__data_offset + self.row_count * self.row_dtype.itemsize)
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_: object):
+        self.close()
+
+    def __map_rows(self, capacity: int):
+        """
+        Helper function growing the file to hold capacity rows and mapping them
+        """
+        if self.__rows is not None:
+            self.__rows.flush()
+            self.__rows = None
+            with open(self.path, "r+b") as file:
+                file.truncate(self.__data_offset + capacity * self.row_dtype.itemsize)
+        self.__rows = np.memmap(
+            self.path, dtype=self.row_dtype, mode="r+", offset=self.__data_offset, shape=(capacity,)
+        )
+        self.__capacity = capacity
+
+
+class ResultStoreReader:
+    """
+    Read-only zero-copy view of a ResultStore file, which may still be written by another process. Column arrays are
+    views of the mapped file. Call refresh() to see rows appended since the reader was opened or last refreshed
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """
+        :param str path: Path to the store file
+        """
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as file:
+            header = np.frombuffer(file.read(_HEADER_DTYPE.itemsize), dtype=_HEADER_DTYPE)[0]
+            if header["magic"] != RESULT_STORE_MAGIC:
+                raise ValueError(f"{self.path} is not a result store")
+            if header["version"] != RESULT_STORE_VERSION:
+                raise ValueError(f"{self.path} has unsupported result store version {header['version']}")
+            data_offset = int(header["data_offset"])
+            metadata = json.loads(file.read(data_offset - _HEADER_DTYPE.itemsize).rstrip(b"\0"))
+        self.columns = [name for name, _ in metadata["columns"]]
+        self.column_types = {name: CosimVariableType[type_name] for name, type_name in metadata["columns"]}
+        self.row_dtype = _row_dtype(list(self.column_types.items()))
+        self.__data_offset = data_offset
+        self.__header = np.memmap(self.path, dtype=_HEADER_DTYPE, mode="r", shape=(1,))
+        self.__rows: npt.NDArray[Any] = np.empty(0, dtype=self.row_dtype)
+        self.refresh()
+
+    def refresh(self) -> int:
+        """
+        Map rows appended since the last refresh
+
+        :return: int Number of rows in the store
+        """
+        row_count = int(self.__header["row_count"][0])
+        if row_count != len(self.__rows):
+            self.__rows = np.memmap(
+                self.path, dtype=self.row_dtype, mode="r", offset=self.__data_offset, shape=(row_count,)
+            )
+        return row_count
+
+    def __len__(self):
+        return len(self.__rows)
+
+    @property
+    def rows(self) -> npt.NDArray[Any]:
+        """
+        All rows as a structured array with step, time and one field per column
+        """
+        return self.__rows
+
+    @property
+    def step_numbers(self) -> npt.NDArray[np.int64]:
+        return self.__rows["step"]
+
+    @property
+    def time_points(self) -> npt.NDArray[np.int64]:
+        return self.__rows["time"]
+
+    def column(self, name: str) -> npt.NDArray[Any]:
+        """
+        Values of one column
+
+        :param str name: Column name
+        :return: View of the column in the mapped file
+        """
+        return self.__rows[name]
+
+    def row_of_step(self, step: int) -> Optional[int]:
+        """
+        Row holding a step, found by offset when steps are contiguous and by binary search otherwise
+
+        :param int step: Step number
+        :return: int Row index, or None if the step is not stored
+        """
+        steps = self.__rows["step"]
+        if not len(steps):
+            return None
+        row = step - int(steps[0])
+        if not (0 <= row < len(steps) and steps[row] == step):
+            row = int(np.searchsorted(steps, step))
+        return row if row < len(steps) and steps[row] == step else None
+
+    def steps(self, from_step: int, to_step: Optional[int] = None) -> npt.NDArray[Any]:
+        """
+        Rows of a range of steps
+
+        :param int from_step: First step
+        :param int to_step: Optional step after the last step. Defaults to the end of the store
+        :return: Structured view of the rows
+        """
+        steps = self.__rows["step"]
+        start = int(np.searchsorted(steps, from_step))
+        end = len(steps) if to_step is None else int(np.searchsorted(steps, to_step))
+        return self.__rows[start:end]
+
+    def between(self, start_time: int | float, stop_time: int | float) -> npt.NDArray[Any]:
+        """
+        Rows with start_time <= time < stop_time
+
+        :param int start_time: Start time in nanos
+        :param int stop_time: Stop time in nanos
+        :return: Structured view of the rows
+        """
+        times = self.__rows["time"]
+        return self.__rows[int(np.searchsorted(times, start_time)) : int(np.searchsorted(times, stop_time))]
+
+
+class StoreRecorder:
+    """
+    Records variables of an execution into a ResultStore. With source "time_series" samples are pulled from a buffered
+    time series observer every chunk_steps steps, which only supports REAL and INTEGER variables. With source
+    "last_value" the variables are read from a last value observer after every step taken through step(), and the
+    rows are numbered from the current time of the execution, which requires its step size.
+
+    A time series observer may hold steps without a sample of every variable, such as when a time series was
+    restarted or at the edge of a wrapped buffer. Such steps are stored with the last stored value of the missing
+    variables, and steps before every variable has been sampled are not stored. Both are counted in incomplete_steps
+    """
+
+    def __init__(
+        self,
+        execution: CosimExecution,
+        path: str | os.PathLike[str],
+        variables: Sequence[str] | Mapping[str, str | tuple[int, int, CosimVariableType]],
+        source: str = "time_series",
+        chunk_steps: int = 4096,
+        observer: Optional[CosimObserver] = None,
+        step_size: Optional[int | float] = None,
+    ):
+        """
+        :param CosimExecution execution: Execution to record
+        :param str path: Path to the store file. An existing file is overwritten
+        :param variables: "instance.variable" names to record, or a mapping from column name to "instance.variable"
+            name or (slave_index, value_reference, variable_type)
+        :param str source: "time_series" or "last_value". Default "time_series"
+        :param int chunk_steps: Number of steps per pull from a time series observer. Default 4096
+        :param CosimObserver observer: Optional observer of the kind given by source, already added to the execution.
+            A time series observer must buffer at least chunk_steps steps. Created and added if not given
+        :param int step_size: Step size of the execution in nanos. Required with source "last_value"
+        """
+        if source == "last_value" and step_size is None:
+            raise ValueError("A step size is required to number the steps read from a last value observer")
+        self.execution = execution
+        self.__sampler = SampleSource(
+            execution,
+            variables,
+            self.__append,
+            source=source,
+            chunk_steps=chunk_steps,
+            observer=observer,
+            step_size=step_size,
+        )
+        self.source = source
+        self.chunk_steps = chunk_steps
+        self.observer = self.__sampler.observer
+        self.targets = self.__sampler.targets
+        self.store = ResultStore(
+            path,
+            {
+                name: variable_type
+                for name, (_, _, variable_type) in zip(self.__sampler.names, self.targets, strict=True)
+            },
+        )
+        self.incomplete_steps = 0
+        self.__last_row = np.full(len(self.targets), np.nan)
+
+    def step(self, step_count: int = 1) -> bool:
+        """
+        Advance the execution for 1 or multiple steps, recording the variables
+
+        :param int step_count: Number of steps to advance with default of 1
+        :return: bool Successful step execution
+        """
+        return self.__sampler.step(step_count)
+
+    def read(self):
+        """
+        Append the current values from the last value observer as the row of the next step
+        """
+        self.__sampler.read()
+
+    def pull(self) -> int:
+        """
+        Append all samples held by the time series observer that have not been stored yet
+
+        :return: int Number of rows appended
+        """
+        return self.__sampler.pull()
+
+    @property
+    def dropped_steps(self) -> int:
+        """
+        Number of steps overwritten in the time series observer buffer before they were stored
+        """
+        return self.__sampler.dropped_steps
+
+    def close(self):
+        """
+        Store the remaining samples, stop observing the variables and close the store
+        """
+        if self.store.closed:
+            return
+        try:
+            self.__sampler.stop()
+        finally:
+            self.store.close()
+
+    def __append(
+        self, time_points: npt.NDArray[np.int64], step_numbers: npt.NDArray[np.int64], values: npt.NDArray[np.float64]
+    ):
+        missing = np.isnan(values)
+        if missing.any():
+            # Each missing value is taken from the last row holding one, starting from the last stored row. Rows still
+            # missing values precede the first sample of a variable and are left out
+            self.incomplete_steps += int(missing.any(axis=1).sum())
+            values = np.vstack([self.__last_row, values])
+            source_rows = np.where(np.isnan(values), 0, np.arange(len(values))[:, None])
+            values = np.take_along_axis(values, np.maximum.accumulate(source_rows, axis=0), axis=0)[1:]
+            complete = ~np.isnan(values).any(axis=1)
+            time_points, step_numbers, values = time_points[complete], step_numbers[complete], values[complete]
+        if len(step_numbers):
+            self.store.append(step_numbers, time_points, values)
+            self.__last_row[:] = values[-1]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_: object):
+        self.close()
+
+
+def _row_dtype(columns: Sequence[tuple[str, CosimVariableType]]) -> np.dtype[Any]:
+    """
+    Packed row layout of a store with the given columns
+    """
+    return np.dtype(
+        [("step", "<i8"), ("time", "<i8"), *[(name, _COLUMN_DTYPES[variable_type]) for name, variable_type in columns]]
+    )
@@ -0,0 +1,412 @@
+import json
+from dataclasses import dataclass, field
+from enum import Enum
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ._internal import get_last_error_message
+from .CosimEnums import CosimVariableType
+from .CosimExecution import CosimExecution
+from .CosimManipulator import CosimManipulator
+from .CosimModelIndex import ModelIndex
+from .CosimObserver import CosimObserver
+
+
+class ScenarioAction(Enum):
+    """
+    Enum for scenario event actions
+    """
+
+    OVERRIDE = 0
+    BIAS = 1
+    RESET = 2
+
+
+# Row layout of a compiled event table. Times are in nanos and values are stored as float for all supported types
+SCENARIO_EVENT_DTYPE = np.dtype(
+    [
+        ("time", np.int64),
+        ("slave_index", np.int32),
+        ("value_reference", np.uint32),
+        ("type", np.int8),
+        ("action", np.int8),
+        ("value", np.float64),
+    ]
+)
+
+_EVENT_KEYS = {"time", "model", "variable", "action", "value"}
+_DEFAULT_KEYS = {"model", "variable", "action"}
+_SCENARIO_KEYS = {"description", "defaults", "events", "end"}
+
+
+@dataclass
+class CompiledScenario:
+    """
+    Scenario with names resolved to slave indices and value references, and events sorted by time. Created with
+    compile_scenario(). The event table can be played by ScenarioRunner or written back as a normalised scenario file
+    for CosimExecution.load_scenario()
+    """
+
+    events: npt.NDArray[Any]
+    # (model, variable) name of each event, used when writing the scenario back to file
+    names: list[tuple[str, str]]
+    end: Optional[int] = None
+    description: Optional[str] = None
+    targets: list[tuple[int, int, CosimVariableType]] = field(init=False)
+
+    def __post_init__(self):
+        self.targets = list(
+            dict.fromkeys(
+                (int(event["slave_index"]), int(event["value_reference"]), CosimVariableType(int(event["type"])))
+                for event in self.events
+            )
+        )
+
+    def __len__(self):
+        return len(self.events)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Normalised scenario with explicit model, variable and action for every event, sorted by time
+
+        :return: dict in the scenario file format
+        """
+        events = []
+        for event, (model, variable) in zip(self.events, self.names, strict=True):
+            action = ScenarioAction(int(event["action"]))
+            entry: dict[str, Any] = {
+                "time": int(event["time"]) / 1e9,
+                "model": model,
+                "variable": variable,
+                "action": action.name.lower(),
+            }
+            if action != ScenarioAction.RESET:
+                entry["value"] = _from_float(float(event["value"]), CosimVariableType(int(event["type"])))
+            events.append(entry)
+        scenario: dict[str, Any] = {}
+        if self.description is not None:
+            scenario["description"] = self.description
+        scenario["events"] = events
+        if self.end is not None:
+            scenario["end"] = self.end / 1e9
+        return scenario
+
+    def save(self, path: str):
+        """
+        Write the normalised scenario to a JSON or YAML file, chosen from the file suffix
+
+        :param str path: Path of file to write
+        """
+        scenario = self.to_dict()
+        with open(path, "w", encoding="utf-8") as file:
+            if Path(path).suffix.lower() in (".yml", ".yaml"):
+                _yaml().safe_dump(scenario, file, sort_keys=False)
+            else:
+                json.dump(scenario, file, indent=2)
+
+
+def compile_scenario(scenario: str | dict[str, Any], model_index: ModelIndex | CosimExecution) -> CompiledScenario:
+    """
+    Parse, validate and resolve a scenario in the JSON/YAML scenario format against the slaves of an execution. All
+    problems are reported together in a single ValueError
+
+    :param scenario: Path to JSON or YAML scenario file, or the parsed scenario
+    :param model_index: ModelIndex or execution to resolve model and variable names in
+    :return: CompiledScenario object
+    """
+    if isinstance(model_index, CosimExecution):
+        model_index = model_index.model_index()
+    if not isinstance(scenario, dict):
+        scenario = _load(scenario)
+
+    errors: list[str] = []
+    unknown = set(scenario) - _SCENARIO_KEYS
+    if unknown:
+        errors.append(f"Unknown keys {sorted(unknown)}")
+    defaults = scenario.get("defaults") or {}
+    if set(defaults) - _DEFAULT_KEYS:
+        errors.append(f"Unknown keys {sorted(set(defaults) - _DEFAULT_KEYS)} in defaults")
+    raw_events = scenario.get("events")
+    if not isinstance(raw_events, list):
+        errors.append("'events' must be a list")
+        raw_events = []
+
+    rows: list[tuple[int, int, int, int, int, float]] = []
+    names: list[tuple[str, str]] = []
+    for number, raw_event in enumerate(raw_events):
+        event = {**defaults, **raw_event}
+        context = f"Event {number}"
+        if set(raw_event) - _EVENT_KEYS:
+            errors.append(f"{context}: unknown keys {sorted(set(raw_event) - _EVENT_KEYS)}")
+        missing = [key for key in ("time", "model", "variable", "action") if key not in event]
+        if missing:
+            errors.append(f"{context}: missing {missing}")
+            continue
+
+        time = _seconds_to_nanos(event["time"])
+        if time is None:
+            errors.append(f"{context}: time must be a non-negative number")
+            continue
+        try:
+            action = ScenarioAction[str(event["action"]).upper()]
+        except KeyError:
+            errors.append(f"{context}: unknown action '{event['action']}'")
+            continue
+        model, variable_name = str(event["model"]), str(event["variable"])
+        if model not in model_index:
+            errors.append(f"{context}: no model named '{model}'")
+            continue
+        try:
+            variable = model_index.variable(model, variable_name)
+        except KeyError:
+            errors.append(f"{context}: model '{model}' has no variable named '{variable_name}'")
+            continue
+
+        value = 0.0
+        if variable.type == CosimVariableType.STRING:
+            errors.append(f"{context}: string variable '{model}.{variable_name}' can not be used in scenarios")
+            continue
+        if action == ScenarioAction.BIAS and variable.type == CosimVariableType.BOOLEAN:
+            errors.append(f"{context}: bias can not be applied to boolean variable '{model}.{variable_name}'")
+            continue
+        if action != ScenarioAction.RESET:
+            if "value" not in event:
+                errors.append(f"{context}: missing ['value']")
+                continue
+            value = _to_float(event["value"], variable.type)
+            if value is None:
+                errors.append(f"{context}: invalid {variable.type.name.lower()} value {event['value']!r}")
+                continue
+
+        rows.append((time, variable.slave_index, variable.value_reference, variable.type.value, action.value, value))
+        names.append((model, variable_name))
+
+    end = None
+    if scenario.get("end") is not None:
+        end = _seconds_to_nanos(scenario["end"])
+        if end is None:
+            errors.append("end must be a non-negative number")
+    if errors:
+        raise ValueError("Invalid scenario:\n" + "\n".join(errors))
+
+    events = np.array(rows, dtype=SCENARIO_EVENT_DTYPE)
+    # Events at the same time keep the order of the file
+    order = np.argsort(events["time"], kind="stable")
+    return CompiledScenario(
+        events=events[order],
+        names=[names[i] for i in order],
+        end=end,
+        description=scenario.get("description"),
+    )
+
+
+class ScenarioRunner:
+    """
+    Plays a compiled scenario through an override manipulator from Python. Events due at the start of each step are
+    applied before the step with one call per slave, variable type and action, and all variables touched by the
+    scenario are reset when its end time is reached.
+
+    Unlike the scenario manager of libcosim, which keeps a bias applied to the variable as it changes, a bias is
+    applied as an override of the value observed when the first bias of the variable is due. Like in libcosim, a later
+    bias replaces the earlier one instead of adding to it, until the variable is overridden or reset
+    """
+
+    def __init__(
+        self,
+        execution: CosimExecution,
+        scenario: CompiledScenario,
+        step_size: int | float,
+        manipulator: Optional[CosimManipulator] = None,
+    ):
+        """
+        :param CosimExecution execution: Execution to drive
+        :param CompiledScenario scenario: Scenario to play
+        :param int step_size: Step size of the execution in nanos
+        :param CosimManipulator manipulator: Optional override manipulator already added to the execution. A new one is
+            created and added if not given
+        """
+        assert step_size > 0, "Step size must be a positive and non-zero integer"
+        self.execution = execution
+        self.scenario = scenario
+        self.step_size = int(step_size)
+        if manipulator is None:
+            manipulator = CosimManipulator.create_override()
+            if not execution.add_manipulator(manipulator):
+                raise RuntimeError(f"Unable to add override manipulator: {get_last_error_message()}")
+        self.manipulator = manipulator
+
+        self.__observer: Optional[CosimObserver] = None
+        if np.any(scenario.events["action"] == ScenarioAction.BIAS.value):
+            self.__observer = CosimObserver.create_last_value()
+            if not execution.add_observer(self.__observer):
+                raise RuntimeError(f"Unable to add last value observer: {get_last_error_message()}")
+        # Value observed before the first bias of each biased variable, keyed by slave index, type and value reference
+        self.__bias_bases: dict[tuple[int, CosimVariableType, int], float] = {}
+
+        # Events grouped by time, then by slave, type and action, in the order of the table
+        self.__batches: list[
+            tuple[int, list[tuple[int, CosimVariableType, ScenarioAction, list[int], list[float]]]]
+        ] = []
+        for time, time_events in groupby(scenario.events, key=lambda event: int(event["time"])):
+            calls: dict[tuple[int, int, int], tuple[list[int], list[float]]] = {}
+            for event in time_events:
+                key = (int(event["slave_index"]), int(event["type"]), int(event["action"]))
+                references, values = calls.setdefault(key, ([], []))
+                references.append(int(event["value_reference"]))
+                values.append(float(event["value"]))
+            self.__batches.append(
+                (
+                    time,
+                    [
+                        (slave_index, CosimVariableType(variable_type), ScenarioAction(action), references, values)
+                        for (slave_index, variable_type, action), (references, values) in calls.items()
+                    ],
+                )
+            )
+        self.__next_batch = 0
+        self.__ended = False
+
+    @property
+    def finished(self) -> bool:
+        """
+        True when all events have been applied and, if the scenario has an end time, the end has been reached
+        """
+        return self.__next_batch == len(self.__batches) and (self.scenario.end is None or self.__ended)
+
+    def step(self, step_count: int = 1) -> bool:
+        """
+        Advance the execution for 1 or multiple steps, applying the events due before each step
+
+        :param int step_count: Number of steps to advance with default of 1
+        :return: bool Successful step execution
+        """
+        step_time = self.execution.status().current_time
+        for _ in range(step_count):
+            if not self.__apply_due(step_time) or not self.execution.step():
+                return False
+            step_time += self.step_size
+        return True
+
+    def simulate_until(self, target_time: int | float) -> bool:
+        """
+        Step the execution until target time is reached
+
+        :param int target_time: End of simulation time in nanos
+        :return: bool Successful simulation until target time
+        """
+        remaining = int(target_time) - self.execution.status().current_time
+        return self.step(-(-remaining // self.step_size)) if remaining > 0 else True
+
+    def __apply_due(self, step_time: int) -> bool:
+        """
+        Helper function applying every event at or before step_time that has not been applied, and the end
+        """
+        if self.__ended:
+            return True
+        if self.scenario.end is not None and step_time >= self.scenario.end:
+            self.__ended = True
+            return self.__reset_all()
+        success = True
+        while self.__next_batch < len(self.__batches) and self.__batches[self.__next_batch][0] <= step_time:
+            for slave_index, variable_type, action, references, values in self.__batches[self.__next_batch][1]:
+                success &= self.__apply(slave_index, variable_type, action, references, values)
+            self.__next_batch += 1
+        return success
+
+    def __apply(
+        self,
+        slave_index: int,
+        variable_type: CosimVariableType,
+        action: ScenarioAction,
+        references: list[int],
+        values: list[float],
+    ) -> bool:
+        manipulator = self.manipulator
+        keys = [(slave_index, variable_type, reference) for reference in references]
+        if action != ScenarioAction.BIAS:
+            for key in keys:
+                self.__bias_bases.pop(key, None)
+        if action == ScenarioAction.RESET:
+            return manipulator.reset_variables(slave_index, variable_type, references)
+        if action == ScenarioAction.BIAS:
+            assert self.__observer is not None
+            unbiased = [
+                reference for key, reference in zip(keys, references, strict=True) if key not in self.__bias_bases
+            ]
+            if unbiased:
+                if variable_type == CosimVariableType.REAL:
+                    current = self.__observer.last_real_values(slave_index, unbiased)
+                else:
+                    current = self.__observer.last_integer_values(slave_index, unbiased)
+                for reference, value in zip(unbiased, current, strict=True):
+                    self.__bias_bases[(slave_index, variable_type, reference)] = value
+            values = [self.__bias_bases[key] + bias for key, bias in zip(keys, values, strict=True)]
+        if variable_type == CosimVariableType.REAL:
+            return manipulator.slave_real_values(slave_index, references, values)
+        if variable_type == CosimVariableType.INTEGER:
+            return manipulator.slave_integer_values(slave_index, references, [int(value) for value in values])
+        return manipulator.slave_boolean_values(slave_index, references, [bool(value) for value in values])
+
+    def __reset_all(self) -> bool:
+        """
+        Helper function resetting every variable touched by the scenario, one call per slave and type
+        """
+        grouped: dict[tuple[int, CosimVariableType], list[int]] = {}
+        for slave_index, value_reference, variable_type in self.scenario.targets:
+            grouped.setdefault((slave_index, variable_type), []).append(value_reference)
+        success = True
+        for (slave_index, variable_type), references in grouped.items():
+            success &= self.manipulator.reset_variables(slave_index, variable_type, references)
+        self.__bias_bases.clear()
+        return success
+
+
+def _seconds_to_nanos(value: Any) -> Optional[int]:
+    if isinstance(value, bool) or not isinstance(value, int | float) or value < 0:
+        return None
+    return round(value * 1e9)
+
+
+def _to_float(value: Any, variable_type: CosimVariableType) -> Optional[float]:
+    """
+    Scenario value as stored in the event table, or None if it does not fit the variable type
+    """
+    if variable_type == CosimVariableType.BOOLEAN:
+        if isinstance(value, bool) or value in (0, 1):
+            return float(value)
+        return None
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    if variable_type == CosimVariableType.INTEGER and value != int(value):
+        return None
+    return float(value)
+
+
+def _from_float(value: float, variable_type: CosimVariableType) -> int | float | bool:
+    if variable_type == CosimVariableType.BOOLEAN:
+        return bool(value)
+    if variable_type == CosimVariableType.INTEGER:
+        return int(value)
+    return value
+
+
+def _load(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as file:
+        if Path(path).suffix.lower() in (".yml", ".yaml"):
+            return _yaml().safe_load(file)
+        return json.load(file)
+
+
+def _yaml() -> Any:
+    """
+    Import yaml on first use, since PyYAML is an optional dependency
+    """
+    try:
+        import yaml
+    except ImportError as error:
+        raise ImportError("Reading and writing YAML scenarios requires PyYAML. Install libcosimpy[yaml]") from error
+    return yaml
@@ -0,0 +1,233 @@
+from enum import Enum
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ._internal import get_last_error_message
+from .CosimEnums import CosimVariableType
+from .CosimExecution import CosimExecution
+from .CosimManipulator import CosimManipulator, WritePlan
+
+
+class SignalInterpolation(Enum):
+    """
+    Interpolation between the samples of a played signal. Signals hold their first and last value outside the sampled
+    time range
+    """
+
+    HOLD = "hold"
+    LINEAR = "linear"
+    SPLINE = "spline"
+
+
+class SignalPlayer:
+    """
+    Plays sampled signals into variables of an execution through an override manipulator. Signals are resampled at the
+    start of every step by compile(), so stepping the player sets all played variables with a single write plan before
+    each step of the execution
+    """
+
+    def __init__(
+        self,
+        execution: CosimExecution,
+        step_size: int | float,
+        manipulator: Optional[CosimManipulator] = None,
+        start_time: int | float = 0,
+    ):
+        """
+        :param CosimExecution execution: Execution to drive
+        :param int step_size: Step size of the execution in nanos
+        :param CosimManipulator manipulator: Optional override manipulator already added to the execution. A new one is
+            created and added if not given
+        :param int start_time: Start time of the execution in nanos. Default 0
+        """
+        assert step_size > 0, "Step size must be a positive and non-zero integer"
+        self.execution = execution
+        self.step_size = int(step_size)
+        self.start_time = int(start_time)
+        if manipulator is None:
+            manipulator = CosimManipulator.create_override()
+            if not execution.add_manipulator(manipulator):
+                raise RuntimeError(f"Unable to add override manipulator: {get_last_error_message()}")
+        self.manipulator = manipulator
+
+        self.__targets: list[tuple[int, int, CosimVariableType]] = []
+        self.__signals: list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], SignalInterpolation]] = []
+        self.__plan: Optional[WritePlan] = None
+        self.__table: Optional[npt.NDArray[np.float64]] = None
+
+    @property
+    def targets(self) -> list[tuple[int, int, CosimVariableType]]:
+        """
+        (slave_index, value_reference, variable_type) of each played variable, in the column order of table
+        """
+        return list(self.__targets)
+
+    @property
+    def table(self) -> Optional[npt.NDArray[np.float64]]:
+        """
+        Compiled values with one row per step and one column per target, or None before compile()
+        """
+        return self.__table
+
+    def add_signal(
+        self,
+        slave_index: int,
+        value_reference: int,
+        variable_type: CosimVariableType,
+        time_points: npt.ArrayLike,
+        values: npt.ArrayLike,
+        interpolation: SignalInterpolation = SignalInterpolation.HOLD,
+    ):
+        """
+        Add a signal to play into a variable
+
+        :param int slave_index: Index of slave with variable
+        :param int value_reference: Reference of variable within slave
+        :param CosimVariableType variable_type: Type of variable. Integer and boolean variables only support HOLD
+        :param time_points: Increasing sample times in nanos
+        :param values: Sample values, one per time point
+        :param SignalInterpolation interpolation: Interpolation between samples. Default HOLD
+        """
+        variable_type = CosimVariableType(variable_type)
+        interpolation = SignalInterpolation(interpolation)
+        if variable_type == CosimVariableType.STRING:
+            raise ValueError("String variables can not be played as signals")
+        if variable_type != CosimVariableType.REAL and interpolation != SignalInterpolation.HOLD:
+            raise ValueError(f"{variable_type} variables only support {SignalInterpolation.HOLD} interpolation")
+        target = (int(slave_index), int(value_reference), variable_type)
+        if target in self.__targets:
+            raise ValueError(f"A signal is already played into {target}")
+
+        time_points = np.asarray(time_points, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if time_points.ndim != 1 or time_points.shape != values.shape or len(time_points) == 0:
+            raise ValueError("time_points and values must be non-empty 1-D arrays of equal length")
+        if np.any(np.diff(time_points) <= 0):
+            raise ValueError("time_points must be strictly increasing")
+
+        self.__targets.append(target)
+        self.__signals.append((time_points, values, interpolation))
+        self.__plan = None
+        self.__table = None
+
+    def compile(self, stop_time: int | float):
+        """
+        Resample all signals at the start of every step from start_time until stop_time
+
+        :param int stop_time: Time in nanos of the last step start to compute
+        """
+        step_count = max(int(stop_time - self.start_time) // self.step_size + 1, 1)
+        step_times = self.start_time + np.arange(step_count, dtype=np.float64) * self.step_size
+        table = np.empty((step_count, len(self.__targets)), dtype=np.float64)
+        for column, (time_points, values, interpolation) in enumerate(self.__signals):
+            table[:, column] = _resample(time_points, values, interpolation, step_times)
+        self.__table = table
+        self.__plan = self.manipulator.write_plan(self.__targets)
+
+    def step(self, step_count: int = 1) -> bool:
+        """
+        Advance the execution for 1 or multiple steps, setting the played variables before each step. Steps after the
+        compiled range use the last compiled row
+
+        :param int step_count: Number of steps to advance with default of 1
+        :return: bool Successful step execution
+        """
+        if self.__table is None or self.__plan is None:
+            raise RuntimeError("SignalPlayer.compile() must be called before stepping")
+        table, plan, execution = self.__table, self.__plan, self.execution
+        last_row = len(table) - 1
+        row = (self.execution.status().current_time - self.start_time) // self.step_size
+        for step in range(row, row + step_count):
+            if not plan.apply(table[min(max(step, 0), last_row)]):
+                return False
+            if not execution.step():
+                return False
+        return True
+
+    def simulate_until(self, target_time: int | float) -> bool:
+        """
+        Step the execution until target time is reached
+
+        :param int target_time: End of simulation time in nanos
+        :return: bool Successful simulation until target time
+        """
+        remaining = int(target_time) - self.execution.status().current_time
+        return self.step(-(-remaining // self.step_size)) if remaining > 0 else True
+
+
+def _resample(
+    time_points: npt.NDArray[np.float64],
+    values: npt.NDArray[np.float64],
+    interpolation: SignalInterpolation,
+    times: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    Sample a signal at the given times, holding the first and last value outside the sampled range
+    """
+    if interpolation == SignalInterpolation.HOLD or len(time_points) == 1:
+        return values[np.clip(np.searchsorted(time_points, times, side="right") - 1, 0, None)]
+    if interpolation == SignalInterpolation.LINEAR or len(time_points) == 2:
+        return np.interp(times, time_points, values)
+
+    # Natural cubic spline through the samples
+    times = np.clip(times, time_points[0], time_points[-1])
+    h = np.diff(time_points)
+    second_derivatives = _natural_spline_second_derivatives(h, values)
+    segment = np.clip(np.searchsorted(time_points, times, side="right") - 1, 0, len(time_points) - 2)
+    h_segment = h[segment]
+    a = (time_points[segment + 1] - times) / h_segment
+    b = 1.0 - a
+    return (
+        a * values[segment]
+        + b * values[segment + 1]
+        + ((a**3 - a) * second_derivatives[segment] + (b**3 - b) * second_derivatives[segment + 1]) * h_segment**2 / 6.0
+    )
+
+
+def _natural_spline_second_derivatives(h: npt.NDArray[np.float64], values: npt.NDArray[np.float64]):
+    """
+    Solve the tridiagonal system for the second derivatives of a natural cubic spline
+    """
+    second_derivatives = np.zeros(len(values), dtype=np.float64)
+    slopes = np.diff(values) / h
+    second_derivatives[1:-1] = _solve_tridiagonal(h[1:-1], 2.0 * (h[:-1] + h[1:]), h[1:-1], 6.0 * np.diff(slopes))
+    return second_derivatives
+
+
+def _solve_tridiagonal(
+    lower: npt.NDArray[np.float64],
+    diagonal: npt.NDArray[np.float64],
+    upper: npt.NDArray[np.float64],
+    rhs: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    Solve a diagonally dominant tridiagonal system by parallel cyclic reduction. Each level eliminates the coupling of
+    every row to the rows stride rows away with whole-array NumPy operations and doubles the stride, so the rows are
+    decoupled after about log2(n) levels instead of a Python loop over the rows. lower[i] couples row i + 1 to row i
+    and upper[i] couples row i to row i + 1
+    """
+    n = len(diagonal)
+    # Coupling of each row to the row stride rows before and after it
+    a = np.concatenate([[0.0], lower])
+    c = np.concatenate([upper, [0.0]])
+    b = diagonal.astype(np.float64)
+    d = rhs.astype(np.float64)
+    stride = 1
+    while stride < n:
+        alpha = -a[stride:] / b[:-stride]
+        gamma = -c[:-stride] / b[stride:]
+        next_a = np.zeros(n)
+        next_c = np.zeros(n)
+        next_b = b.copy()
+        next_d = d.copy()
+        next_a[stride:] = alpha * a[:-stride]
+        next_b[stride:] += alpha * c[:-stride]
+        next_d[stride:] += alpha * d[:-stride]
+        next_c[:-stride] = gamma * c[stride:]
+        next_b[:-stride] += gamma * a[stride:]
+        next_d[:-stride] += gamma * d[stride:]
+        a, b, c, d = next_a, next_b, next_c, next_d
+        stride *= 2
+    return d / b
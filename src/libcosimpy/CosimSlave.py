@@ -1,5 +1,13 @@
-from ctypes import c_char, c_char_p, POINTER, c_int, Structure, c_uint32
-from ._internal import wrap_function, libcosimc
+import fnmatch
+import re
+import sys
+from ctypes import c_char, c_int, Structure, c_uint32, sizeof
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ._bindings import cosimc
 from . import CosimConstants
 from . import CosimEnums
 
@@ -38,20 +46,196 @@ class CosimSlaveVariableDescription(Structure):
         )
 
 
+class VariableInfo(NamedTuple):
+    """
+    Resolved location and metadata of a slave variable
+    """
+
+    slave_index: int
+    value_reference: int
+    type: CosimEnums.CosimVariableType
+    causality: CosimEnums.CosimVariableCausality
+    variability: CosimEnums.CosimVariableVariability
+
+
+class CosimSlaveVariables:
+    """
+    Compact variable metadata of a slave. Names are held once as interned strings, while references, types,
+    causalities and variabilities are held in parallel NumPy columns. Created with
+    CosimExecution.slave_variable_table()
+    """
+
+    def __init__(
+        self,
+        slave_index: int,
+        names: tuple[str, ...],
+        references: npt.NDArray[np.uint32],
+        types: npt.NDArray[np.int8],
+        causalities: npt.NDArray[np.int8],
+        variabilities: npt.NDArray[np.int8],
+    ):
+        self.slave_index = slave_index
+        self.names = names
+        self.references = references
+        self.types = types
+        self.causalities = causalities
+        self.variabilities = variabilities
+        self.__rows: Optional[dict[str, int]] = None
+
+    @classmethod
+    def from_descriptions(cls, slave_index: int, descriptions: Any):
+        """
+        Convert a ctypes array of CosimSlaveVariableDescription into compact columns
+
+        :param int slave_index: Index of the slave
+        :param descriptions: Array of CosimSlaveVariableDescription as filled by libcosimc
+        :return: CosimSlaveVariables object
+        """
+        records = np.frombuffer(descriptions, dtype=_DESCRIPTION_DTYPE, count=len(descriptions))
+        return cls(
+            slave_index=slave_index,
+            names=tuple(sys.intern(name.decode()) for name in records["name"]),
+            references=records["reference"].copy(),
+            types=records["type"].astype(np.int8),
+            causalities=records["causality"].astype(np.int8),
+            variabilities=records["variability"].astype(np.int8),
+        )
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, rows: Any):
+        """
+        Subset of the variables selected by a slice, an array of row indices or a boolean mask
+        """
+        selected = np.arange(len(self.names))[rows]
+        return CosimSlaveVariables(
+            slave_index=self.slave_index,
+            names=tuple(self.names[row] for row in selected),
+            references=self.references[selected],
+            types=self.types[selected],
+            causalities=self.causalities[selected],
+            variabilities=self.variabilities[selected],
+        )
+
+    def __iter__(self):
+        return (self.info_at(row) for row in range(len(self.names)))
+
+    def __contains__(self, name: object):
+        return name in self.__name_rows()
+
+    def __name_rows(self):
+        """
+        Helper function building the name to row lookup table on first use
+        """
+        if self.__rows is None:
+            self.__rows = {name: row for row, name in enumerate(self.names)}
+        return self.__rows
+
+    def row(self, name: str) -> int:
+        """
+        Row of a variable in the columns
+
+        :param str name: Name of variable
+        :return: int Row index. Raises KeyError if no variable has the name
+        """
+        return self.__name_rows()[name]
+
+    def info_at(self, row: int) -> VariableInfo:
+        """
+        Metadata of the variable in a row
+
+        :param int row: Row index
+        :return: VariableInfo
+        """
+        return VariableInfo(
+            slave_index=self.slave_index,
+            value_reference=int(self.references[row]),
+            type=CosimEnums.CosimVariableType(int(self.types[row])),
+            causality=CosimEnums.CosimVariableCausality(int(self.causalities[row])),
+            variability=CosimEnums.CosimVariableVariability(int(self.variabilities[row])),
+        )
+
+    def info(self, name: str) -> VariableInfo:
+        """
+        Metadata of a variable by name
+
+        :param str name: Name of variable
+        :return: VariableInfo. Raises KeyError if no variable has the name
+        """
+        return self.info_at(self.row(name))
+
+    def mask(
+        self,
+        variable_type: Optional[CosimEnums.CosimVariableType] = None,
+        causality: Optional[CosimEnums.CosimVariableCausality] = None,
+        variability: Optional[CosimEnums.CosimVariableVariability] = None,
+        pattern: Optional[str] = None,
+    ) -> npt.NDArray[np.bool_]:
+        """
+        Boolean mask of the variables matching all the given criteria
+
+        :param CosimVariableType variable_type: Optional type to match
+        :param CosimVariableCausality causality: Optional causality to match
+        :param CosimVariableVariability variability: Optional variability to match
+        :param str pattern: Optional glob pattern, e.g. "*.thrust*", matched case-sensitively against names
+        :return: Boolean array with one element per variable
+        """
+        selected = np.ones(len(self.names), dtype=np.bool_)
+        if variable_type is not None:
+            selected &= self.types == variable_type.value
+        if causality is not None:
+            selected &= self.causalities == causality.value
+        if variability is not None:
+            selected &= self.variabilities == variability.value
+        if pattern is not None:
+            match = re.compile(fnmatch.translate(pattern)).match
+            selected &= np.fromiter((match(name) is not None for name in self.names), dtype=np.bool_, count=len(self))
+        return selected
+
+    def filter(
+        self,
+        variable_type: Optional[CosimEnums.CosimVariableType] = None,
+        causality: Optional[CosimEnums.CosimVariableCausality] = None,
+        variability: Optional[CosimEnums.CosimVariableVariability] = None,
+        pattern: Optional[str] = None,
+    ):
+        """
+        Variables matching all the given criteria, e.g. filter(variable_type=REAL, causality=OUTPUT) for all real
+        outputs
+
+        :param CosimVariableType variable_type: Optional type to match
+        :param CosimVariableCausality causality: Optional causality to match
+        :param CosimVariableVariability variability: Optional variability to match
+        :param str pattern: Optional glob pattern, e.g. "*.thrust*", matched case-sensitively against names
+        :return: CosimSlaveVariables with the matching variables
+        """
+        return self[
+            self.mask(variable_type=variable_type, causality=causality, variability=variability, pattern=pattern)
+        ]
+
+
+# NumPy view of CosimSlaveVariableDescription, used to extract all fields of a description array at once
+_DESCRIPTION_DTYPE = np.dtype(
+    {
+        "names": [name for name, _ in CosimSlaveVariableDescription._fields_],
+        "formats": [f"S{CosimConstants.SLAVE_NAME_MAX_SIZE}", np.uint32, np.intc, np.intc, np.intc],
+        "offsets": [
+            getattr(CosimSlaveVariableDescription, name).offset for name, _ in CosimSlaveVariableDescription._fields_
+        ],
+        "itemsize": sizeof(CosimSlaveVariableDescription),
+    }
+)
+
+
 class CosimLocalSlave(Structure):
     """
     Locally created execution slave
     """
 
     def __init__(self, fmu_path: str, instance_name: str):
-        local_slave_create = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_local_slave_create",
-            argtypes=[c_char_p, c_char_p],
-            restype=POINTER(CosimLocalSlave),
-        )
         super().__init__()
-        self.__ptr = local_slave_create(fmu_path.encode(), instance_name.encode())
+        self.__ptr = cosimc().cosim_local_slave_create(fmu_path.encode(), instance_name.encode())
 
     def ptr(self):
         """
@@ -64,10 +248,4 @@ class CosimLocalSlave(Structure):
         """
         Releases C objects when CosimObserver is deleted in python
         """
-        local_slave_destroy = wrap_function(
-            lib=libcosimc(),
-            funcname="cosim_local_slave_destroy",
-            argtypes=[POINTER(CosimLocalSlave)],
-            restype=c_int,
-        )
-        local_slave_destroy(self.__ptr)
+        cosimc().cosim_local_slave_destroy(self.__ptr)
@@ -0,0 +1,384 @@
+import math
+import multiprocessing
+import os
+import tempfile
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ._internal import get_last_error_message
+from .CosimEnums import CosimVariableType
+from .CosimExecution import CosimExecution
+from .CosimManipulator import CosimManipulator
+from .CosimResultCache import ResultCache
+from .CosimScenario import CompiledScenario
+
+# Status of a run in SweepResult.status
+RUN_OK = "ok"
+RUN_FAILED = "failed"
+RUN_TIMEOUT = "timeout"
+RUN_CRASHED = "crashed"
+
+
+@dataclass
+class SweepResult:
+    """
+    Results of a sweep in columnar form. values has shape (number of runs, number of samples, number of outputs) with
+    NaN for runs that did not complete
+    """
+
+    parameters: list[dict[str, Any]]
+    outputs: list[str]
+    time_points: npt.NDArray[np.int64]
+    values: npt.NDArray[np.float64]
+    status: list[str]
+    errors: dict[int, str]
+
+    def column(self, output: str) -> npt.NDArray[np.float64]:
+        """
+        Samples of one output for all runs
+
+        :param str output: Output name as given to SweepRunner
+        :return: Array of shape (number of runs, number of samples)
+        """
+        return self.values[:, :, self.outputs.index(output)]
+
+    def parameter(self, name: str) -> npt.NDArray[Any]:
+        """
+        Value of one parameter for all runs, None where a run does not set it
+
+        :param str name: Parameter name as given in the parameter sets
+        :return: Array with one value per run
+        """
+        return np.array([parameters.get(name) for parameters in self.parameters])
+
+    def save(self, path: str):
+        """
+        Write the result to a NumPy .npz file
+        """
+        np.savez(
+            path,
+            time_points=self.time_points,
+            values=self.values,
+            outputs=np.array(self.outputs),
+            status=np.array(self.status),
+        )
+
+
+@dataclass(frozen=True)
+class _SweepJob:
+    """
+    Settings shared by all runs of a sweep, sent to each worker once
+    """
+
+    config_path: str
+    outputs: tuple[str, ...]
+    step_count: int
+    every: int
+    results_dir: str
+    scenario_file: Optional[str]
+
+
+class SweepRunner:
+    """
+    Runs a parameter sweep over a system configuration in a pool of worker processes. Each worker loads libcosimc once
+    and then builds a fresh execution for each run it is given, sets the initial values of the run and records the
+    outputs until the stop time. Idle workers are handed the next run as soon as they finish, so long and short runs
+    balance across the pool.
+
+    Every worker runs in its own process. A run that crashes its worker or exceeds the timeout is recorded as failed,
+    the worker is replaced and the sweep continues. Samples are written by the workers to files in a temporary directory
+    and collected into one SweepResult.
+
+    With a result cache, runs whose outputs are already stored are answered from the cache without starting a worker,
+    and the outputs of every completed run are stored
+    """
+
+    def __init__(
+        self,
+        config_path: str,
+        outputs: Sequence[str],
+        stop_time: int | float,
+        step_size: int | float,
+        every: int = 1,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        start_method: Optional[str] = None,
+        scenario: Optional[CompiledScenario] = None,
+        cache: Optional[ResultCache] = None,
+    ):
+        """
+        :param str config_path: Path to OspSystemStructure.xml, .ssd file or directory containing either
+        :param list of str outputs: Variables to record, named "instance.variable". String variables are not supported
+        :param int stop_time: End of simulation time in nanos
+        :param int step_size: Step size of the configuration in nanos
+        :param int every: Number of steps between recorded samples. Default 1
+        :param int workers: Number of worker processes. Defaults to the number of CPUs
+        :param float timeout: Optional wall clock limit in seconds for each run
+        :param str start_method: Optional multiprocessing start method, such as "spawn" or "fork"
+        :param CompiledScenario scenario: Optional scenario loaded into every run through a scenario manager
+        :param ResultCache cache: Optional cache to answer repeated runs from
+        """
+        assert stop_time > 0, "Stop time must be a positive and non-zero integer"
+        assert step_size > 0, "Step size must be a positive and non-zero integer"
+        self.config_path = str(config_path)
+        self.outputs = list(outputs)
+        self.step_size = int(step_size)
+        self.step_count = math.ceil(int(stop_time) / self.step_size)
+        self.every = every
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.scenario = scenario
+        self.cache = cache
+        self.__context = multiprocessing.get_context(start_method)
+
+    def run(self, parameter_sets: Sequence[Mapping[str, int | float | bool | str]]) -> SweepResult:
+        """
+        Run one simulation per parameter set
+
+        :param list of dict parameter_sets: Initial values of each run, from "instance.variable" name to value
+        :return: SweepResult with one row per parameter set, in the order given
+        """
+        parameters = [dict(parameter_set) for parameter_set in parameter_sets]
+        sample_count = self.step_count // self.every
+        values = np.full((len(parameters), sample_count, len(self.outputs)), np.nan)
+        time_points = np.zeros(sample_count, dtype=np.int64)
+
+        def store(run_id: int, run_time_points: npt.NDArray[np.int64], run_values: npt.NDArray[np.float64]):
+            values[run_id] = run_values
+            time_points[:] = run_time_points
+
+        status, errors = self.run_streaming(parameters, store)
+        return SweepResult(
+            parameters=parameters,
+            outputs=self.outputs,
+            time_points=time_points,
+            values=values,
+            status=status,
+            errors=errors,
+        )
+
+    def run_streaming(
+        self,
+        parameter_sets: Sequence[Mapping[str, int | float | bool | str]],
+        consume: Callable[[int, npt.NDArray[np.int64], npt.NDArray[np.float64]], None],
+        report: Optional[Callable[[int, str, Optional[str]], None]] = None,
+    ) -> tuple[list[str], dict[int, str]]:
+        """
+        Run one simulation per parameter set, passing the samples of each successful run to consume as it completes
+        instead of keeping them
+
+        :param list of dict parameter_sets: Initial values of each run, from "instance.variable" name to value
+        :param consume: Called in this process with the run index, time points and (samples, outputs) values of
+            each successful run, in order of completion
+        :param report: Optional function called with the run index, status and error message of each run as it ends,
+            after consume for successful runs
+        :return: Status of each run and error message of each failed run
+        """
+        parameters = [dict(parameter_set) for parameter_set in parameter_sets]
+        status = [RUN_FAILED] * len(parameters)
+        errors: dict[int, str] = {}
+
+        def finish(run_id: int, run_status: str, error: Optional[str] = None):
+            """Record how a run ended"""
+            status[run_id] = run_status
+            if error is not None:
+                errors[run_id] = error
+            if report is not None:
+                report(run_id, run_status, error)
+
+        keys: list[str] = []
+        if self.cache is not None:
+            # The configuration and its files are hashed once, and only the parameters of each run
+            sweep_key = self.cache.sweep_key(
+                self.config_path, self.outputs, self.step_count, self.step_size, self.every, self.scenario
+            )
+            for run_id, run_parameters in enumerate(parameters):
+                keys.append(self.cache.parameter_key(sweep_key, run_parameters))
+                cached = self.cache.get(keys[run_id])
+                if cached is not None:
+                    consume(run_id, *cached)
+                    finish(run_id, RUN_OK)
+        pending = [run_id for run_id in range(len(parameters) - 1, -1, -1) if status[run_id] != RUN_OK]
+        if not pending:
+            return status, errors
+
+        with tempfile.TemporaryDirectory(prefix="libcosimpy-sweep-") as results_dir:
+            scenario_file = None
+            if self.scenario is not None:
+                scenario_file = os.path.join(results_dir, "scenario.json")
+                self.scenario.save(scenario_file)
+            job = _SweepJob(
+                self.config_path, tuple(self.outputs), self.step_count, self.every, results_dir, scenario_file
+            )
+            # Worker process -> (connection, run in progress, start of run)
+            workers: dict[Any, tuple[Connection, Optional[int], float]] = {}
+
+            def launch():
+                """Start work on the next pending run"""
+                dispatch(self.__start_worker(job, workers))
+
+            def dispatch(process: Any):
+                """Hand the next pending run to an idle pool worker, or tell it to exit"""
+                connection = workers[process][0]
+                run_id = pending.pop() if pending else None
+                try:
+                    connection.send(None if run_id is None else (run_id, parameters[run_id]))
+                except OSError:
+                    # The worker died while idle. Its run, if any, is picked up by the next worker
+                    if run_id is not None:
+                        pending.append(run_id)
+                    replace(process)
+                    return
+                workers[process] = (connection, run_id, time.monotonic())
+
+            def replace(process: Any):
+                """Remove a worker that has exited or been stopped, continuing with another if runs are pending"""
+                workers.pop(process)[0].close()
+                process.join()
+                if pending:
+                    launch()
+
+            for _ in range(min(self.workers, len(pending))):
+                launch()
+
+            while any(run_id is not None for _, run_id, _ in workers.values()):
+                connections = {connection: process for process, (connection, _, _) in workers.items()}
+                for ready in wait([*connections, *(process.sentinel for process in workers)], timeout=0.1):
+                    process = connections.get(ready)  # pyright: ignore[reportArgumentType]
+                    if process is None or process not in workers:
+                        continue
+                    try:
+                        run_id, path, error = ready.recv()  # pyright: ignore[reportAttributeAccessIssue]
+                    except EOFError:
+                        # The process exited without sending a result
+                        run_id = workers[process][1]
+                        process.join()
+                        if run_id is not None:
+                            finish(run_id, RUN_CRASHED, f"Worker exited with code {process.exitcode}")
+                        replace(process)
+                        continue
+                    if error is None:
+                        with np.load(path) as samples:
+                            run_time_points, run_values = samples["time_points"], samples["values"]
+                        consume(run_id, run_time_points, run_values)
+                        if self.cache is not None:
+                            self.cache.put(keys[run_id], run_time_points, run_values)
+                        os.remove(path)
+                        finish(run_id, RUN_OK)
+                    else:
+                        finish(run_id, RUN_FAILED, error)
+                    dispatch(process)
+
+                now = time.monotonic()
+                for process, (connection, run_id, started) in list(workers.items()):
+                    # A result still in the pipe is read in the next round, even if the process has exited since
+                    if run_id is None or connection.poll():
+                        continue
+                    if not process.is_alive():
+                        finish(run_id, RUN_CRASHED, f"Worker exited with code {process.exitcode}")
+                        replace(process)
+                    elif self.timeout is not None and now - started > self.timeout:
+                        process.terminate()
+                        finish(run_id, RUN_TIMEOUT, f"Run exceeded timeout of {self.timeout} s")
+                        replace(process)
+
+            for process, (connection, _, _) in workers.items():
+                process.join()
+                connection.close()
+
+        return status, errors
+
+    def __start_worker(self, job: _SweepJob, workers: dict[Any, tuple[Connection, Optional[int], float]]) -> Any:
+        """
+        Helper function starting a worker process and registering it as idle
+        """
+        connection, worker_connection = self.__context.Pipe()
+        process = self.__context.Process(target=_sweep_worker, args=(worker_connection, job), daemon=True)
+        process.start()
+        worker_connection.close()
+        workers[process] = (connection, None, 0.0)
+        return process
+
+
+def create_execution(config_path: str) -> CosimExecution:
+    """
+    Create an execution from an OSP or SSP system configuration, chosen from the file name
+
+    :param str config_path: Path to OspSystemStructure.xml, .ssd file or directory containing either
+    :return: CosimExecution object
+    """
+    path = Path(config_path)
+    if path.suffix.lower() == ".ssd" or (path.is_dir() and (path / "SystemStructure.ssd").is_file()):
+        return CosimExecution.from_ssp_file(ssp_path=config_path)
+    return CosimExecution.from_osp_config_file(osp_path=config_path)
+
+
+def apply_initial_values(execution: CosimExecution, initial_values: Mapping[str, int | float | bool | str]):
+    """
+    Set initial values of an execution by "instance.variable" name, raising RuntimeError if a value is rejected
+
+    :param CosimExecution execution: Execution to set initial values in
+    :param dict initial_values: Initial value of each variable
+    """
+    model_index = execution.model_index()
+    for name, value in initial_values.items():
+        variable = model_index.resolve(name)
+        if variable.type == CosimVariableType.REAL:
+            success = execution.real_initial_value(variable.slave_index, variable.value_reference, float(value))
+        elif variable.type == CosimVariableType.INTEGER:
+            success = execution.integer_initial_value(variable.slave_index, variable.value_reference, int(value))
+        elif variable.type == CosimVariableType.BOOLEAN:
+            success = execution.boolean_initial_value(variable.slave_index, variable.value_reference, bool(value))
+        else:
+            success = execution.string_initial_value(variable.slave_index, variable.value_reference, str(value))
+        if not success:
+            raise RuntimeError(f"Unable to set initial value of {name}: {get_last_error_message()}")
+
+
+def _sweep_worker(connection: Connection, job: _SweepJob):
+    """
+    Worker process running the runs it is sent until it receives None
+    """
+    while True:
+        task = connection.recv()
+        if task is None:
+            return
+        run_id, parameters = task
+        try:
+            path = _simulate(job, run_id, parameters)
+            connection.send((run_id, path, None))
+        except Exception as error:  # noqa: BLE001 - Failed runs are reported and the worker continues
+            connection.send((run_id, None, f"{type(error).__name__}: {error}"))
+
+
+def _simulate(job: _SweepJob, run_id: int, parameters: Mapping[str, Any]) -> str:
+    """
+    Run one simulation and write its samples to a file in the results directory
+    """
+    execution = create_execution(job.config_path)
+    if job.scenario_file is not None:
+        manipulator = CosimManipulator.create_scenario_manager()
+        if not execution.add_manipulator(manipulator) or not execution.load_scenario(manipulator, job.scenario_file):
+            raise RuntimeError(f"Unable to load scenario: {get_last_error_message()}")
+    apply_initial_values(execution, parameters)
+    model_index = execution.model_index()
+    variables = [model_index.resolve(output) for output in job.outputs]
+    for output, variable in zip(job.outputs, variables, strict=True):
+        if variable.type == CosimVariableType.STRING:
+            raise ValueError(f"String variable {output} can not be recorded in a sweep")
+    targets = [(variable.slave_index, variable.value_reference, variable.type) for variable in variables]
+    recording = execution.record(n_steps=job.step_count, variables=targets, every=job.every)
+    values = np.empty((len(recording.time_points), len(targets)), dtype=np.float64)
+    for column, target in enumerate(targets):
+        values[:, column] = recording.column(*target)
+
+    path = os.path.join(job.results_dir, f"run-{run_id}.npz")
+    np.savez(path, time_points=recording.time_points, values=values)
+    return path
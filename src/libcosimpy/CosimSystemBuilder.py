@@ -0,0 +1,117 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+
+from ._bindings import cosimc
+from ._internal import get_last_error_message
+from .CosimExecution import CosimExecution
+from .CosimSlave import CosimLocalSlave
+
+
+class SlaveTiming(NamedTuple):
+    """
+    Time spent creating one slave, which covers unpacking and loading its FMU
+    """
+
+    instance_name: str
+    fmu_path: str
+    slave_index: int
+    seconds: float
+
+
+@dataclass
+class BuildReport:
+    """
+    Slaves added by SystemBuilder.build() with the time spent creating each of them
+    """
+
+    slave_indices: dict[str, int]
+    timings: list[SlaveTiming]
+    create_seconds: float
+    add_seconds: float
+
+    @property
+    def serial_seconds(self) -> float:
+        """
+        Sum of the creation times of all slaves, as an estimate of the time creating them one after another would take
+        """
+        return sum(timing.seconds for timing in self.timings)
+
+
+class SystemBuilder:
+    """
+    Builds a system of local slaves in an execution. Creating a local slave unpacks and loads its FMU, which dominates
+    start-up of large systems, so the slaves are created concurrently in a thread pool. libcosimc is called through
+    ctypes, which releases the GIL for the duration of the call. The slaves are then added to the execution one at a
+    time in the order they were given, so slave indices do not depend on which FMU finished loading first
+    """
+
+    def __init__(self, execution: CosimExecution, workers: Optional[int] = None):
+        """
+        :param CosimExecution execution: Execution to add the slaves to
+        :param int workers: Optional number of threads creating slaves. Defaults to the ThreadPoolExecutor default
+        """
+        self.execution = execution
+        self.workers = workers
+        self.__slaves: dict[str, str] = {}
+
+    def add_slave(self, fmu_path: str, instance_name: str) -> "SystemBuilder":
+        """
+        Add a slave to create when building
+
+        :param str fmu_path: Path to FMU
+        :param str instance_name: Unique name of the slave instance
+        :return: The builder, so calls can be chained
+        """
+        if instance_name in self.__slaves:
+            raise ValueError(f"Slave instance name '{instance_name}' is already used")
+        self.__slaves[instance_name] = str(fmu_path)
+        return self
+
+    def build(self) -> BuildReport:
+        """
+        Create all slaves concurrently and add them to the execution in the order they were given. If any slave can
+        not be created, none are added. Added slaves are removed from the builder
+
+        :return: BuildReport with the index of each slave and the time spent creating it
+        """
+        # Configure the bindings used by the pool threads before they start
+        for funcname in ("cosim_local_slave_create", "cosim_last_error_message"):
+            getattr(cosimc(), funcname)
+        slaves = list(self.__slaves.items())
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="cosim-slave") as pool:
+            created = list(pool.map(lambda slave: _create_slave(*slave), slaves))
+        create_seconds = time.perf_counter() - start
+
+        failures = [f"{name}: {error}" for (name, _), (_, _, error) in zip(slaves, created, strict=True) if error]
+        if failures:
+            raise RuntimeError("Unable to create slaves:\n" + "\n".join(failures))
+
+        start = time.perf_counter()
+        slave_indices: dict[str, int] = {}
+        timings: list[SlaveTiming] = []
+        for (instance_name, fmu_path), (local_slave, seconds, _) in zip(slaves, created, strict=True):
+            slave_index = self.execution.add_local_slave(local_slave=local_slave)
+            if slave_index < 0:
+                raise RuntimeError(f"Unable to add slave '{instance_name}': {get_last_error_message()}")
+            slave_indices[instance_name] = slave_index
+            timings.append(SlaveTiming(instance_name, fmu_path, slave_index, seconds))
+        self.__slaves.clear()
+        return BuildReport(
+            slave_indices=slave_indices,
+            timings=timings,
+            create_seconds=create_seconds,
+            add_seconds=time.perf_counter() - start,
+        )
+
+
+def _create_slave(instance_name: str, fmu_path: str) -> tuple[CosimLocalSlave, float, Optional[str]]:
+    """
+    Create a local slave in a pool thread. The last error of libcosimc is kept per thread, so a failure is read here
+    """
+    start = time.perf_counter()
+    local_slave = CosimLocalSlave(fmu_path=fmu_path, instance_name=instance_name)
+    seconds = time.perf_counter() - start
+    return local_slave, seconds, None if local_slave.ptr() else get_last_error_message()
@@ -0,0 +1,176 @@
+from ctypes import (
+    POINTER,
+    c_bool,
+    c_char_p,
+    c_double,
+    c_int,
+    c_int64,
+    c_size_t,
+    c_uint32,
+    c_uint64,
+)
+from typing import Any
+
+from ._internal import libcosimc, wrap_function
+
+__bindings = None
+__signatures = None
+
+
+def _signatures() -> dict[str, tuple[Any, list[Any]]]:
+    """
+    Signatures of every libcosimc function used by the wrapper, as funcname -> (restype, argtypes).
+
+    Arrays are declared as pointers to their element type, so a single prototype accepts ctypes arrays of any length
+    as well as NumPy buffers passed through ``ndarray.ctypes.data_as``. The table is built on first use since the
+    opaque object types are defined in the wrapper modules, which in turn dispatch through this module.
+    """
+    global __signatures
+    if __signatures is None:
+        from .CosimAlgorithm import CosimAlgorithm
+        from .CosimExecution import CosimExecution, CosimExecutionStatus
+        from .CosimManipulator import CosimManipulator
+        from .CosimObserver import CosimObserver
+        from .CosimSlave import CosimLocalSlave, CosimSlaveInfo, CosimSlaveVariableDescription
+
+        execution = POINTER(CosimExecution)
+        manipulator = POINTER(CosimManipulator)
+        observer = POINTER(CosimObserver)
+        algorithm = POINTER(CosimAlgorithm)
+        local_slave = POINTER(CosimLocalSlave)
+        connect = [execution, c_int, c_uint32, c_int, c_uint32]
+
+        __signatures = {
+            # Errors and logging
+            "cosim_last_error_code": (c_int, []),
+            "cosim_last_error_message": (c_char_p, []),
+            "cosim_log_set_output_level": (None, [c_int]),
+            # Algorithms
+            "cosim_ecco_algorithm_create": (algorithm, [c_double] * 10),
+            "cosim_ecco_add_power_bond": (c_int, [algorithm, c_int, c_uint32, c_uint32, c_int, c_uint32, c_uint32]),
+            "cosim_algorithm_destroy": (c_int, [algorithm]),
+            # Executions
+            "cosim_execution_create": (execution, [c_int64, c_int64]),
+            "cosim_execution_create_with_algorithm": (execution, [c_int64, algorithm]),
+            "cosim_osp_config_execution_create": (execution, [c_char_p, c_bool, c_int64]),
+            "cosim_ssp_execution_create": (execution, [c_char_p, c_bool, c_int64]),
+            "cosim_ssp_fixed_step_execution_create": (execution, [c_char_p, c_bool, c_int64, c_int64]),
+            "cosim_execution_destroy": (c_int, [execution]),
+            "cosim_execution_get_num_slaves": (c_int, [execution]),
+            "cosim_execution_get_slave_infos": (c_int, [execution, POINTER(CosimSlaveInfo), c_size_t]),
+            "cosim_execution_add_slave": (c_int, [execution, local_slave]),
+            "cosim_execution_add_manipulator": (c_int, [execution, manipulator]),
+            "cosim_execution_add_observer": (c_int, [execution, observer]),
+            "cosim_execution_step": (c_int, [execution, c_int64]),
+            "cosim_execution_simulate_until": (c_int, [execution, c_int64]),
+            "cosim_execution_start": (c_int, [execution]),
+            "cosim_execution_stop": (c_int, [execution]),
+            "cosim_execution_enable_real_time_simulation": (c_int, [execution]),
+            "cosim_execution_disable_real_time_simulation": (c_int, [execution]),
+            "cosim_execution_set_real_time_factor_target": (c_int, [execution, c_double]),
+            "cosim_execution_set_steps_to_monitor": (c_int, [execution, c_int]),
+            "cosim_execution_get_status": (c_int, [execution, POINTER(CosimExecutionStatus)]),
+            "cosim_execution_load_scenario": (c_int, [execution, manipulator, c_char_p]),
+            "cosim_execution_set_real_initial_value": (c_int, [execution, c_int, c_uint32, c_double]),
+            "cosim_execution_set_integer_initial_value": (c_int, [execution, c_int, c_uint32, c_int]),
+            "cosim_execution_set_boolean_initial_value": (c_int, [execution, c_int, c_uint32, c_bool]),
+            "cosim_execution_set_string_initial_value": (c_int, [execution, c_int, c_uint32, c_char_p]),
+            "cosim_execution_connect_real_variables": (c_int, connect),
+            "cosim_execution_connect_integer_variables": (c_int, connect),
+            "cosim_execution_connect_boolean_variables": (c_int, connect),
+            "cosim_execution_connect_string_variables": (c_int, connect),
+            "cosim_get_num_modified_variables": (c_int, [execution]),
+            # Slaves
+            "cosim_local_slave_create": (local_slave, [c_char_p, c_char_p]),
+            "cosim_local_slave_destroy": (c_int, [local_slave]),
+            "cosim_slave_get_num_variables": (c_int, [execution, c_int]),
+            "cosim_slave_get_variables": (
+                c_int,
+                [execution, c_int, POINTER(CosimSlaveVariableDescription), c_size_t],
+            ),
+            # Observers
+            "cosim_last_value_observer_create": (observer, []),
+            "cosim_file_observer_create": (observer, [c_char_p]),
+            "cosim_file_observer_create_from_cfg": (observer, [c_char_p, c_char_p]),
+            "cosim_time_series_observer_create": (observer, []),
+            "cosim_buffered_time_series_observer_create": (observer, [c_uint64]),
+            "cosim_observer_destroy": (c_int, [observer]),
+            "cosim_observer_start_observing": (c_int, [observer, c_int, c_int, c_uint32]),
+            "cosim_observer_stop_observing": (c_int, [observer, c_int, c_int, c_uint32]),
+            "cosim_observer_get_step_numbers": (c_int, [observer, c_int, c_int64, c_int64, POINTER(c_int64)]),
+            "cosim_observer_get_step_numbers_for_duration": (c_int, [observer, c_int, c_int64, POINTER(c_int64)]),
+            "cosim_observer_slave_get_real": (
+                c_int,
+                [observer, c_int, POINTER(c_uint32), c_size_t, POINTER(c_double)],
+            ),
+            "cosim_observer_slave_get_integer": (c_int, [observer, c_int, POINTER(c_uint32), c_size_t, POINTER(c_int)]),
+            "cosim_observer_slave_get_boolean": (
+                c_int,
+                [observer, c_int, POINTER(c_uint32), c_size_t, POINTER(c_bool)],
+            ),
+            "cosim_observer_slave_get_string": (
+                c_int,
+                [observer, c_int, POINTER(c_uint32), c_size_t, POINTER(c_char_p)],
+            ),
+            "cosim_observer_slave_get_real_samples": (
+                c_int64,
+                [observer, c_int, c_uint32, c_int64, c_size_t, POINTER(c_double), POINTER(c_int64), POINTER(c_int64)],
+            ),
+            "cosim_observer_slave_get_integer_samples": (
+                c_int64,
+                [observer, c_int, c_uint32, c_int64, c_size_t, POINTER(c_int), POINTER(c_int64), POINTER(c_int64)],
+            ),
+            # Manipulators
+            "cosim_override_manipulator_create": (manipulator, []),
+            "cosim_scenario_manager_create": (manipulator, []),
+            "cosim_manipulator_destroy": (c_int, [manipulator]),
+            "cosim_scenario_is_running": (c_int, [manipulator]),
+            "cosim_scenario_abort": (c_int, [manipulator]),
+            "cosim_manipulator_slave_set_real": (
+                c_int,
+                [manipulator, c_int, POINTER(c_uint32), c_size_t, POINTER(c_double)],
+            ),
+            "cosim_manipulator_slave_set_integer": (
+                c_int,
+                [manipulator, c_int, POINTER(c_uint32), c_size_t, POINTER(c_int)],
+            ),
+            "cosim_manipulator_slave_set_boolean": (
+                c_int,
+                [manipulator, c_int, POINTER(c_uint32), c_size_t, POINTER(c_bool)],
+            ),
+            "cosim_manipulator_slave_set_string": (
+                c_int,
+                [manipulator, c_int, POINTER(c_uint32), c_size_t, POINTER(c_char_p)],
+            ),
+            "cosim_manipulator_slave_reset": (c_int, [manipulator, c_int, c_int, POINTER(c_uint32), c_size_t]),
+        }
+    return __signatures
+
+
+class CosimBindings:
+    """
+    Registry of libcosimc functions. Every function is looked up and given its prototype once, on first access, and
+    the configured function is cached as an attribute so later lookups are plain attribute reads.
+    """
+
+    def __init__(self, lib: Any):
+        self.__lib = lib
+
+    def __getattr__(self, funcname: str) -> Any:
+        try:
+            restype, argtypes = _signatures()[funcname]
+        except KeyError:
+            raise AttributeError(f"No libcosimc binding declared for {funcname}") from None
+        func = wrap_function(lib=self.__lib, funcname=funcname, restype=restype, argtypes=argtypes)
+        setattr(self, funcname, func)
+        return func
+
+
+def cosimc() -> CosimBindings:
+    """
+    Returns the shared binding registry, loading libcosimc on first call
+    """
+    global __bindings
+    if __bindings is None:
+        __bindings = CosimBindings(libcosimc())
+    return __bindings
@@ -4,6 +4,10 @@ import warnings
 from ctypes import cdll
 import os
 
+import numpy as np
+
+from .CosimEnums import CosimVariableType
+
 
 __lib = None
 
@@ -42,11 +46,27 @@ class CTypeMeta(type(ctypes.Structure)):
         return super().__new__(cls, name, bases, namespace)
 
 
+# Element types of value buffers for each variable type. Strings are passed as ctypes c_char_p arrays
+VARIABLE_CTYPES: dict[CosimVariableType, Any] = {
+    CosimVariableType.REAL: ctypes.c_double,
+    CosimVariableType.INTEGER: ctypes.c_int,
+    CosimVariableType.BOOLEAN: ctypes.c_bool,
+    CosimVariableType.STRING: ctypes.c_char_p,
+}
+VARIABLE_DTYPES: dict[CosimVariableType, Any] = {
+    CosimVariableType.REAL: np.float64,
+    CosimVariableType.INTEGER: np.intc,
+    CosimVariableType.BOOLEAN: np.bool_,
+    CosimVariableType.STRING: np.object_,
+}
+
+
+def as_pointer(array: Any, c_type: Any) -> Any:
+    """Pointer to the first element of a C-contiguous NumPy array, for passing to libcosimc"""
+    return array.ctypes.data_as(ctypes.POINTER(c_type))
+
+
 def get_last_error_message() -> str:
-    cosim_last_error_message = wrap_function(
-        lib=libcosimc(),
-        funcname="cosim_last_error_message",
-        argtypes=[],
-        restype=ctypes.c_char_p,
-    )
-    return cosim_last_error_message().decode("utf-8")
+    from ._bindings import cosimc
+
+    return cosimc().cosim_last_error_message().decode("utf-8")
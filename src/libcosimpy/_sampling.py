@@ -0,0 +1,167 @@
+from collections.abc import Callable, Mapping, Sequence
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ._internal import get_last_error_message
+from .CosimEnums import CosimVariableType
+from .CosimExecution import CosimExecution
+from .CosimObserver import CosimObserver
+
+SOURCES = ("time_series", "last_value")
+
+# Variable types each source can sample
+_SOURCE_TYPES = {
+    "time_series": (CosimVariableType.REAL, CosimVariableType.INTEGER),
+    "last_value": (CosimVariableType.REAL, CosimVariableType.INTEGER, CosimVariableType.BOOLEAN),
+}
+
+
+class SampleSource:
+    """
+    Samples variables of an execution for the recorders and aggregators. With source "time_series" the samples of
+    every step are pulled from a buffered time series observer every chunk_steps steps taken through step(), which
+    only supports REAL and INTEGER variables. With source "last_value" the variables are read from a last value
+    observer after every step taken through step(). Samples are passed to on_samples as arrays of time points, step
+    numbers and values of shape (steps, variables), where NaN marks a step missing for a variable
+    """
+
+    def __init__(
+        self,
+        execution: CosimExecution,
+        variables: Sequence[str] | Mapping[str, str | tuple[int, int, CosimVariableType]],
+        on_samples: Callable[[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.float64]], None],
+        source: str = "time_series",
+        chunk_steps: int = 4096,
+        observer: Optional[CosimObserver] = None,
+        step_size: Optional[int | float] = None,
+    ):
+        """
+        :param CosimExecution execution: Execution to sample
+        :param variables: "instance.variable" names to sample, or a mapping from name to "instance.variable" name or
+            (slave_index, value_reference, variable_type)
+        :param on_samples: Function called with the time points, step numbers and values of the sampled steps
+        :param str source: "time_series" or "last_value". Default "time_series"
+        :param int chunk_steps: Number of steps per pull from a time series observer. Default 4096
+        :param CosimObserver observer: Optional observer of the kind given by source, already added to the execution.
+            A time series observer must buffer at least chunk_steps steps. Created and added if not given
+        :param int step_size: Optional step size of the execution in nanos. Steps read from a last value observer are
+            numbered from the current time of the execution when given, and from 1 otherwise
+        """
+        assert chunk_steps > 0, "Chunk steps must be a positive and non-zero integer"
+        if source not in SOURCES:
+            raise ValueError(f"Unsupported source '{source}'. Use 'time_series' or 'last_value'")
+        if not isinstance(variables, Mapping):
+            variables = {name: name for name in variables}
+        if not variables:
+            raise ValueError("At least one variable must be given")
+        self.execution = execution
+        self.source = source
+        self.chunk_steps = chunk_steps
+        self.names = list(variables)
+        self.targets: list[tuple[int, int, CosimVariableType]] = []
+        for name, target in variables.items():
+            if isinstance(target, str):
+                variable = execution.model_index().resolve(target)
+                target = (variable.slave_index, variable.value_reference, variable.type)
+            variable_type = CosimVariableType(target[2])
+            if variable_type not in _SOURCE_TYPES[source]:
+                raise ValueError(f"'{name}' is a {variable_type} variable, which can not be sampled from {source}")
+            self.targets.append((int(target[0]), int(target[1]), variable_type))
+        self.__on_samples = on_samples
+
+        if observer is None:
+            if source == "time_series":
+                observer = CosimObserver.create_time_series(buffer_size=2 * chunk_steps)
+            else:
+                observer = CosimObserver.create_last_value()
+            if not execution.add_observer(observer):
+                raise RuntimeError(f"Unable to add observer: {get_last_error_message()}")
+        self.observer = observer
+        self.__steps_since_pull = 0
+        if source == "time_series":
+            self.__batch = observer.time_series_batch(self.targets)
+            self.__cursor = self.__batch.cursor(chunk_size=chunk_steps)
+            if not self.__batch.start():
+                raise RuntimeError(f"Unable to start observing variables: {get_last_error_message()}")
+        else:
+            # One read set per slave and type, scattered into the row in column order
+            groups: dict[tuple[int, CosimVariableType], list[int]] = {}
+            for column, (slave_index, _, variable_type) in enumerate(self.targets):
+                groups.setdefault((slave_index, variable_type), []).append(column)
+            self.__read_sets = [
+                (observer.read_set(slave_index, [self.targets[c][1] for c in columns], variable_type), columns)
+                for (slave_index, variable_type), columns in groups.items()
+            ]
+            self.__row = np.zeros((1, len(self.targets)))
+            # Step number of the last step read, continuing the numbering of the steps taken before sampling
+            self.__step_number = 0 if step_size is None else execution.status().current_time // int(step_size)
+
+    def step(self, step_count: int = 1) -> bool:
+        """
+        Advance the execution for 1 or multiple steps, sampling the variables
+
+        :param int step_count: Number of steps to advance with default of 1
+        :return: bool Successful step execution
+        """
+        if self.source == "last_value":
+            for _ in range(step_count):
+                if not self.execution.step():
+                    return False
+                self.read()
+            return True
+
+        while step_count > 0:
+            steps = min(step_count, self.chunk_steps - self.__steps_since_pull)
+            if not self.execution.step(steps):
+                return False
+            step_count -= steps
+            self.__steps_since_pull += steps
+            if self.__steps_since_pull >= self.chunk_steps:
+                self.pull()
+        return True
+
+    def read(self):
+        """
+        Sample the current values from the last value observer as the next step
+        """
+        assert self.source == "last_value", "Values are only read from a last value observer"
+        for read_set, columns in self.__read_sets:
+            self.__row[0, columns] = read_set.read()
+        self.__step_number += 1
+        self.__on_samples(
+            np.array([self.execution.status().current_time], dtype=np.int64),
+            np.array([self.__step_number], dtype=np.int64),
+            self.__row,
+        )
+
+    def pull(self) -> int:
+        """
+        Sample all steps held by the time series observer that have not been sampled yet
+
+        :return: int Number of steps sampled
+        """
+        if self.source != "time_series":
+            return 0
+        pulled = 0
+        for time_points, step_numbers, values in self.__cursor.drain():
+            self.__on_samples(time_points, step_numbers, values)
+            pulled += len(step_numbers)
+        self.__steps_since_pull = 0
+        return pulled
+
+    @property
+    def dropped_steps(self) -> int:
+        """
+        Number of steps overwritten in the time series observer buffer before they were sampled
+        """
+        return self.__cursor.dropped_samples if self.source == "time_series" else 0
+
+    def stop(self):
+        """
+        Sample the remaining steps held by the time series observer and stop observing the variables
+        """
+        if self.source == "time_series":
+            self.pull()
+            self.__batch.stop()
@@ -0,0 +1,70 @@
+import numpy as np
+from pytest import raises
+
+from libcosimpy.CosimAggregator import WindowAggregator
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimSlave import CosimLocalSlave
+
+
+def create_execution(test_dir: str) -> CosimExecution:
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    slave_index = execution.add_local_slave(local_slave=local_slave)
+    execution.real_initial_value(slave_index=slave_index, variable_reference=0, value=1.5)
+    execution.integer_initial_value(slave_index=slave_index, variable_reference=0, value=-2)
+    return execution
+
+
+def test_window_statistics(test_dir: str):
+    aggregator = WindowAggregator(
+        create_execution(test_dir), {"x": "identity.realOut"}, window_size=100, percentiles=(50, 90), sketch_size=256
+    )
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=(1000, 1))
+    values[::7] = np.nan
+    time_points = np.arange(1000, dtype=np.int64) // 4
+    for start in range(0, 1000, 90):
+        aggregator.add(time_points[start : start + 90], values[start : start + 90])
+
+    aggregator.close()
+    aggregates = aggregator.emit()
+    assert aggregates.window_starts.tolist() == [0, 100, 200]
+    for row, window in enumerate(np.split(values[:, 0], [400, 800])):
+        window = window[~np.isnan(window)]
+        assert aggregates.column("x", "count")[row] == len(window)
+        assert np.isclose(aggregates.column("x", "min")[row], window.min())
+        assert np.isclose(aggregates.column("x", "max")[row], window.max())
+        assert np.isclose(aggregates.column("x", "mean")[row], window.mean())
+        assert np.isclose(aggregates.column("x", "variance")[row], window.var())
+        assert np.isclose(aggregates.column("x", "rms")[row], np.sqrt(np.mean(window**2)))
+        assert abs(aggregates.column("x", "p50")[row] - np.median(window)) < 0.5
+    # The last window holds fewer samples than the sketch, so its percentiles are exact
+    assert np.isclose(aggregates.column("x", "p90")[2], np.percentile(window, 90))
+    assert len(aggregator.emit()) == 0
+
+
+def test_window_aggregator(test_dir: str):
+    execution = create_execution(test_dir)
+    with raises(ValueError):
+        WindowAggregator(execution, ["identity.stringOut"], window_size=1e9)
+
+    aggregator = WindowAggregator(
+        execution, ["identity.realOut", "identity.integerOut"], window_size=1e9, chunk_steps=4
+    )
+    assert aggregator.step(25)
+    completed = aggregator.emit()
+    assert completed.window_starts.tolist() == [0, 1000000000]
+    assert completed.column("identity.realOut", "count").tolist() == [10, 10]
+    assert completed.column("identity.integerOut", "rms").tolist() == [2, 2]
+    aggregator.close()
+    remaining = aggregator.emit()
+    assert remaining.window_starts.tolist() == [2000000000]
+    assert remaining.column("identity.realOut", "mean").tolist() == [1.5]
+    assert remaining.column("identity.realOut", "count").tolist() == [6]
+    assert aggregator.dropped_steps == 0
+
+    execution = create_execution(test_dir)
+    with WindowAggregator(execution, ["identity.booleanOut"], window_size=1e9, source="last_value") as aggregator:
+        assert aggregator.step(15)
+    aggregates = aggregator.emit()
+    assert aggregates.column("identity.booleanOut", "count").tolist() == [9, 6]
@@ -0,0 +1,53 @@
+import asyncio
+
+from libcosimpy.CosimAsync import AsyncCosimExecution
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimObserver import CosimObserver
+from libcosimpy.CosimSlave import CosimLocalSlave
+
+
+def create_execution(test_dir: str, instance_name: str):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name=instance_name)
+    execution.add_local_slave(local_slave=local_slave)
+    return execution
+
+
+def test_async_step_and_simulate_until(test_dir: str):
+    async def main():
+        async with AsyncCosimExecution(create_execution(test_dir, "test_async")) as async_execution:
+            assert await async_execution.step(5)
+            assert async_execution.status().current_time == 500000000
+            assert await async_execution.simulate_until(1e9)
+            assert async_execution.status().current_time == 1000000000
+
+    asyncio.run(main())
+
+
+def test_async_concurrent_executions(test_dir: str):
+    async def main():
+        async_executions = [
+            AsyncCosimExecution(create_execution(test_dir, f"test_async_{index}")) for index in range(4)
+        ]
+        results = await asyncio.gather(*(async_execution.step(10) for async_execution in async_executions))
+        assert all(results)
+        for async_execution in async_executions:
+            assert async_execution.status().current_time == 1000000000
+            async_execution.close()
+
+    asyncio.run(main())
+
+
+def test_async_status_updates_and_run(test_dir: str):
+    async def main():
+        async with AsyncCosimExecution(create_execution(test_dir, "test_async_status")) as async_execution:
+            observer = CosimObserver.create_last_value()
+            assert await async_execution.run(async_execution.execution.add_observer, observer)
+            step = asyncio.create_task(async_execution.step(100))
+            snapshots = [status async for status in async_execution.status_updates(interval=0.01)]
+            assert await step
+            assert snapshots[-1].current_time == 10000000000
+            values = await async_execution.run(observer.last_real_values, 0, [0])
+            assert len(values) == 1
+
+    asyncio.run(main())
@@ -0,0 +1,11 @@
+from libcosimpy._bindings import _signatures, cosimc  # pyright: ignore[reportPrivateUsage]
+
+
+def test_bindings_are_cached():
+    assert cosimc() is cosimc()
+    assert cosimc().cosim_execution_step is cosimc().cosim_execution_step
+
+
+def test_all_bindings_resolve():
+    for funcname in _signatures():
+        assert getattr(cosimc(), funcname) is not None
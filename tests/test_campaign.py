@@ -0,0 +1,52 @@
+import gc
+import os
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from libcosimpy.CosimCampaign import Campaign
+from libcosimpy.CosimSweep import RUN_FAILED, RUN_OK, SweepRunner
+
+
+def _runner(test_dir: str, stop_time: float = 1e-3 * 1e9) -> SweepRunner:
+    return SweepRunner(
+        config_path=f"{test_dir}/data/msmi",
+        outputs=["TrueIdentity.realOut"],
+        stop_time=stop_time,
+        step_size=1e-4 * 1e9,
+        workers=2,
+        timeout=60,
+    )
+
+
+def test_campaign_resume(test_dir: str, tmp_path):
+    journal = tmp_path / "campaign.sqlite"
+    parameter_sets = [{"TrueIdentity.realIn": float(value)} for value in range(5)] + [{"TrueIdentity.missing": 1.0}]
+    with Campaign(journal, _runner(test_dir), chunk_size=2) as campaign:
+        campaign.plan(parameter_sets)
+        assert campaign.run() == {RUN_OK: 5, RUN_FAILED: 1}
+
+    # Simulate a driver killed while run 3 was in progress
+    with sqlite3.connect(journal) as db:
+        db.execute("UPDATE runs SET status = 'running', chunk = NULL, row = NULL WHERE run_id = 3")
+
+    with Campaign(journal, _runner(test_dir), chunk_size=2) as campaign:
+        campaign.plan(parameter_sets)
+        assert campaign.progress()["running"] == 1
+        assert campaign.run() == {RUN_OK: 5, RUN_FAILED: 1}
+        result = campaign.result()
+    assert result.status == [RUN_OK] * 5 + [RUN_FAILED]
+    assert result.column("TrueIdentity.realOut")[:5, -1].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    with closing(sqlite3.connect(journal)) as db:
+        assert db.execute("SELECT run_id, attempts FROM runs WHERE attempts > 1").fetchall() == [(3, 2)]
+
+    with pytest.raises(ValueError) as error:
+        Campaign(journal, _runner(test_dir, stop_time=2e-3 * 1e9))
+    assert "step_count" in str(error.value)
+    # The traceback in error keeps the failed campaign alive, but its journal is closed, so the write-ahead log is
+    # removed once the connections left unclosed above are collected
+    gc.collect()
+    assert not os.path.exists(f"{journal}-wal")
+    with pytest.raises(ValueError), Campaign(journal, _runner(test_dir)) as campaign:
+        campaign.plan(parameter_sets[:2])
@@ -0,0 +1,58 @@
+import numpy as np
+
+from libcosimpy.CosimEnsemble import EnsembleRunner, IntegerUniform, Normal, OutputStatistics, Uniform, sample
+from libcosimpy.CosimSweep import RUN_OK
+
+
+def test_sample():
+    distributions = {"a.x": Uniform(0.0, 1.0), "a.y": Normal(1.0, 2.0), "a.n": IntegerUniform(1, 3)}
+    for method in ["random", "lhs", "sobol"]:
+        samples = sample(distributions, 256, method=method, seed=1)
+        assert samples["a.x"].shape == (256,)
+        assert samples["a.n"].min() >= 1 and samples["a.n"].max() <= 3
+        assert np.array_equal(samples["a.y"], sample(distributions, 256, method=method, seed=1)["a.y"])
+    # Stratified methods place exactly one sample in each of 256 equal intervals
+    for method in ["lhs", "sobol"]:
+        strata = np.floor(sample(distributions, 256, method=method, seed=2)["a.x"] * 256)
+        assert np.array_equal(np.sort(strata), np.arange(256))
+
+
+def test_ensemble(test_dir: str):
+    runner = EnsembleRunner(
+        config_path=f"{test_dir}/data/msmi",
+        distributions={"TrueIdentity.realIn": Uniform(0.0, 10.0)},
+        outputs=["TrueIdentity.realOut"],
+        stop_time=1e-3 * 1e9,
+        step_size=1e-4 * 1e9,
+        thresholds={"TrueIdentity.realOut": [5.0]},
+        workers=2,
+        timeout=60,
+    )
+    result = runner.run(8, method="lhs", seed=3)
+    assert result.status == [RUN_OK] * 8
+    statistics = result.statistics["TrueIdentity.realOut"]
+    inputs = result.samples["TrueIdentity.realIn"]
+    assert statistics.count == 8
+    assert np.isclose(statistics.mean[-1], inputs.mean())
+    assert statistics.max[-1] == inputs.max()
+    assert statistics.exceedance[0, -1] == np.sum(inputs > 5.0)
+    assert np.isclose(statistics.percentile(50)[-1], np.median(inputs))
+
+
+def test_output_statistics_memory():
+    sample_count = 1000
+    statistics = OutputStatistics(sample_count, thresholds=[0.5], reservoir_size=50, seed=1)
+    rng = np.random.default_rng(1)
+    trajectories = rng.random((400, sample_count))
+    for trajectory in trajectories[:10]:
+        statistics.update(trajectory)
+    # The reservoir grows with the runs until it is full, and then stays the same size
+    assert statistics.memory_bytes < 25 * sample_count * 8
+    for trajectory in trajectories[10:100]:
+        statistics.update(trajectory)
+    memory_bytes = statistics.memory_bytes
+    for trajectory in trajectories[100:]:
+        statistics.update(trajectory)
+    assert statistics.count == 400
+    assert statistics.memory_bytes == memory_bytes <= (50 + 4 + 2) * sample_count * 8
+    assert np.allclose(statistics.percentile(50), 0.5, atol=0.25)
@@ -3,7 +3,7 @@ from platform import platform
 
 from pytest import raises
 from libcosimpy.CosimExecution import CosimExecution
-from libcosimpy.CosimEnums import CosimExecutionState
+from libcosimpy.CosimEnums import CosimExecutionState, CosimVariableCausality, CosimVariableType
 from libcosimpy.CosimObserver import CosimObserver
 from libcosimpy.CosimSlave import CosimLocalSlave
 
@@ -223,3 +223,35 @@ def test_slave_variables(test_dir: str):
         elif idx == 2:
             assert variable.name == "booleanIn".encode()
             break
+
+
+def test_record(test_dir: str):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="test_record")
+    slave_index = execution.add_local_slave(local_slave=local_slave)
+    recording = execution.record(
+        n_steps=10,
+        variables=[(slave_index, 0, CosimVariableType.REAL), (slave_index, 0, CosimVariableType.INTEGER)],
+        every=2,
+    )
+    assert list(recording.time_points) == [200000000, 400000000, 600000000, 800000000, 1000000000]
+    assert recording.values[CosimVariableType.REAL].shape == (5, 1)
+    assert recording.values[CosimVariableType.INTEGER].shape == (5, 1)
+    assert len(recording.column(slave_index, 0, CosimVariableType.REAL)) == 5
+    assert recording.steps_per_second > 0
+    assert execution.status().current_time == 1000000000
+
+
+def test_slave_variable_table(test_dir: str):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="test_table")
+    slave_index = execution.add_local_slave(local_slave=local_slave)
+    variables = execution.slave_variable_table(slave_index)
+    descriptions = execution.slave_variables(slave_index)
+    assert len(variables) == len(descriptions) == 8
+    assert list(variables.names) == [description.name.decode() for description in descriptions]
+    assert list(variables.references) == [description.reference for description in descriptions]
+    real_outputs = variables.filter(variable_type=CosimVariableType.REAL, causality=CosimVariableCausality.OUTPUT)
+    assert real_outputs.names == ("realOut",)
+    assert len(variables.filter(pattern="*In")) == 4
+    assert variables.info("integerOut").type == CosimVariableType.INTEGER
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimInputReplay import InputReplay
+from libcosimpy.CosimObserver import CosimObserver
+from libcosimpy.CosimSlave import CosimLocalSlave
+
+
+def test_input_replay_csv(test_dir: str, tmp_path):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    slave_index = execution.add_local_slave(local_slave=local_slave)
+    observer = CosimObserver.create_last_value()
+    execution.add_observer(observer=observer)
+
+    path = tmp_path / "inputs.csv"
+    path.write_text("time,identity.realIn,identity.integerIn\n0.0,1.5,1\n0.15,2.5,2\n0.3,3.5,3\n")
+    with InputReplay(execution=execution, path=str(path), step_size=0.1e9, chunk_size=2) as replay:
+        assert replay.step(2)
+        assert observer.last_real_values(slave_index=slave_index, variable_references=[0]) == [1.5]
+        assert replay.step()
+        assert observer.last_real_values(slave_index=slave_index, variable_references=[0]) == [2.5]
+        assert observer.last_integer_values(slave_index=slave_index, variable_references=[0]) == [2]
+        assert replay.simulate_until(target_time=1e9)
+        assert observer.last_real_values(slave_index=slave_index, variable_references=[0]) == [3.5]
+
+
+def test_input_replay_npy_rows(test_dir: str, tmp_path):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    slave_index = execution.add_local_slave(local_slave=local_slave)
+    observer = CosimObserver.create_last_value()
+    execution.add_observer(observer=observer)
+
+    data = np.zeros(10, dtype=[("wave", np.float64)])
+    data["wave"] = np.arange(10) * 0.5
+    np.save(tmp_path / "inputs.npy", data)
+    with InputReplay(
+        execution=execution,
+        path=str(tmp_path / "inputs.npy"),
+        step_size=0.1e9,
+        columns={"wave": "identity.realIn"},
+        time_column=None,
+        chunk_size=4,
+    ) as replay:
+        assert replay.step(7)
+        assert observer.last_real_values(slave_index=slave_index, variable_references=[0]) == [3.0]
+
+
+def test_input_replay_closed(test_dir: str, tmp_path):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    execution.add_local_slave(local_slave=local_slave)
+
+    data = np.zeros(10, dtype=[("wave", np.float64)])
+    np.save(tmp_path / "inputs.npy", data)
+    replay = InputReplay(
+        execution=execution,
+        path=str(tmp_path / "inputs.npy"),
+        step_size=0.1e9,
+        columns={"wave": "identity.realIn"},
+        time_column=None,
+        chunk_size=2,
+    )
+    assert replay.step()
+    replay.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        replay.step(5)
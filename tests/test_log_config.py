@@ -0,0 +1,48 @@
+from pytest import raises, warns
+
+from libcosimpy.CosimEnums import CosimVariableType
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimLogConfig import FIELD_BYTES, ROW_OVERHEAD_BYTES, LogConfig
+from libcosimpy.CosimLogReader import LogReader, log_files
+from libcosimpy.CosimSlave import CosimLocalSlave
+
+
+def test_log_config(test_dir: str, tmp_path):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    for instance_name in ("slave", "slave2"):
+        local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name=instance_name)
+        execution.add_local_slave(local_slave=local_slave)
+
+    config = LogConfig.from_execution(execution, step_size=0.1e9)
+    config.add("slave", ["real*", "integerOut"], decimation_factor=5).add("slave2")
+    with raises(ValueError):
+        config.add("slave", ["missing*"])
+    with raises(ValueError):
+        config.add("missing")
+    xml = config.to_xml()
+    assert '<simulator name="slave" decimationFactor="5">' in xml
+    assert '<variable name="realIn"/>' in xml
+    assert xml.count("<variable") == 3 + 8
+
+    estimate = config.estimate(duration=10e9)
+    slave, slave2 = estimate.simulators
+    assert slave.row_bytes == ROW_OVERHEAD_BYTES + 2 * FIELD_BYTES[CosimVariableType.REAL] + 12
+    assert slave.rows_per_second == 2
+    assert slave2.rows_per_second == 10
+    assert estimate.bytes_per_second == slave.row_bytes * 2 + slave2.row_bytes * 10
+    assert estimate.bytes_per_run == slave.row_bytes * 21 + slave2.row_bytes * 101
+    assert config.estimate().bytes_per_run is None
+
+    with warns(UserWarning, match="over the budget"):
+        observer = config.create_observer(str(tmp_path), duration=2e9, budget_bytes=100)
+    assert execution.add_observer(observer=observer)
+    assert execution.step(step_count=20)
+    # The file observer writes the last rows when it is destroyed
+    del execution, observer
+
+    paths = log_files(tmp_path)
+    assert list(paths) == ["slave", "slave2"]
+    columns = LogReader(paths["slave"]).read()
+    assert list(columns) == ["Time", "StepCount", "realIn", "realOut", "integerOut"]
+    assert columns["StepCount"].tolist() == [0, 5, 10, 15, 20]
+    assert len(LogReader(paths["slave2"]).read()["StepCount"]) == 21
@@ -0,0 +1,51 @@
+import numpy as np
+from pytest import raises
+
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimLogReader import LogReader, log_files
+from libcosimpy.CosimObserver import CosimObserver
+from libcosimpy.CosimSlave import CosimLocalSlave
+
+
+def write_log(test_dir: str, log_dir: str, step_count: int) -> CosimExecution:
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    slave_index = execution.add_local_slave(local_slave=local_slave)
+    execution.real_initial_value(slave_index=slave_index, variable_reference=0, value=1.5)
+    execution.integer_initial_value(slave_index=slave_index, variable_reference=0, value=3)
+    observer = CosimObserver.create_to_dir(log_dir)
+    assert execution.add_observer(observer=observer)
+    assert execution.step(step_count=step_count)
+    return execution
+
+
+def test_log_reader(test_dir: str, tmp_path):
+    execution = write_log(test_dir, str(tmp_path), 50)
+    # The file observer writes the last rows when it is destroyed
+    del execution
+
+    paths = log_files(tmp_path)
+    assert list(paths) == ["identity"]
+    reader = LogReader(paths["identity"], chunk_size=256)
+    assert reader.instance_name == "identity"
+    assert reader.column_types["integerOut"] == np.dtype(np.int32)
+    assert reader.column_types["booleanOut"] == np.dtype(np.bool_)
+
+    columns = reader.read()
+    assert columns["StepCount"].tolist() == list(range(51))
+    assert np.allclose(columns["Time"], np.arange(51) * 0.1)
+    assert columns["realOut"].tolist() == [1.5] * 51
+    assert columns["integerOut"].tolist() == [3] * 51
+    assert columns["stringOut"].tolist() == [""] * 51
+
+    window = reader.read(["realOut"], start_time=2.0, stop_time=3.05)
+    assert list(window) == ["Time", "StepCount", "realOut"]
+    assert window["StepCount"].tolist() == list(range(20, 31))
+    assert sum(len(chunk["Time"]) for chunk in reader.chunks(["realOut"])) == 51
+    with raises(ValueError):
+        reader.read(["missing"])
+
+    indexed = LogReader(paths["identity"], index=True, chunk_size=256)
+    assert (tmp_path / f"{paths['identity'].name}.index.npz").exists()
+    assert indexed.read(["integerOut"], start_time=4.0)["StepCount"].tolist() == list(range(40, 51))
+    assert LogReader(paths["identity"], index=True, chunk_size=256).read(start_time=4.95)["StepCount"].tolist() == [50]
@@ -81,6 +81,45 @@ def test_from_override_set(test_dir: str):
     ]
 
 
+def test_write_plan(test_dir: str):
+    execution = CosimExecution.from_step_size(0.1 * 1.0e9)
+    for instance_name in ["first", "second"]:
+        local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name=instance_name)
+        execution.add_local_slave(local_slave=local_slave)
+    manipulator = CosimManipulator.create_override()
+    assert execution.add_manipulator(manipulator=manipulator)
+    observer = CosimObserver.create_last_value()
+    execution.add_observer(observer=observer)
+    plan = manipulator.write_plan(
+        [
+            (0, 0, CosimVariableType.REAL),
+            (1, 0, CosimVariableType.REAL),
+            (0, 0, CosimVariableType.INTEGER),
+            (0, 0, CosimVariableType.BOOLEAN),
+            (1, 0, CosimVariableType.STRING),
+        ]
+    )
+    assert len(plan) == 5
+    assert plan.call_count == 5
+    assert plan.apply([1.5, 2.5, 3, True, "Hello"])
+    execution.step()
+    assert observer.last_real_values(slave_index=0, variable_references=[0]) == [1.5]
+    assert observer.last_real_values(slave_index=1, variable_references=[0]) == [2.5]
+    assert observer.last_integer_values(slave_index=0, variable_references=[0]) == [3]
+    assert observer.last_boolean_values(slave_index=0, variable_references=[0]) == [True]
+    assert observer.last_string_values(slave_index=1, variable_references=[0]) == [b"Hello"]
+
+    assert plan.apply({(1, 0, CosimVariableType.REAL): 4.5})
+    execution.step()
+    assert observer.last_real_values(slave_index=0, variable_references=[0]) == [1.5]
+    assert observer.last_real_values(slave_index=1, variable_references=[0]) == [4.5]
+
+    assert plan.reset()
+    execution.step()
+    assert observer.last_real_values(slave_index=1, variable_references=[0]) == [0.0]
+    assert observer.last_integer_values(slave_index=0, variable_references=[0]) == [0]
+
+
 def test_from_override_set_multiple(test_dir: str):
     if platform() == "Windows":
         execution = CosimExecution.from_ssp_file(ssp_path=f"{test_dir}/data/dp-ship")
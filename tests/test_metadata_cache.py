@@ -0,0 +1,38 @@
+import os
+import shutil
+
+from libcosimpy.CosimEnums import CosimVariableType
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimMetadataCache import MetadataCache
+
+
+def test_metadata_cache_osp_config(test_dir: str, tmp_path, monkeypatch):
+    osp_path = f"{test_dir}/data/msmi/OspSystemStructure.xml"
+    cache = MetadataCache(cache_dir=tmp_path)
+    model_index = cache.osp_config_index(osp_path)
+    assert sorted(model_index.instance_names) == ["CraneController", "KnuckleBoomCrane", "OneIdentity", "TrueIdentity"]
+    assert model_index.variable("TrueIdentity", "realOut").type == CosimVariableType.REAL
+
+    # A hit is answered from disk without creating an execution
+    def fail(*_):
+        raise AssertionError("Execution created on cache hit")
+
+    monkeypatch.setattr(CosimExecution, "from_osp_config_file", fail)
+    cached_index = MetadataCache(cache_dir=tmp_path).osp_config_index(f"{test_dir}/data/msmi")
+    assert cached_index.slave_indices == model_index.slave_indices
+    assert cached_index.variables("TrueIdentity").names == model_index.variables("TrueIdentity").names
+    assert cached_index.resolve("OneIdentity.integerIn").type == CosimVariableType.INTEGER
+
+
+def test_metadata_cache_key_follows_fmu(test_dir: str, tmp_path):
+    fmu_path = tmp_path / "identity.fmu"
+    shutil.copyfile(f"{test_dir}/data/fmi1/identity.fmu", fmu_path)
+    config_path = tmp_path / "OspSystemStructure.xml"
+    config_path.write_text(
+        '<OspSystemStructure><Simulators><Simulator name="a" source="identity.fmu"/></Simulators></OspSystemStructure>'
+    )
+    cache = MetadataCache(cache_dir=tmp_path / "cache")
+    key = cache.cache_key(config_path)
+    assert cache.cache_key(config_path) == key
+    os.utime(fmu_path, ns=(0, 0))
+    assert cache.cache_key(config_path) != key
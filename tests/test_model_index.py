@@ -0,0 +1,36 @@
+from pytest import raises
+
+from libcosimpy.CosimEnums import CosimVariableCausality, CosimVariableType
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimSlave import CosimLocalSlave
+
+
+def test_model_index_lookup(test_dir: str):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    identity = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    slave_index = execution.add_local_slave(local_slave=identity)
+    model_index = execution.model_index()
+    assert model_index.instance_names == ["identity"]
+    assert model_index.slave_index("identity") == slave_index
+    assert execution.slave_index_from_instance_name("identity") == slave_index
+    assert execution.slave_index_from_instance_name("missing") is None
+    real_out = model_index.variable("identity", "realOut")
+    assert real_out.slave_index == slave_index
+    assert real_out.value_reference == 0
+    assert real_out.type == CosimVariableType.REAL
+    assert real_out.causality == CosimVariableCausality.OUTPUT
+    assert model_index.resolve("identity.integerIn").type == CosimVariableType.INTEGER
+    with raises(KeyError):
+        model_index.variable("identity", "missing")
+
+
+def test_model_index_invalidated_by_add_local_slave(test_dir: str):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    first = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="first")
+    execution.add_local_slave(local_slave=first)
+    model_index = execution.model_index()
+    assert execution.model_index() is model_index
+    second = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="second")
+    second_index = execution.add_local_slave(local_slave=second)
+    assert execution.model_index() is not model_index
+    assert execution.slave_index_from_instance_name("second") == second_index
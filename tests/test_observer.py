@@ -5,6 +5,8 @@ from libcosimpy.CosimEnums import CosimVariableType
 from os import listdir
 from platform import platform
 
+import numpy as np
+
 
 def test_from_last_value_observer_read(test_dir: str):
     if platform() == "Windows":
@@ -128,3 +130,126 @@ def test_from_time_series(test_dir: str):
         from_step=from_step2,
     )
     assert len(integer_time_points2) == 3
+
+
+def test_last_value_read_set(test_dir: str):
+    execution = CosimExecution.from_step_size(0.1 * 1.0e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="test_read_set")
+    slave_index = execution.add_local_slave(local_slave=local_slave)
+    observer = CosimObserver.create_last_value()
+    assert execution.add_observer(observer=observer)
+    execution.step()
+    read_set = observer.read_set(slave_index, variable_references=[0], variable_type=CosimVariableType.REAL)
+    assert len(read_set) == 1
+    values = read_set.read()
+    assert values.dtype == np.float64
+    assert list(values) == observer.last_real_values(slave_index=slave_index, variable_references=[0])
+    assert np.shares_memory(values, read_set.read())
+    out = np.empty(1, dtype=np.float64)
+    assert read_set.read(out=out) is out
+    assert out[0] == values[0]
+
+
+def test_time_series_sample_arrays(test_dir: str):
+    execution = CosimExecution.from_step_size(0.1 * 1.0e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="test_sample_arrays")
+    execution.add_local_slave(local_slave=local_slave)
+    observer = CosimObserver.create_time_series()
+    execution.add_observer(observer=observer)
+    assert observer.start_time_series(0, value_reference=0, variable_type=CosimVariableType.REAL)
+    assert observer.start_time_series(0, value_reference=0, variable_type=CosimVariableType.INTEGER)
+    execution.step(step_count=5)
+    time_points, step_numbers, samples = observer.time_series_real_sample_arrays(
+        0, value_reference=0, from_step=1, sample_count=10
+    )
+    assert samples.dtype == np.float64
+    assert list(step_numbers) == [1, 2, 3, 4, 5]
+    assert list(time_points) == [100000000, 200000000, 300000000, 400000000, 500000000]
+    out = (np.empty(10, dtype=np.int64), np.empty(10, dtype=np.int64), np.empty(10, dtype=np.intc))
+    integer_time_points, integer_step_numbers, integer_samples = observer.time_series_integer_sample_arrays(
+        0, value_reference=0, from_step=1, sample_count=10, out=out
+    )
+    assert len(integer_samples) == 5
+    assert np.shares_memory(integer_time_points, out[0])
+    assert list(integer_step_numbers) == [1, 2, 3, 4, 5]
+
+
+def test_time_series_batch(test_dir: str):
+    execution = CosimExecution.from_step_size(0.1 * 1.0e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="test_batch")
+    execution.add_local_slave(local_slave=local_slave)
+    observer = CosimObserver.create_time_series()
+    execution.add_observer(observer=observer)
+    batch = observer.time_series_batch([(0, 0, CosimVariableType.REAL), (0, 0, CosimVariableType.INTEGER)])
+    assert batch.start()
+    execution.step(step_count=5)
+    time_points, step_numbers, values = batch.read(from_step=1, sample_count=10)
+    assert values.shape == (5, 2)
+    assert list(step_numbers) == [1, 2, 3, 4, 5]
+    assert list(time_points) == [100000000, 200000000, 300000000, 400000000, 500000000]
+    _, _, real_samples = observer.time_series_real_samples(0, value_reference=0, from_step=1, sample_count=10)
+    assert list(values[:, 0]) == real_samples
+    assert batch.stop()
+
+
+def test_time_series_cursor(test_dir: str):
+    execution = CosimExecution.from_step_size(0.1 * 1.0e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="test_cursor")
+    execution.add_local_slave(local_slave=local_slave)
+    observer = CosimObserver.create_time_series(buffer_size=3)
+    execution.add_observer(observer=observer)
+    assert observer.start_time_series(0, value_reference=0, variable_type=CosimVariableType.REAL)
+    cursor = observer.time_series_cursor(0, value_reference=0, variable_type=CosimVariableType.REAL, chunk_size=2)
+    execution.step(step_count=2)
+    delivered = [int(step) for _, step_numbers, _ in cursor.drain() for step in step_numbers]
+    # The observer also records the value at the step where observing started
+    assert delivered == [0, 1, 2]
+    assert cursor.dropped_samples == 0
+    assert len(cursor.pull()[1]) == 0
+    execution.step(step_count=5)
+    delivered = [int(step) for _, step_numbers, _ in cursor.drain() for step in step_numbers]
+    assert delivered == [5, 6, 7]
+    assert cursor.dropped_samples == 2
+    assert cursor.next_step == 8
+
+
+def test_time_series_batch_cursor(test_dir: str):
+    execution = CosimExecution.from_step_size(0.1 * 1.0e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="test_batch_cursor")
+    execution.add_local_slave(local_slave=local_slave)
+    observer = CosimObserver.create_time_series(buffer_size=3)
+    execution.add_observer(observer=observer)
+    batch = observer.time_series_batch([(0, 0, CosimVariableType.REAL), (0, 0, CosimVariableType.INTEGER)])
+    assert batch.start()
+    cursor = batch.cursor(chunk_size=2)
+    assert not list(cursor.drain())
+    execution.step(step_count=2)
+    delivered = [int(step) for _, step_numbers, _ in cursor.drain() for step in step_numbers]
+    assert delivered == [0, 1, 2]
+    execution.step(step_count=5)
+    delivered = [int(step) for _, step_numbers, _ in cursor.drain() for step in step_numbers]
+    assert delivered == [5, 6, 7]
+    assert cursor.dropped_samples == 2
+    assert cursor.next_step == 8
+
+
+def test_time_series_cursor_late_start(test_dir: str):
+    execution = CosimExecution.from_step_size(0.1 * 1.0e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="test_late_start")
+    execution.add_local_slave(local_slave=local_slave)
+    observer = CosimObserver.create_time_series()
+    execution.add_observer(observer=observer)
+    assert observer.start_time_series(0, value_reference=0, variable_type=CosimVariableType.REAL)
+    execution.step(step_count=10)
+    # The second series starts more than a chunk after the first one
+    batch = observer.time_series_batch([(0, 0, CosimVariableType.INTEGER)])
+    assert batch.start()
+    cursor = observer.time_series_cursor(0, value_reference=0, variable_type=CosimVariableType.INTEGER, chunk_size=2)
+    batch_cursor = batch.cursor(chunk_size=2)
+    execution.step(step_count=3)
+    delivered = [int(step) for _, step_numbers, _ in cursor.drain() for step in step_numbers]
+    assert delivered == [11, 12, 13]
+    assert cursor.dropped_samples == 0
+    delivered = [int(step) for _, step_numbers, _ in batch_cursor.drain() for step in step_numbers]
+    assert delivered == [11, 12, 13]
+    assert batch_cursor.dropped_samples == 0
@@ -0,0 +1,48 @@
+from pytest import importorskip
+
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimParquetSink import ParquetSink
+from libcosimpy.CosimSlave import CosimLocalSlave
+
+
+def _execution(test_dir: str) -> CosimExecution:
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    slave_index = execution.add_local_slave(local_slave=local_slave)
+    execution.real_initial_value(slave_index=slave_index, variable_reference=0, value=1.5)
+    execution.integer_initial_value(slave_index=slave_index, variable_reference=0, value=3)
+    return execution
+
+
+def test_parquet_sink(test_dir: str, tmp_path):
+    parquet = importorskip("pyarrow.parquet")
+    execution = _execution(test_dir)
+    path = tmp_path / "results.parquet"
+    with ParquetSink(execution, path, ["identity.realOut", "identity.integerOut"], chunk_steps=4) as sink:
+        assert sink.step(10)
+    assert sink.dropped_steps == 0
+
+    table = parquet.read_table(path)
+    assert table.column_names == ["time", "step", "identity.realOut", "identity.integerOut"]
+    assert table.num_rows == sink.rows_written >= 10
+    assert table.column("identity.realOut").to_pylist()[-1] == 1.5
+    assert table.column("identity.integerOut").to_pylist()[-1] == 3
+    steps = table.column("step").to_pylist()
+    assert steps == list(range(steps[0], steps[0] + len(steps)))
+    assert parquet.ParquetFile(path).metadata.num_row_groups >= 3
+
+
+def test_feather_sink(test_dir: str, tmp_path):
+    ipc = importorskip("pyarrow.ipc")
+    execution = _execution(test_dir)
+    path = tmp_path / "results.feather"
+    sink = ParquetSink(execution, path, {"x": "identity.realOut"}, chunk_steps=4)
+    execution.step(3)
+    sink.pull()
+    assert sink.step(5)
+    sink.close()
+
+    table = ipc.open_file(path).read_all()
+    assert table.column_names == ["time", "step", "x"]
+    assert table.num_rows == sink.rows_written
+    assert table.column("time").to_pylist()[-1] == 0.8e9
@@ -0,0 +1,63 @@
+import numpy as np
+
+from libcosimpy import CosimResultCache
+from libcosimpy.CosimMetadataCache import dependencies
+from libcosimpy.CosimResultCache import ResultCache
+from libcosimpy.CosimSweep import RUN_OK, SweepRunner
+
+
+def test_result_cache_eviction(tmp_path):
+    cache = ResultCache(cache_dir=tmp_path, max_entries=2)
+    assert cache.get("a") is None
+    cache.put("a", [0, 10], [[1.0], [2.0]])
+    cache.put("b", [0, 10], [[3.0], [4.0]])
+    time_points, values = cache.get("a")
+    assert time_points.tolist() == [0, 10]
+    assert values[:, 0].tolist() == [1.0, 2.0]
+
+    # "a" was used more recently than "b", so "b" is evicted
+    cache.put("c", [0, 10], [[5.0], [6.0]])
+    assert "a" in cache and "b" not in cache and "c" in cache
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_result_cache_key(test_dir: str, tmp_path):
+    cache = ResultCache(cache_dir=tmp_path)
+    config_path = f"{test_dir}/data/msmi"
+    key = cache.run_key(config_path, ["TrueIdentity.realOut"], 10, 1e5, 1, {"TrueIdentity.realIn": 1.0})
+    assert key == cache.run_key(
+        f"{config_path}/OspSystemStructure.xml", ["TrueIdentity.realOut"], 10, 1e5, 1, {"TrueIdentity.realIn": 1.0}
+    )
+    assert key == cache.run_key(
+        config_path, ["TrueIdentity.realOut"], 10, 1e5, 1, {"TrueIdentity.realIn": np.float64(1)}
+    )
+    assert key != cache.run_key(config_path, ["TrueIdentity.realOut"], 10, 1e5, 1, {"TrueIdentity.realIn": 2.0})
+    assert key != cache.run_key(config_path, ["TrueIdentity.realOut"], 20, 1e5, 1, {"TrueIdentity.realIn": 1.0})
+    sweep_key = cache.sweep_key(config_path, ["TrueIdentity.realOut"], 10, 1e5, 1)
+    assert key == cache.parameter_key(sweep_key, {"TrueIdentity.realIn": 1.0})
+
+
+def test_sweep_result_cache(test_dir: str, tmp_path, monkeypatch):
+    # The configuration is parsed once per sweep rather than once per run
+    parsed = []
+    monkeypatch.setattr(CosimResultCache, "dependencies", lambda path: parsed.append(path) or dependencies(path))
+    cache = ResultCache(cache_dir=tmp_path)
+    runner = SweepRunner(
+        config_path=f"{test_dir}/data/msmi",
+        outputs=["TrueIdentity.realOut"],
+        stop_time=1e-3 * 1e9,
+        step_size=1e-4 * 1e9,
+        workers=2,
+        timeout=60,
+        cache=cache,
+    )
+    first = runner.run([{"TrueIdentity.realIn": 1.5}, {"TrueIdentity.realIn": 2.5}])
+    assert first.status == [RUN_OK, RUN_OK]
+    assert (cache.hits, len(cache)) == (0, 2)
+    assert len(parsed) == 1
+
+    second = runner.run([{"TrueIdentity.realIn": 2.5}, {"TrueIdentity.realIn": 3.5}])
+    assert second.status == [RUN_OK, RUN_OK]
+    assert (cache.hits, len(cache)) == (1, 3)
+    assert np.array_equal(second.values[0], first.values[1])
+    assert second.column("TrueIdentity.realOut")[1, -1] == 3.5
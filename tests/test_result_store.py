@@ -0,0 +1,98 @@
+import numpy as np
+from pytest import raises
+
+from libcosimpy.CosimEnums import CosimVariableType
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimManipulator import CosimManipulator
+from libcosimpy.CosimResultStore import ResultStore, ResultStoreReader, StoreRecorder
+from libcosimpy.CosimSlave import CosimLocalSlave
+
+
+def test_result_store(tmp_path):
+    path = tmp_path / "results.bin"
+    store = ResultStore(path, {"x": CosimVariableType.REAL, "n": CosimVariableType.INTEGER}, growth_rows=4)
+    reader = ResultStoreReader(path)
+    assert len(reader) == 0
+
+    store.append([1, 2, 3], [100, 200, 300], [[0.5, 1], [1.5, 2], [2.5, 3]])
+    assert reader.refresh() == 3
+    store.append(np.arange(4, 10), np.arange(4, 10) * 100, {"x": np.arange(4, 10) * 0.5})
+    assert len(reader) == 3
+    assert reader.refresh() == 9
+    assert reader.column("n").tolist() == [1, 2, 3, 0, 0, 0, 0, 0, 0]
+    assert reader.row_of_step(5) == 4
+    assert reader.row_of_step(10) is None
+    assert reader.steps(3, 5)["x"].tolist() == [2.5, 2.0]
+    assert reader.between(250, 450)["step"].tolist() == [3, 4]
+
+    with raises(ValueError):
+        store.append([10, 11], [1000, 1100], [[1.0, 4], [1.5, np.nan]])
+    assert store.row_count == 9
+
+    store.close()
+    assert ResultStoreReader(path).refresh() == 9
+    with raises(ValueError):
+        ResultStore(path, {"time": CosimVariableType.REAL})
+
+
+def test_store_recorder(test_dir: str, tmp_path):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    slave_index = execution.add_local_slave(local_slave=local_slave)
+    execution.real_initial_value(slave_index=slave_index, variable_reference=0, value=1.5)
+
+    path = tmp_path / "series.bin"
+    with StoreRecorder(execution, path, ["identity.realOut", "identity.integerOut"], chunk_steps=4) as recorder:
+        reader = ResultStoreReader(path)
+        assert recorder.step(10)
+        assert reader.refresh() >= 8
+    assert reader.refresh() == recorder.store.row_count >= 10
+    assert reader.column("identity.realOut")[-1] == 1.5
+    assert recorder.dropped_steps == 0
+
+    path = tmp_path / "last_value.bin"
+    with StoreRecorder(
+        execution, path, {"x": "identity.realOut", "b": "identity.booleanOut"}, source="last_value", step_size=0.1e9
+    ) as recorder:
+        assert recorder.step(3)
+    reader = ResultStoreReader(path)
+    assert reader.step_numbers.tolist() == [11, 12, 13]
+    assert reader.column("x").tolist() == [1.5, 1.5, 1.5]
+    assert reader.time_points[-1] == 1.3e9
+
+
+def test_store_recorder_partial_steps(test_dir: str, tmp_path):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    execution.add_local_slave(
+        local_slave=CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="first")
+    )
+    second = execution.add_local_slave(
+        local_slave=CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="second")
+    )
+    execution.integer_initial_value(slave_index=second, variable_reference=0, value=7)
+    manipulator = CosimManipulator.create_override()
+    execution.add_manipulator(manipulator=manipulator)
+
+    path = tmp_path / "partial.bin"
+    recorder = StoreRecorder(execution, path, ["first.realOut", "second.integerOut"], chunk_steps=4)
+    observer = recorder.observer
+    assert recorder.step(2)
+    # Restarting a time series clears the samples held for it, so the integer variable misses the steps before
+    assert observer.stop_time_series(second, value_reference=0, variable_type=CosimVariableType.INTEGER)
+    assert observer.start_time_series(second, value_reference=0, variable_type=CosimVariableType.INTEGER)
+    assert recorder.step(2)
+    reader = ResultStoreReader(path)
+    assert reader.refresh() == 2
+    assert reader.step_numbers.tolist() == [3, 4]
+    assert recorder.incomplete_steps == 3
+
+    # Steps where the integer variable is not observed hold its last stored value
+    assert observer.stop_time_series(second, value_reference=0, variable_type=CosimVariableType.INTEGER)
+    manipulator.slave_integer_values(second, [0], [9])
+    assert recorder.step(2)
+    assert observer.start_time_series(second, value_reference=0, variable_type=CosimVariableType.INTEGER)
+    assert recorder.step(2)
+    recorder.close()
+    assert reader.refresh() == 6
+    assert reader.column("second.integerOut").tolist() == [7, 7, 7, 7, 9, 9]
+    assert recorder.incomplete_steps == 5
@@ -0,0 +1,84 @@
+from pytest import raises
+
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimManipulator import CosimManipulator
+from libcosimpy.CosimObserver import CosimObserver
+from libcosimpy.CosimScenario import ScenarioRunner, compile_scenario
+from libcosimpy.CosimSlave import CosimLocalSlave
+
+SCENARIO = {
+    "defaults": {"model": "identity", "variable": "realIn", "action": "override"},
+    "events": [
+        {"time": 0.3, "action": "reset"},
+        {"time": 0.1, "value": 1.5},
+        {"time": 0.2, "variable": "integerIn", "value": 4},
+    ],
+    "end": 1.0,
+}
+
+
+def create_execution(test_dir: str):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    execution.add_local_slave(local_slave=local_slave)
+    return execution
+
+
+def test_compile_scenario(test_dir: str, tmp_path):
+    execution = create_execution(test_dir)
+    scenario = compile_scenario(SCENARIO, execution)
+    assert len(scenario) == 3
+    assert scenario.events["time"].tolist() == [100000000, 200000000, 300000000]
+    assert scenario.end == 1000000000
+    assert scenario.to_dict()["events"][1] == {
+        "time": 0.2,
+        "model": "identity",
+        "variable": "integerIn",
+        "action": "override",
+        "value": 4,
+    }
+
+    # The normalised file can be loaded by libcosim
+    scenario.save(str(tmp_path / "scenario.json"))
+    manipulator = CosimManipulator.create_scenario_manager()
+    execution.add_manipulator(manipulator=manipulator)
+    assert execution.load_scenario(manipulator=manipulator, scenario_file=str(tmp_path / "scenario.json"))
+
+    with raises(ValueError, match="Event 0: model 'identity' has no variable named 'missing'"):
+        compile_scenario(
+            {"events": [{"time": 0, "model": "identity", "variable": "missing", "action": "reset"}]}, execution
+        )
+
+
+def test_scenario_runner(test_dir: str):
+    execution = create_execution(test_dir)
+    observer = CosimObserver.create_last_value()
+    execution.add_observer(observer=observer)
+    runner = ScenarioRunner(execution=execution, scenario=compile_scenario(SCENARIO, execution), step_size=0.1e9)
+    assert runner.step(3)
+    assert observer.last_real_values(slave_index=0, variable_references=[0]) == [1.5]
+    assert observer.last_integer_values(slave_index=0, variable_references=[0]) == [4]
+    assert runner.simulate_until(target_time=1.2e9)
+    assert runner.finished
+    assert observer.last_real_values(slave_index=0, variable_references=[0]) == [0.0]
+    assert observer.last_integer_values(slave_index=0, variable_references=[0]) == [0]
+
+
+def test_scenario_runner_bias(test_dir: str):
+    execution = create_execution(test_dir)
+    observer = CosimObserver.create_last_value()
+    execution.add_observer(observer=observer)
+    scenario = {
+        "defaults": {"model": "identity", "variable": "realIn", "action": "bias"},
+        "events": [
+            {"time": 0.1, "action": "override", "value": 1.5},
+            {"time": 0.2, "value": 1.0},
+            {"time": 0.4, "value": 2.0},
+        ],
+    }
+    runner = ScenarioRunner(execution=execution, scenario=compile_scenario(scenario, execution), step_size=0.1e9)
+    assert runner.step(4)
+    assert observer.last_real_values(slave_index=0, variable_references=[0]) == [2.5]
+    # A second bias replaces the first one instead of adding to the biased value
+    assert runner.step(2)
+    assert observer.last_real_values(slave_index=0, variable_references=[0]) == [3.5]
@@ -0,0 +1,49 @@
+import numpy as np
+
+from libcosimpy.CosimEnums import CosimVariableType
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimObserver import CosimObserver
+from libcosimpy.CosimSignalPlayer import SignalInterpolation, SignalPlayer
+from libcosimpy.CosimSlave import CosimLocalSlave
+
+
+def test_signal_player(test_dir: str):
+    execution = CosimExecution.from_step_size(step_size=0.1e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    slave_index = execution.add_local_slave(local_slave=local_slave)
+    observer = CosimObserver.create_last_value()
+    execution.add_observer(observer=observer)
+
+    player = SignalPlayer(execution=execution, step_size=0.1e9)
+    player.add_signal(
+        slave_index, 0, CosimVariableType.REAL, [0, 1e9], [0.0, 10.0], interpolation=SignalInterpolation.LINEAR
+    )
+    player.add_signal(slave_index, 0, CosimVariableType.INTEGER, [0, 0.25e9], [1, 2])
+    player.compile(stop_time=1e9)
+    assert player.table.shape == (11, 2)
+
+    # Values are set from the row of the time at which each step starts
+    assert player.step(3)
+    assert observer.last_real_values(slave_index=slave_index, variable_references=[0]) == [2.0]
+    assert observer.last_integer_values(slave_index=slave_index, variable_references=[0]) == [1]
+    assert player.simulate_until(target_time=1.5e9)
+    assert observer.last_real_values(slave_index=slave_index, variable_references=[0]) == [10.0]
+    assert observer.last_integer_values(slave_index=slave_index, variable_references=[0]) == [2]
+
+
+def test_signal_player_spline(test_dir: str):
+    execution = CosimExecution.from_step_size(step_size=0.01e9)
+    local_slave = CosimLocalSlave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    slave_index = execution.add_local_slave(local_slave=local_slave)
+
+    # Irregular samples of a sine, whose second derivative is zero at both ends like a natural spline
+    rng = np.random.default_rng(1)
+    seconds = np.concatenate([[0.0], np.sort(rng.uniform(0.0, np.pi, 300)), [np.pi]])
+    player = SignalPlayer(execution=execution, step_size=0.01e9)
+    player.add_signal(
+        slave_index, 0, CosimVariableType.REAL, seconds * 1e9, np.sin(seconds), interpolation=SignalInterpolation.SPLINE
+    )
+    player.compile(stop_time=np.pi * 1e9)
+    step_seconds = np.arange(len(player.table)) * 0.01
+    # Linear interpolation of the same samples is off by up to about 4e-4
+    assert np.max(np.abs(player.table[:, 0] - np.sin(step_seconds))) < 1e-6
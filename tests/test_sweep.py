@@ -0,0 +1,27 @@
+from libcosimpy.CosimSweep import RUN_FAILED, RUN_OK, SweepRunner
+
+
+def test_sweep(test_dir: str):
+    runner = SweepRunner(
+        config_path=f"{test_dir}/data/msmi",
+        outputs=["TrueIdentity.realOut", "TrueIdentity.integerOut"],
+        stop_time=1e-3 * 1e9,
+        step_size=1e-4 * 1e9,
+        every=2,
+        workers=2,
+        timeout=60,
+    )
+    result = runner.run(
+        [
+            {"TrueIdentity.realIn": 1.5},
+            {"TrueIdentity.realIn": 2.5, "TrueIdentity.integerIn": 3},
+            {"TrueIdentity.missing": 1.0},
+        ]
+    )
+    assert result.status == [RUN_OK, RUN_OK, RUN_FAILED]
+    assert "missing" in result.errors[2]
+    assert result.values.shape == (3, 5, 2)
+    assert result.column("TrueIdentity.realOut")[0, -1] == 1.5
+    assert result.column("TrueIdentity.realOut")[1, -1] == 2.5
+    assert result.column("TrueIdentity.integerOut")[1, -1] == 3
+    assert result.parameter("TrueIdentity.realIn").tolist() == [1.5, 2.5, None]
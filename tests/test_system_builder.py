@@ -0,0 +1,33 @@
+from pytest import raises
+
+from libcosimpy.CosimExecution import CosimExecution
+from libcosimpy.CosimSystemBuilder import SystemBuilder
+
+
+def test_system_builder(test_dir: str):
+    execution = CosimExecution.from_step_size(step_size=1e8)
+    builder = SystemBuilder(execution, workers=4)
+    names = [f"identity{i}" for i in range(6)]
+    for name in names:
+        builder.add_slave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name=name)
+    report = builder.build()
+
+    assert list(report.slave_indices) == names
+    assert [timing.instance_name for timing in report.timings] == names
+    assert all(timing.seconds > 0 for timing in report.timings)
+    assert execution.num_slaves() == 6
+    for name, slave_index in report.slave_indices.items():
+        assert execution.slave_index_from_instance_name(name) == slave_index
+
+
+def test_system_builder_failure(test_dir: str):
+    execution = CosimExecution.from_step_size(step_size=1e8)
+    builder = SystemBuilder(execution)
+    builder.add_slave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    builder.add_slave(fmu_path=f"{test_dir}/data/missing.fmu", instance_name="missing")
+    with raises(ValueError):
+        builder.add_slave(fmu_path=f"{test_dir}/data/fmi1/identity.fmu", instance_name="identity")
+    with raises(RuntimeError) as error:
+        builder.build()
+    assert "missing" in str(error.value)
+    assert execution.num_slaves() == 0